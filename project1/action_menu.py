@@ -0,0 +1,193 @@
+"""CSC111 Project 1: Text Adventure Game - Action Menus
+
+Instructions (READ THIS FIRST!)
+===============================
+
+This Python module contains the classes that keep track of the actions available at
+each location in Project 1, to be imported and used by the `adventure` and `game_world`
+modules.
+
+An ActionTable holds everything about a location's actions that never changes, and is
+built once per world. An ActionMenu holds one game's current menu for one location. It
+is updated only when an item is picked up or dropped there or the inventory changes,
+so showing an unchanged menu again only costs as much as the menu is long.
+
+Copyright and Usage Information
+===============================
+
+This file is provided solely for the personal and private use of students
+taking CSC111 at the University of Toronto St. George campus. All forms of
+distribution of this code, whether as given or with any changes, are
+expressly prohibited. For more information on copyright for CSC111 materials,
+please consult our Course Syllabus.
+
+This file is Copyright (c) 2026 CSC111 Teaching Team
+"""
+from __future__ import annotations
+import bisect
+from typing import Iterable, Optional
+
+from command_parser import MOVE_VERBS, PICK_UP, DROP, DEPOSIT, parse_command
+from game_entities import Location
+
+
+class ActionTable:
+    """The go, pick up, drop and deposit commands listed in a location's available commands.
+
+    Instance Attributes:
+        - commands: the listed action commands, in the order they appear in the location's available commands
+        - go_positions: the positions in commands of every exit (go or go to command)
+        - pick_up_positions: a mapping from a lower-cased item name to the positions in commands of the
+          pick up commands for that item
+        - holding_positions: a mapping from a lower-cased item name to the positions in commands of the
+          drop and deposit commands for that item
+        - listed_pick_ups: the lower-cased names of the items that have a pick up command in commands
+        - listed_drops: the lower-cased names of the items that have a drop command in commands
+    """
+    commands: tuple[str, ...]
+    go_positions: tuple[int, ...]
+    pick_up_positions: dict[str, list[int]]
+    holding_positions: dict[str, list[int]]
+    listed_pick_ups: frozenset[str]
+    listed_drops: frozenset[str]
+
+    def __init__(self, location: Location) -> None:
+        """Initialize the action table of the given location from its available commands."""
+        commands = []
+        go_positions = []
+        self.pick_up_positions = {}
+        self.holding_positions = {}
+        listed_drops = set()
+
+        for text in location.available_commands:
+            command = parse_command(text)
+            position = len(commands)
+            if command.verb in MOVE_VERBS:
+                go_positions.append(position)
+            elif command.verb == PICK_UP:
+                self.pick_up_positions.setdefault(command.argument, []).append(position)
+            elif command.verb in (DROP, DEPOSIT):
+                self.holding_positions.setdefault(command.argument, []).append(position)
+                if command.verb == DROP:
+                    listed_drops.add(command.argument)
+            else:
+                continue
+            commands.append(text)
+
+        self.commands = tuple(commands)
+        self.go_positions = tuple(go_positions)
+        self.listed_pick_ups = frozenset(self.pick_up_positions)
+        self.listed_drops = frozenset(listed_drops)
+
+
+class ActionMenu:
+    """One game's menu of available actions at one location.
+
+    The menu lists, in order:
+        1. every exit (go or go to command) in the location's available commands, and every pick up, drop or
+           deposit command there for an item that is at the location (for pick up) or in the inventory (for drop
+           and deposit)
+        2. a pick up command for each item at the location that has no pick up command listed
+        3. a drop command for each item in the inventory that has no drop command listed
+    """
+    # Private Instance Attributes:
+    #   - _table: the static action table of this menu's location
+    #   - _enabled: the positions in _table.commands of the commands currently shown, in increasing order
+    #   - _item_counts: a mapping from the lower-cased name of each item at the location to how many there are
+    #   - _extra_pick_ups: the pick up commands for items at the location with no listed pick up command,
+    #                      in the order the items are at the location
+    #   - _held: the lower-cased names of the inventory items that _enabled currently reflects
+    #   - _cache: the menu as last computed, or None if it has changed since
+    _table: ActionTable
+    _enabled: list[int]
+    _item_counts: dict[str, int]
+    _extra_pick_ups: list[str]
+    _held: set[str]
+    _cache: Optional[list[str]]
+
+    def __init__(self, table: ActionTable, location_items: Iterable[str]) -> None:
+        """Initialize the menu for a location with the given action table and the given items currently there.
+
+        The menu starts out reflecting an empty inventory.
+        """
+        self._table = table
+        self._enabled = list(table.go_positions)
+        self._item_counts = {}
+        self._extra_pick_ups = []
+        self._held = set()
+        self._cache = None
+        for item_name in location_items:
+            self.item_added(item_name.lower())
+
+    def _enable(self, positions: list[int]) -> None:
+        """Show the commands at the given positions in the menu."""
+        for position in positions:
+            bisect.insort(self._enabled, position)
+
+    def _disable(self, positions: list[int]) -> None:
+        """Stop showing the commands at the given positions in the menu."""
+        for position in positions:
+            del self._enabled[bisect.bisect_left(self._enabled, position)]
+
+    def item_added(self, name: str) -> None:
+        """Update the menu for an item with the given lower-cased name having been put down at the location."""
+        count = self._item_counts.get(name, 0)
+        self._item_counts[name] = count + 1
+        if name not in self._table.listed_pick_ups:
+            self._extra_pick_ups.append("pick up " + name)
+        elif count == 0:
+            self._enable(self._table.pick_up_positions[name])
+        self._cache = None
+
+    def item_removed(self, name: str) -> None:
+        """Update the menu for an item with the given lower-cased name having been taken from the location.
+
+        Preconditions:
+            - the item is at the location
+        """
+        count = self._item_counts[name] - 1
+        if count == 0:
+            del self._item_counts[name]
+        else:
+            self._item_counts[name] = count
+        if name not in self._table.listed_pick_ups:
+            self._extra_pick_ups.remove("pick up " + name)
+        elif count == 0:
+            self._disable(self._table.pick_up_positions[name])
+        self._cache = None
+
+    def _update_held(self, inventory_names: Iterable[str]) -> None:
+        """Update the drop and deposit commands shown for the given lower-cased inventory item names."""
+        held = set(inventory_names)
+        if held == self._held:
+            return
+        for name in self._held - held:
+            self._disable(self._table.holding_positions.get(name, []))
+        for name in held - self._held:
+            self._enable(self._table.holding_positions.get(name, []))
+        self._held = held
+        self._cache = None
+
+    def actions(self, inventory_names: Iterable[str]) -> list[str]:
+        """Return the menu for when the inventory holds items with the given lower-cased names, in inventory order.
+
+        inventory_names must be iterable more than once.
+        """
+        self._update_held(inventory_names)
+        if self._cache is None:
+            commands = self._table.commands
+            self._cache = [commands[position] for position in self._enabled] + self._extra_pick_ups
+        listed_drops = self._table.listed_drops
+        return self._cache + ["drop " + name for name in inventory_names if name not in listed_drops]
+
+
+if __name__ == "__main__":
+    pass
+    # When you are ready to check your work with python_ta, uncomment the following lines.
+    # (Delete the "#" and space before each line.)
+    # IMPORTANT: keep this code indented inside the "if __name__ == '__main__'" block
+    # import python_ta
+    # python_ta.check_all(config={
+    #     'max-line-length': 120,
+    #     'disable': ['R1705', 'E9998', 'E9999', 'static_type_checker']
+    # })
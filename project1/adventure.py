@@ -18,12 +18,30 @@ please consult our Course Syllabus.
 This file is Copyright (c) 2026 CSC111 Teaching Team
 """
 from __future__ import annotations
-import json
-from typing import Optional
+import os
+import sys
+from typing import Callable, Optional
 
+from action_menu import ActionMenu
+from command_parser import GO, GO_TO, PICK_UP, DROP, DEPOSIT, LOOK, INVENTORY, SCORE, LOG, QUIT, MENU_VERBS, \
+    Command, parse_command
 from game_entities import Location, Item
-from event_logger import Event, EventList
-
+from game_rules import GameRules
+from game_world import GameWorld, LocationOverlay
+from output_sink import OutputSink, StdoutSink
+from event_journal import EventJournal, has_records, read_journal, START, EVENT, REMOVE_EVENT, TAKE, \
+    DROP as JOURNAL_DROP, DEPOSIT as JOURNAL_DEPOSIT, GO as JOURNAL_GO, VISIT
+from event_logger import Event, EventList, CompactEventList
+import instrumentation
+from game_snapshot import encode_snapshot, decode_snapshot
+
+# The suffix of a compiled game data file's name; kept equal to compiled_world.COMPILED_SUFFIX, which this module
+# only imports when a compiled file is played
+COMPILED_SUFFIX = '.compiled'
+
+# The game data file and journal file the game is played with when it is started from the command line
+DEFAULT_GAME_DATA_FILE = 'project1/game_data.json'
+DEFAULT_JOURNAL_FILE = 'project1/adventure.journal'
 
 # Note: You may add in other import statements here as needed
 
@@ -38,35 +56,69 @@ class AdventureGame:
         - score: The player's current score
         - moves: The number of moves that the player has made
         - inventory: Dictionary of items currently in player's possession
-        - deposited_items: Set of item names that have been deposited at Oak House
+        - deposited_items: Set of item names that have been deposited at Oak House (a new set each time it is read)
+        - journal: The journal that every change to this game's state is recorded in, or None
+        - objectives_left: The number of objectives of the game's rules whose item has not been deposited yet
+        - won: Whether the game's rules have objectives and every one of them has been met
+        - lost: Whether the game's rules have a move limit and the player has made that many moves
 
     Representation Invariants:
         - current_location_id in self._locations
         - score >= 0
         - moves >= 0
+        - 0 <= objectives_left <= len(self.rules.objectives)
+        - won == (objectives_left == 0 and len(self.rules.objectives) > 0)
+        - lost == (self.rules.move_limit is not None and moves >= self.rules.move_limit)
     """
 
     # Private Instance Attributes (do NOT remove these two attributes):
     #   - _locations: a mapping from location id to Location object.
     #                       This represents all the locations in the game.
-    #   - _items: a list of Item objects, representing all items in the game.
-
-    _locations: dict[int, Location]
-    _items: list[Item]
+    #                       Locations are copied out of _world the first time this game uses them.
+    #   - _items: a tuple of Item objects, representing all items in the game.
+    #   - _world: the static world data, which may be shared with other games.
+    #   - _location_item_masks: for each location whose items have been looked up, the items at that location
+    #                       as a bitset: bit i is set if the item whose id in _world is i is there.
+    #   - _inventory_names: a mapping from the lower-cased name of each item in inventory to its name.
+    #   - _inventory_mask: the items in inventory, as a bitset of item ids.
+    #   - _deposited_mask: the items that have been deposited, as a bitset of item ids.
+    #   - _scored_mask: the items whose non-zero pickup points have been scored, as a bitset of item ids.
+    #   - _action_menus: a mapping from location id to this game's menu of actions at that location, for every
+    #                       location whose menu has been asked for.
+
+    _locations: LocationOverlay
+    _items: tuple[Item, ...]
+    _world: GameWorld
+    _location_item_masks: dict[int, int]
+    _inventory_names: dict[str, str]
+    _inventory_mask: int
+    _deposited_mask: int
+    _scored_mask: int
+    _action_menus: dict[int, ActionMenu]
     current_location_id: int  # Suggested attribute, can be removed
     score: int
     moves: int
     inventory: dict[str, Item]
-    deposited_items: set[str]
+    journal: Optional[EventJournal]
+    objectives_left: int
+    won: bool
+    lost: bool
 
-    def __init__(self, game_data_file: str, initial_location_id: int) -> None:
+    def __init__(self, game_data_file: str, initial_location_id: int, world: Optional[GameWorld] = None,
+                 journal: Optional[EventJournal] = None) -> None:
         """
         Initialize a new text adventure game, based on the data in the given file, setting starting location of game
         at the given initial location ID.
         (note: you are allowed to modify the format of the file as you see fit)
 
+        If world is given, the game is played in that already-loaded world and the file is not opened again.
+        The world is never modified, so any number of games can share it.
+
+        If journal is given, the start of the game and every later change to its state are recorded in it.
+
         Preconditions:
         - game_data_file is the filename of a valid game data JSON file
+        - world is None or world was loaded from game_data_file
         """
 
         # NOTES:
@@ -77,39 +129,174 @@ class AdventureGame:
         # 2. Make sure the Item class is used to represent each item.
 
         # Suggested helper method (you can remove and load these differently if you wish to do so):
-        self._locations, self._items = self._load_game_data(game_data_file)
+        if world is None:
+            world = self._load_game_data(game_data_file)
+        self._world = world
+        self._locations = LocationOverlay(world)
+        self._items = world.items
 
         # Suggested attributes (you can remove and track these differently if you wish to do so):
         self.current_location_id = initial_location_id  # game begins at this location
         self.score = 0
         self.moves = 0
         self.inventory = {}
-        self.deposited_items = set()
+
+        self._location_item_masks = {}
+        self._inventory_names = {}
+        self._inventory_mask = 0
+        self._deposited_mask = 0
+        self._scored_mask = 0
+        self._action_menus = {}
+        self.objectives_left = len(world.rules.objectives)
+        self.won = False
+        self.lost = False
+
+        self.journal = journal
+        if journal is not None:
+            journal.append(START, initial_location_id)
 
     @staticmethod
-    def _load_game_data(filename: str) -> tuple[dict[int, Location], list[Item]]:
+    def _load_game_data(filename: str) -> GameWorld:
         """Load locations and items from a JSON file with the given filename and
-        return a tuple consisting of (1) a dictionary of locations mapping each game location's ID to a Location object,
-        and (2) a list of all Item objects."""
+        return them as a GameWorld, which maps each game location's ID to a Location object
+        and holds all Item objects.
+
+        A filename ending in COMPILED_SUFFIX names the compiled file of a JSON file; the world
+        is then memory-mapped from that compiled file, which is compiled again first if it is
+        missing or out of date."""
+        if filename.endswith(COMPILED_SUFFIX):
+            # Only games played from a compiled file need mmap and the rest of the compiled format
+            from compiled_world import load_compiled_world
+            return load_compiled_world(filename[:-len(COMPILED_SUFFIX)])
+        return GameWorld.load(filename)
+
+    @classmethod
+    def from_journal(cls, game_data_file: str, journal_file: str, events: Optional[EventList | CompactEventList] = None,
+                     world: Optional[GameWorld] = None) -> AdventureGame:
+        """
+        Return the game recorded in the journal file with the given name, in the state it was in after the last
+        record in the journal. If events is given, the recorded event log is rebuilt in it as well.
 
-        with open(filename, 'r') as f:
-            data = json.load(f)  # This loads all the data from the JSON file
+        The records are applied directly to the game's state; no command is run through the game rules again.
+        Raise ValueError if the journal does not start with a complete start record, or holds a record of an
+        unknown kind.
+        The returned game has no journal; to keep recording, attach a new EventJournal for journal_file to the game
+        and to events.
 
-        locations = {}
-        for loc_data in data['locations']:  # Go through each element associated with the 'locations' key in the file
-            location_obj = Location(loc_data['id'], loc_data['brief_description'], loc_data['long_description'],
-                                    loc_data['available_commands'], loc_data['items'].copy(),
-                                    loc_data['name'], loc_data['visited'])
-            locations[loc_data['id']] = location_obj
+        Preconditions:
+        - the journal was recorded by a game played in the world stored in game_data_file
+        - events is None or events.is_empty()
+        - events is None or events.journal is None
+        """
+        if world is None:
+            world = cls._load_game_data(game_data_file)
+        records = read_journal(journal_file)
+        start = next(records, None)
+        if start is None or start[0] != START:
+            raise ValueError(f"journal {journal_file} does not start with a complete start record")
+        game = cls(game_data_file, int(start[1]), world)
+
+        # The records are applied straight to the game's locations and inventory; the lookup tables and menus
+        # that the pick up, drop and deposit methods keep up to date are rebuilt once at the end instead.
+        locations = game._locations
+        event_locations = {}  # the location id and description for each id string seen in an event record
+        for record in records:
+            kind = record[0]
+            if kind == EVENT:
+                if events is not None:
+                    event_location = event_locations.get(record[1])
+                    if event_location is None:
+                        id_num = int(record[1])
+                        event_location = (id_num, world.locations[id_num].long_description)
+                        event_locations[record[1]] = event_location
+                    events.add_event(Event(*event_location), record[2] if len(record) > 2 else None)
+            elif kind == JOURNAL_GO:
+                game.current_location_id = int(record[1])
+                game.moves += 1
+            elif kind == TAKE:
+                locations[int(record[1])].items.remove(record[2])
+                game.inventory[record[2]] = world.get_item(record[2])
+                if len(record) > 3:
+                    game.score += int(record[3])
+                    game._scored_mask |= 1 << world.item_id(record[2])
+            elif kind == JOURNAL_DROP:
+                del game.inventory[record[2]]
+                locations[int(record[1])].items.append(record[2])
+            elif kind == JOURNAL_DEPOSIT:
+                del game.inventory[record[1]]
+                game._deposited_mask |= 1 << world.item_id(record[1])
+                game.score += int(record[2])
+            elif kind == VISIT:
+                locations[int(record[1])].visited = True
+            elif kind == REMOVE_EVENT:
+                if events is not None:
+                    events.remove_last_event()
+            else:
+                raise ValueError(f"unknown record kind {kind!r} in journal {journal_file}")
 
-        items = []
+        game._inventory_names = {item_name.lower(): item_name for item_name in game.inventory}
+        game._inventory_mask = world.item_mask(game.inventory)
+        game._update_outcome()
+        return game
+
+    def snapshot(self) -> bytes:
+        """
+        Return a compact binary snapshot of this game's state: the current location, score, moves, inventory,
+        deposited items, and the items and visited flag of every location
 
-        for item_data in data['items']:
-            item_obj = Item(item_data['name'], item_data['start_position'],
-                            item_data['target_position'], item_data['target_points'], item_data['description'])
-            items.append(item_obj)
+        Only the locations that differ from their initial state in the world are stored, so taking a snapshot
+        costs as much as the number of locations this game has used, however big the world is. Games in the same
+        state have equal snapshots. See game_snapshot for the format.
+        """
+        return encode_snapshot(self._world, self.current_location_id, self.score, self.moves, self.inventory,
+                               self.deposited_items, self._item_names(self._scored_mask), self._locations.values())
+
+    def restore(self, snapshot: bytes) -> None:
+        """
+        Put this game back in the state recorded in the given snapshot, replacing its whole current state
 
-        return locations, items
+        Raise ValueError if the snapshot was not taken in a game played in this game's world.
+        The restore itself is not recorded in the journal.
+
+        Preconditions:
+        - self.journal is None
+        """
+        state = decode_snapshot(self._world, snapshot)
+
+        locations = LocationOverlay(self._world)
+        for loc_id, visited, items in state.changed_locations:
+            location = locations[loc_id]
+            location.visited = visited
+            if items is not None:
+                location.items = items
+        self._locations = locations
+
+        self.current_location_id = state.current_location_id
+        self.score = state.score
+        self.moves = state.moves
+        self.inventory = {item_name: self._world.get_item(item_name) for item_name in state.inventory}
+
+        self._location_item_masks = {}
+        self._inventory_names = {item_name.lower(): item_name for item_name in self.inventory}
+        self._inventory_mask = self._world.item_mask(state.inventory)
+        self._deposited_mask = self._world.item_mask(state.deposited_items)
+        self._scored_mask = self._world.item_mask(state.scored_pickups)
+        self._action_menus = {}
+        self._update_outcome()
+
+    def _update_outcome(self) -> None:
+        """Set objectives_left, won and lost from the deposited items and moves, after they were changed without
+        deposit_item and move_to."""
+        rules = self._world.rules
+        met = bin(self._deposited_mask & self._world.objective_mask).count('1')
+        self.objectives_left = len(rules.objectives) - met
+        self.won = self.objectives_left == 0 and len(rules.objectives) > 0
+        self.lost = rules.move_limit is not None and self.moves >= rules.move_limit
+
+    @property
+    def rules(self) -> GameRules:
+        """The rules this game is played by, which come with its world."""
+        return self._world.rules
 
     def get_location(self, loc_id: Optional[int] = None) -> Location:
         """Return Location object associated with the provided location ID.
@@ -125,10 +312,184 @@ class AdventureGame:
         """
         Return the object Item with the given name, or None if no such item exists
         """
-        for items in self._items:
-            if items.name == name:
-                return items
-        return None
+        return self._world.get_item(name)
+
+    @property
+    def deposited_items(self) -> set[str]:
+        """The names of the items that have been deposited, in the order of the world's items.
+
+        This is a new set each time it is read, for display; changing it does not change the game.
+        """
+        return set(self._item_names(self._deposited_mask))
+
+    def _item_names(self, mask: int) -> list[str]:
+        """Return the names of the items in the given bitset of item ids, in the order of the world's items."""
+        return [item.name for item_id, item in enumerate(self._items) if mask >> item_id & 1]
+
+    def _item_mask_at(self, location: Location) -> int:
+        """
+        Return the items at the given location as a bitset of item ids, building it the first time the location
+        is looked up
+        """
+        mask = self._location_item_masks.get(location.id_num)
+        if mask is None:
+            mask = 0
+            for item_name in location.items:
+                item_id = self._world.item_id(item_name)
+                if item_id is not None:
+                    mask |= 1 << item_id
+            self._location_item_masks[location.id_num] = mask
+        return mask
+
+    def find_location_item(self, name: str, location: Optional[Location] = None) -> Optional[str]:
+        """
+        Return the name of the item at the given location (by default, the current location) whose lower-cased
+        name is the given name, or None if there is no such item there
+        """
+        if location is None:
+            location = self.get_location()
+        item = self._world.find_item(name)
+        if item is None or not self._item_mask_at(location) >> self._world.item_id(item.name) & 1:
+            return None
+        return item.name
+
+    def find_inventory_item(self, name: str) -> Optional[str]:
+        """
+        Return the name of the item in the inventory whose lower-cased name is the given name, or None if there is
+        no such item in the inventory
+        """
+        item = self._world.find_item(name)
+        if item is None or not self._inventory_mask >> self._world.item_id(item.name) & 1:
+            return None
+        return item.name
+
+    def pick_up_item(self, item: Item, location: Location) -> None:
+        """
+        Move the given item from the given location into the inventory, adding its pickup points in the game's
+        rules to the score the first time it is picked up
+
+        Preconditions:
+        - item.name in location.items
+        """
+        bit = 1 << self._world.item_id(item.name)
+        self._location_item_masks[location.id_num] = self._item_mask_at(location) & ~bit
+        location.items.remove(item.name)
+        self.inventory[item.name] = item
+        self._inventory_names[item.name.lower()] = item.name
+        self._inventory_mask |= bit
+        points = self._world.rules.pickup_points.get(item.name, 0)
+        if points and not self._scored_mask & bit:
+            self._scored_mask |= bit
+            self.score = self.score + points
+        else:
+            points = 0
+        if self.journal is not None:
+            if points:
+                self.journal.append(TAKE, location.id_num, item.name, points)
+            else:
+                self.journal.append(TAKE, location.id_num, item.name)
+
+        menu = self._action_menus.get(location.id_num)
+        if menu is not None:
+            menu.item_removed(item.name.lower())
+
+    def drop_item(self, item_name: str, location: Location) -> None:
+        """
+        Move the item with the given name from the inventory to the given location
+
+        Preconditions:
+        - item_name in self.inventory
+        """
+        bit = 1 << self._world.item_id(item_name)
+        self._location_item_masks[location.id_num] = self._item_mask_at(location) | bit
+        del self.inventory[item_name]
+        del self._inventory_names[item_name.lower()]
+        self._inventory_mask &= ~bit
+        location.items.append(item_name)
+        if self.journal is not None:
+            self.journal.append(JOURNAL_DROP, location.id_num, item_name)
+
+        menu = self._action_menus.get(location.id_num)
+        if menu is not None:
+            menu.item_added(item_name.lower())
+
+    def deposit_item(self, item_name: str, points: int = 0) -> None:
+        """
+        Move the item with the given name from the inventory to the deposited items, and add the given points
+        to the score. Depositing an objective's item meets that objective, which counts down objectives_left, and
+        the game is won once it reaches zero.
+
+        Preconditions:
+        - item_name in self.inventory
+        - points >= 0
+        """
+        bit = 1 << self._world.item_id(item_name)
+        del self.inventory[item_name]
+        del self._inventory_names[item_name.lower()]
+        self._inventory_mask &= ~bit
+        if bit & self._world.objective_mask and not bit & self._deposited_mask:
+            self.objectives_left -= 1
+            self.won = self.objectives_left == 0
+        self._deposited_mask |= bit
+        self.score = self.score + points
+        if self.journal is not None:
+            self.journal.append(JOURNAL_DEPOSIT, item_name, points)
+
+    def move_to(self, loc_id: int) -> None:
+        """
+        Move the player to the location with the given id, counting it as one move; the game is lost once the
+        moves reach the move limit
+
+        Preconditions:
+        - loc_id in self._locations
+        """
+        self.current_location_id = loc_id
+        self.moves = self.moves + 1
+        if self.moves == self._world.rules.move_limit:
+            self.lost = True
+        if self.journal is not None:
+            self.journal.append(JOURNAL_GO, loc_id)
+
+    def mark_visited(self, location: Location) -> None:
+        """
+        Record that the player has visited the given location
+        """
+        location.visited = True
+        if self.journal is not None:
+            self.journal.append(VISIT, location.id_num)
+
+    def find_location_id(self, name: str) -> Optional[int]:
+        """
+        Return the id of the location whose lower-cased name is the given name, or None if there is no such location
+        """
+        return self._world.find_location(name)
+
+    def route_to(self, loc_id: int) -> Optional[list[str]]:
+        """
+        Return the go commands of a shortest walk from the current location to the location with the given id,
+        holding the current inventory, or None if the player cannot get there
+
+        Preconditions:
+        - loc_id in self._locations
+        """
+        return self._world.get_routing_table().route(self.current_location_id, loc_id, self.inventory)
+
+    @instrumentation.timed('adventure_get_available_actions')
+    def get_available_actions(self, location: Optional[Location] = None) -> list[str]:
+        """
+        Return the actions available at the given location (by default, the current location), based on the
+        current inventory and the location's items, in the same order as get_available_actions
+
+        The menu for each location is built the first time it is asked for and then kept up to date as items move,
+        so asking again without anything changing only costs as much as the menu is long.
+        """
+        if location is None:
+            location = self.get_location()
+        menu = self._action_menus.get(location.id_num)
+        if menu is None:
+            menu = ActionMenu(self._world.get_action_table(location.id_num), location.items)
+            self._action_menus[location.id_num] = menu
+        return menu.actions(self._inventory_names.keys())
 
 
 def listed_items(commands: dict, words: str) -> set[str]:
@@ -146,6 +507,9 @@ def listed_items(commands: dict, words: str) -> set[str]:
 def get_available_actions(loc: Location, inventory: dict) -> list:
     """
     Return filtered list of available actions based on current inventory and location's items
+
+    This rebuilds the list from scratch; AdventureGame.get_available_actions returns the same list from a menu
+    that is kept up to date as items move.
     """
     actions = []
     for act in loc.available_commands:
@@ -179,234 +543,361 @@ def get_available_actions(loc: Location, inventory: dict) -> list:
     return actions
 
 
-if __name__ == "__main__":
-    # When you are ready to check your work with python_ta, uncomment the following lines.
-    # (Delete the "#" and space before each line.)
-    # IMPORTANT: keep this code indented inside the "if __name__ == '__main__'" block
-    import python_ta
-    python_ta.check_all(config={
-        'max-line-length': 120,
-        'disable': ['R1705', 'E9998', 'E9999', 'static_type_checker']
-    })
+def _show_intro(sink: OutputSink, resuming: bool) -> None:
+    """Show the game's introduction, noting whether an unfinished game is being resumed."""
+    sink.say("You wake up in a panic. Your CS project is due at 1pm today, \n but you are missing critical items!")
+    sink.say("MISSION: Find and Deposit these items at Oak House:")
+    sink.say("     1. USB Drive")
+    sink.say("     2. Laptop Charger")
+    sink.say("     3. Lucky Mug")
+    sink.say("\n*** You can only carry 2 items at a time! ***")
+    sink.say("\nCommands:")
+    sink.say("     1. drop: Leave items on ground (can pick up later, no points)")
+    sink.say("     2. deposit: Deliver items at Oak House (you can earn points)")
+    sink.say("     3. go to: Walk to a place by name, e.g. go to bahen centre")
+    sink.say("\nLocked Locations:")
+    sink.say("     1. Robarts Library requires T-card")
+    sink.say("     2. Oak House requires Dorm Key")
+    sink.say("*** Keys never expire! Just keep them in inventory to enter those locations")
+    sink.say("*** HINT! Dorm key at Robarts library, T-card at Cafe ***")
+    if resuming:
+        sink.say("\n*** Resuming your unfinished game ***")
+
+
+def _show_location(game: AdventureGame, location: Location, sink: OutputSink) -> None:
+    """Describe the given location, the game's current location, and mark it visited."""
+    key = game.rules.locks.get(location.id_num)
+    if location.visited:
+        sink.say(location.brief_description)
+    else:
+        descrip = location.long_description
+        if key is not None and key in game.inventory:
+            descrip = descrip.replace("(LOCKED)", "(UNLOCKED)")
+        sink.say(descrip)
+        game.mark_visited(location)
+
+    if key is not None:
+        if key in game.inventory:
+            sink.say(f"[{location.name}: UNLOCKED - {key} in your inventory]")
+        else:
+            sink.say(f"[{location.name}: LOCKED - {key} required to enter]")
+
+
+def _show_actions(game: AdventureGame, location: Location, sink: OutputSink) -> None:
+    """Show the actions available at the given location."""
+    sink.say("What to do? Choose from: look, inventory, score, log, quit")
+    sink.say("At this location, you can also:")
+    for action in game.get_available_actions(location):
+        sink.say("-", action)
+
+
+def _is_valid_choice(game: AdventureGame, location: Location, choice: str, command: Command) -> bool:
+    """Return whether the given choice, whose parsed form is command, can be made at the given location."""
+    return any([
+        choice in location.available_commands,
+        command.verb in MENU_VERBS,
+        command.verb == DROP and game.find_inventory_item(command.argument) is not None,
+        command.verb == PICK_UP and game.find_location_item(command.argument, location) is not None,
+        command.verb == GO_TO and game.find_location_id(command.argument) is not None
+    ])
+
+
+def _run_menu_command(command: Command, game: AdventureGame, game_log: EventList, location: Location,
+                      sink: OutputSink) -> bool:
+    """Carry out the given menu command and return whether the game goes on afterwards."""
+    if command.verb == LOG:
+        game_log.display_events(sink)
+    elif command.verb == LOOK:
+        sink.say(location.long_description)
+    elif command.verb == INVENTORY:
+        sink.say("Your inventory:", len(game.inventory), "/", game.rules.carry_limit)
+        for item_name in game.inventory:
+            sink.say(" - ", item_name)
+    elif command.verb == SCORE:
+        sink.say("Score:", game.score)
+        rules = game.rules
+        if rules.move_limit is None:
+            sink.say("Moves:", game.moves)
+        else:
+            sink.say("Moves:", game.moves, "/", rules.move_limit)
+        sink.say("Deposited:", len(rules.objectives) - game.objectives_left, "/", len(rules.objectives))
+    elif command.verb == QUIT:
+        sink.say("Game Over!")
+        return False
+    return True
 
-    game_log = EventList()  # This is REQUIRED as one of the baseline requirements
-    game = AdventureGame('project1/game_data.json', 1)  # load data, setting initial location ID to 1
-    menu = ["look", "inventory", "score", "log", "quit"]  # Regular menu options available at each location
-    choice = None
-
-    print("You wake up in a panic. Your CS project is due at 1pm today, \n but you are missing critical items!")
-    print("MISSION: Find and Deposit these items at Oak House:")
-    print("     1. USB Drive")
-    print("     2. Laptop Charger")
-    print("     3. Lucky Mug")
-    print("\n*** You can only carry 2 items at a time! ***")
-    print("\nCommands:")
-    print("     1. drop: Leave items on ground (can pick up later, no points)")
-    print("     2. deposit: Deliver items at Oak House (you can earn points)")
-    print("\nLocked Locations:")
-    print("     1. Robarts Library requires T-card")
-    print("     2. Oak House requires Dorm Key")
-    print("*** Keys never expire! Just keep them in inventory to enter those locations")
-    print("*** HINT! Dorm key at Robarts library, T-card at Cafe ***")
-
-    ongoing = True
-    while ongoing:
-
-        location = game.get_location()
-
-        event = Event(location.id_num, location.long_description)
-        game_log.add_event(event, choice)
-
-        if location.visited:
-            print(location.brief_description)
+
+def run_action(choice: str, command: Command, game: AdventureGame, location: Location,
+               sink: OutputSink) -> list[str]:
+    """Carry out the given non-menu command, chosen at the given location, by the game's rules, and return the
+    go commands still to take to finish it, which is only ever non-empty for a "go to" command.
+
+    Both play and AdventureGameSimulation carry out every action through this function, so the two always
+    apply the same rules. Each rule is looked up in the game's GameRules by location id.
+    """
+    rules = game.rules
+    if command.verb == PICK_UP:
+        item_found = game.find_location_item(command.argument, location)
+        if item_found is not None:
+            if len(game.inventory) >= rules.carry_limit:
+                sink.say("Inventory is full!")
+            else:
+                item = game.get_item(item_found)
+                if item is not None:
+                    game.pick_up_item(item, location)
+                    sink.say("Picked up:", item_found)
+
+                    if item_found in rules.pickup_points:
+                        sink.say("Score:", game.score)
         else:
-            descrip = location.long_description
-            if location.id_num == 13 and "T-card" in game.inventory:
-                descrip = descrip.replace("(LOCKED)", "(UNLOCKED)")
-            elif location.id_num == 15 and "Dorm Key" in game.inventory:
-                descrip = descrip.replace("(LOCKED)", "(UNLOCKED)")
-            print(descrip)
-            location.visited = True
-
-        if location.id_num == 13:
-            if "T-card" in game.inventory:
-                print("[Robarts Library: UNLOCKED - T-card in your inventory]")
+            sink.say("Item is not here!")
+
+    elif command.verb == DROP:
+        item_found = game.find_inventory_item(command.argument)
+        if item_found is not None:
+            refusal = rules.drop_refusal(location.id_num, item_found)
+            if refusal is not None:
+                sink.say(refusal)
             else:
-                print("[Robarts Library: LOCKED - T-card required to enter]")
-        elif location.id_num == 15:
-            if "Dorm Key" in game.inventory:
-                print("[Oak House: UNLOCKED - Dorm Key in your inventory]")
+                game.drop_item(item_found, location)
+                sink.say("Dropped:", item_found)
+        else:
+            sink.say("You don't have that!")
+
+    elif command.verb == DEPOSIT:
+        if location.id_num != rules.deposit_location:
+            sink.say(rules.deposit_refusal)
+        else:
+            item_found = game.find_inventory_item(command.argument)
+            if item_found is not None:
+                points = 0
+                item = game.get_item(item_found)
+                if item is not None and location.id_num == item.target_position:
+                    points = item.target_points
+                game.deposit_item(item_found, points)
+                sink.say("Deposited:", item_found)
+
+                if points > 0:
+                    sink.say("Earned", points, "points!")
+                    sink.say("Score:", game.score)
             else:
-                print("[Oak House: LOCKED - Dorm Key required to enter]")
-
-        # Display possible actions at this location
-        print("What to do? Choose from: look, inventory, score, log, quit")
-        print("At this location, you can also:")
-        for action in get_available_actions(location, game.inventory):
-            print("-", action)
-
-        def is_valid_drop(comm: str) -> bool:
-            """
-            Check if the user can drop the item
-            """
-            if comm[:5] == "drop ":
-                items_name = comm[5:]
-                for name in game.inventory:
-                    if name.lower() == items_name:
-                        return True
-            return False
+                sink.say("You don't have that!")
+
+    elif command.verb == GO_TO and choice not in location.available_commands:
+        target_id = game.find_location_id(command.argument)
+        route = None if target_id is None else game.route_to(target_id)
+        if route is None:
+            sink.say("You can't get there from here!")
+        elif not route:
+            sink.say("You are already there!")
+        else:
+            return route
 
-        def is_valid_pickup(comm: str) -> bool:
-            """
-            Check if the user can pick up the item at the current location
-            """
-            if comm[:8] == "pick up ":
-                items_name = comm[8:]
-                for name in location.items:
-                    if name.lower() == items_name:
-                        return True
-            return False
+    elif command.verb in (GO, GO_TO):
+        next_id = location.available_commands[choice]
+        refusal = rules.entry_refusal(next_id, game.inventory)
+        if refusal is not None:
+            sink.say(refusal)
+        else:
+            game.move_to(next_id)
+    return []
 
-        # Validate choice
-        choice = input("\nEnter action: ").lower().strip()
-        while not any([
-            choice in location.available_commands,
-            choice in menu,
-            is_valid_drop(choice),
-            is_valid_pickup(choice)
-        ]):
-            print("That was an invalid option; try again.")
-            choice = input("\nEnter action: ").lower().strip()
-
-        print("=================================================")
-        print("You decided to:", choice)
-
-        if choice in menu:
-            if choice == "log":
-                game_log.display_events()
-            elif choice == "look":
-                print(location.long_description)
-            elif choice == "inventory":
-                print("Your inventory:", len(game.inventory), "/", 2)
-                for item_name in game.inventory:
-                    print(" - ", item_name)
-            elif choice == "score":
-                print("Score:", game.score)
-                print("Moves:", game.moves, "/", 50)
-                print("Deposited:", len(game.deposited_items), "/3")
-            elif choice == "quit":
-                print("Game Over!")
-                ongoing = False
 
-        else:
-            # Handle non-menu actions
-            if choice in location.available_commands:
-                result = location.available_commands[choice]
+def is_won(game: AdventureGame) -> bool:
+    """Return whether the given game has been won: its rules have objectives, and every one of them has been met.
+
+    The game updates its won flag only when an objective is met, so this takes constant time however many
+    objectives the rules have.
+    """
+    return game.won
+
+
+def is_lost(game: AdventureGame) -> bool:
+    """Return whether the given game has been lost: its rules have a move limit, and the player has made that
+    many moves."""
+    return game.lost
+
+
+def _is_over(game: AdventureGame, sink: OutputSink) -> bool:
+    """Return whether the game has been won or lost, announcing the result if so."""
+    over = False
+    if is_won(game):
+        sink.say("You win!")
+        sink.say("Final Score:", game.score)
+        over = True
+
+    if is_lost(game):
+        sink.say("Game Over!")
+        sink.say("Final Score:", game.score)
+        over = True
+    return over
+
+
+class GameSession:
+    """One player's game, which is told each command the player enters instead of reading them itself, so that
+    many games can be played at once (for example, by game_server).
+
+    Instance Attributes:
+        - game: the game being played
+        - game_log: the log of the locations visited in the game
+        - sink: where everything shown to the player goes
+        - over: whether the game has been won, lost or quit
+
+    Representation Invariants:
+        - not self.over or self._route_steps == []
+    """
+    # Private Instance Attributes:
+    #   - _location: the location the player was last asked what to do at
+    #   - _choice: the last command carried out, which the next event in the log is added with
+    #   - _route_steps: the go commands still to take for the last "go to" command
+    #   - _resuming: whether the game was resumed from a journal and its log does not yet have the event for the
+    #                       location it is resumed at added again
+
+    game: AdventureGame
+    game_log: EventList | CompactEventList
+    sink: OutputSink
+    over: bool
+    _location: Optional[Location]
+    _choice: Optional[str]
+    _route_steps: list[str]
+    _resuming: bool
+
+    def __init__(self, game: AdventureGame, game_log: EventList | CompactEventList, sink: OutputSink,
+                 resuming: bool = False) -> None:
+        """Initialize a session playing the given game, which is resumed from a journal if resuming is True.
+
+        Nothing is shown to the player until start is called.
+        """
+        self.game = game
+        self.game_log = game_log
+        self.sink = sink
+        self.over = False
+        self._location = None
+        self._choice = None
+        self._route_steps = []
+        self._resuming = resuming
+
+    def start(self) -> None:
+        """Show the game's introduction and current location, and ask the player what to do."""
+        _show_intro(self.sink, self._resuming)
+        self._advance()
+
+    def handle(self, text: str) -> bool:
+        """Carry out the command the player entered, then show where they end up and ask them what to do next,
+        unless the game is over. Return whether the command was valid; an invalid one changes nothing.
+
+        Preconditions:
+            - self.start has been called
+            - not self.over
+        """
+        choice = text.lower().strip()
+        command = parse_command(choice)
+        if not _is_valid_choice(self.game, self._location, choice, command):
+            self.sink.say("That was an invalid option; try again.")
+            self.sink.flush()
+            return False
+
+        self._choice = choice
+        self._carry_out(self._location, choice, command)
+        if not self.over:
+            self._advance()
+        return True
+
+    def _advance(self) -> None:
+        """Show the current location and take any steps left towards the last "go to" destination, then ask the
+        player what to do, unless the game ends first."""
+        while True:
+            location = self.game.get_location()
+
+            # A resumed game's log already ends with the event for the location it stopped at
+            if self._resuming:
+                self._resuming = False
             else:
-                result = None
-
-            if "pick up " in choice:
-                item_name_input = choice[8:]
-                item_found = ""
-                for item_name in location.items:
-                    if item_name.lower() == item_name_input:
-                        item_found = item_name
-                if item_found != "":
-                    if len(game.inventory) >= 2:
-                        print("Inventory is full!")
-                    else:
-                        item = game.get_item(item_found)
-                        if item is not None:
-                            game.inventory[item_found] = item
-                            location.items.remove(item_found)
-                            print("Picked up:", item_found)
-
-                            if item_found in ["USB Drive", "Laptop Charger", "Lucky Mug"]:
-                                game.score = game.score + 0
-                                print("Score:", game.score)
-                else:
-                    print("Item is not here!")
-
-            elif "drop " in choice:
-                item_name_input = choice[5:]
-                item_found = ""
-                for item_name in game.inventory:
-                    if item_name.lower() == item_name_input:
-                        item_found = item_name
-                if item_found != "":
-                    if item_found.lower() == "t-card" and location.id_num == 13:
-                        print("You cannot drop the T-card here!")
-                    elif item_found.lower() == "dorm key" and location.id_num == 15:
-                        print("You cannot drop the Dorm Key here!")
-                    else:
-                        new_inventory = {}
-                        for item_name in game.inventory:
-                            if item_name != item_found:
-                                new_inventory[item_name] = game.inventory[item_name]
-                        game.inventory = new_inventory
-                        location.items.append(item_found)
-                        print("Dropped:", item_found)
-                else:
-                    print("You don't have that!")
-
-            elif "deposit " in choice:
-                item_name_input = choice[8:]
-                if location.id_num != 15:
-                    print("You can only deposit at Oak House!")
-                else:
-                    item_found = ""
-                    for item_name in game.inventory:
-                        if item_name.lower() == item_name_input:
-                            item_found = item_name
-                    if item_found != "":
-                        points = 0
-                        item = game.get_item(item_found)
-                        if item is not None and location.id_num == item.target_position:
-                            points = item.target_points
-                        new_inventory = {}
-                        for item_name in game.inventory:
-                            if item_name != item_found:
-                                new_inventory[item_name] = game.inventory[item_name]
-                        game.inventory = new_inventory
-                        game.deposited_items.add(item_found)
-                        print("Deposited:", item_found)
-
-                        if points > 0:
-                            game.score = game.score + points
-                            print("Earned", points, "points!")
-                            print("Score:", game.score)
-                    else:
-                        print("You don't have that!")
-
-            elif "go " in choice:
-                next_id = location.available_commands[choice]
-                can_enter = True
-                if next_id == 13:
-                    if "T-card" not in game.inventory:
-                        print("Robarts is locked! You need a T-card!")
-                        can_enter = False
-                if next_id == 15:
-                    if "Dorm Key" not in game.inventory:
-                        print("Oak House is locked! You need a Dorm Key!")
-                        can_enter = False
-                if can_enter:
-                    game.current_location_id = next_id
-                    game.moves = game.moves + 1
-
-        win = True
-        if "USB Drive" not in game.deposited_items:
-            win = False
-        if "Laptop Charger" not in game.deposited_items:
-            win = False
-        if "Lucky Mug" not in game.deposited_items:
-            win = False
-
-        if win:
-            print("You win!")
-            print("Final Score:", game.score)
-            ongoing = False
+                event = Event(location.id_num, location.long_description)
+                self.game_log.add_event(event, self._choice)
+
+            _show_location(self.game, location, self.sink)
+
+            if not self._route_steps:
+                self._location = location
+                _show_actions(self.game, location, self.sink)
+                self.sink.flush()
+                return
+
+            self.sink.flush()
+            self._choice = self._route_steps.pop(0)
+            self._carry_out(location, self._choice, parse_command(self._choice))
+            if self.over:
+                return
+
+    def _carry_out(self, location: Location, choice: str, command: Command) -> None:
+        """Carry out the given valid choice, whose parsed form is command, at the given location, and check
+        whether the game is over afterwards."""
+        recorder = instrumentation.recorder
+        started = None if recorder is None else recorder.start_command(command.verb, location.id_num)
+        self.sink.say("=================================================")
+        self.sink.say("You decided to:", choice)
+
+        ongoing = True
+        if command.verb in MENU_VERBS:
+            ongoing = _run_menu_command(command, self.game, self.game_log, location, self.sink)
+        else:
+            # Only a "go to" command returns steps, and the player is only asked for one once the last route is done
+            self._route_steps.extend(run_action(choice, command, self.game, location, self.sink))
+        if recorder is not None:
+            recorder.finish_command(started)
 
-        if game.moves >= 50:
-            print("Game Over!")
-            print("Final Score:", game.score)
+        if _is_over(self.game, self.sink):
             ongoing = False
+
+        if not ongoing:
+            self.over = True
+            self._route_steps = []
+            self.sink.flush()
+
+
+def play(game_data_file: str = DEFAULT_GAME_DATA_FILE, journal_file: str = DEFAULT_JOURNAL_FILE,
+         sink: Optional[OutputSink] = None, read_command: Callable[[str], str] = input) -> None:
+    """Play the game in the given game data file interactively, starting at location 1, until it is won, lost or
+    quit. Commands are read with read_command, which is given the prompt to show, and everything shown to the
+    player goes through sink (by default, to standard output).
+
+    Every change to the game is journaled to journal_file as it happens, so a game that crashed is resumed from
+    that journal the next time it is played. The journal is removed once the game is over.
+    """
+    # A journal whose first record was cut off by a crash holds no game, and is emptied when it is opened again
+    resuming = has_records(journal_file)
+
+    game_log = EventList()  # This is REQUIRED as one of the baseline requirements
+    if resuming:
+        game = AdventureGame.from_journal(game_data_file, journal_file, game_log)
+        game.journal = game_log.journal = EventJournal(journal_file, batch_size=1)
+    else:
+        game_log.journal = EventJournal(journal_file, batch_size=1)
+        # load data, setting initial location ID to 1
+        game = AdventureGame(game_data_file, 1, journal=game_log.journal)
+    if sink is None:
+        sink = StdoutSink()  # Everything shown to the player goes through this sink
+
+    session = GameSession(game, game_log, sink, resuming)
+    session.start()
+    while not session.over:
+        session.handle(read_command("\nEnter action: "))
+
+    # The game is over, so there is nothing left to resume
+    game.journal.close()
+    os.remove(journal_file)
+
+
+if __name__ == "__main__":
+    # Checking the code with python_ta takes several seconds, so it only runs when asked for with --lint.
+    # To just play, without importing python_ta at all, run play.py instead.
+    # IMPORTANT: keep this code indented inside the "if __name__ == '__main__'" block
+    if '--lint' in sys.argv[1:]:
+        import python_ta
+        python_ta.check_all(config={
+            'max-line-length': 120,
+            'disable': ['R1705', 'E9998', 'E9999', 'static_type_checker']
+        })
+
+    play()
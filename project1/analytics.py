@@ -0,0 +1,347 @@
+"""CSC111 Project 1: Text Adventure Game - Log Analytics
+
+Instructions (READ THIS FIRST!)
+===============================
+
+This Python module contains analytics for Project 1 over large batches of played games:
+how often each location is visited, how often the player goes from one location to
+another, how the score grows from one event to the next, how many events it takes to
+score for the first time and how the chance of winning depends on the number of moves.
+
+It requires NumPy, which the game itself does not. A LogBatch holds the location id logs
+of any number of games in one array, with each game's log found through an array of
+offsets rather than padded to the longest, and every analysis is a handful of NumPy
+operations over the whole batch instead of a Python loop over its games. A batch is read
+from event journals (see event_journal.py), from the result of batch_runner.run_batch, or
+from plain id logs such as those returned by get_id_log. Run it from the repository root:
+
+    python project1/analytics.py [JOURNAL_FILE ...]
+
+prints a summary of the games recorded in the given journal files, or, without any, of a
+batch of the demo scripts in simulation.py simulated by batch_runner.
+
+Copyright and Usage Information
+===============================
+
+This file is provided solely for the personal and private use of students
+taking CSC111 at the University of Toronto St. George campus. All forms of
+distribution of this code, whether as given or with any changes, are
+expressly prohibited. For more information on copyright for CSC111 materials,
+please consult our Course Syllabus.
+
+This file is Copyright (c) 2026 CSC111 Teaching Team
+"""
+from __future__ import annotations
+import itertools
+import sys
+from typing import Iterable, Optional
+
+import numpy as np
+
+from batch_runner import BatchResult, run_batch
+from event_journal import read_journal, EVENT, REMOVE_EVENT, DEPOSIT, GO, TAKE
+from game_rules import DEFAULT_RULES, GameRules
+from simulation import DEMO_SCRIPTS
+
+
+def _int_array(values: Iterable[int], count: int = -1) -> np.ndarray:
+    """Return the given integers as a one-dimensional NumPy array of 64-bit integers."""
+    return np.fromiter(values, dtype=np.int64, count=count)
+
+
+class LogBatch:
+    """The location id logs of a batch of games, and what else is known about how each game went.
+
+    The logs are stored end to end in one array: the log of game i is ids[offsets[i]:offsets[i + 1]].
+
+    Instance Attributes:
+        - ids: the location id of every event of every game, game after game
+        - offsets: the index in ids of the first event of each game, followed by len(ids)
+        - scores: the player's score at every event, aligned with ids, or None if it is not known
+        - final_scores: the player's score at the end of each game, or None if it is not known
+        - moves: the number of moves made in each game, or None if it is not known
+        - won: whether each game was won, or None if it is not known
+
+    Representation Invariants:
+        - self.offsets[0] == 0 and self.offsets[-1] == len(self.ids)
+        - all games have at least one event: (np.diff(self.offsets) >= 1).all()
+        - self.scores is None or len(self.scores) == len(self.ids)
+        - self.final_scores is None or len(self.final_scores) == len(self)
+        - self.moves is None or len(self.moves) == len(self)
+        - self.won is None or len(self.won) == len(self)
+    """
+    ids: np.ndarray
+    offsets: np.ndarray
+    scores: Optional[np.ndarray]
+    final_scores: Optional[np.ndarray]
+    moves: Optional[np.ndarray]
+    won: Optional[np.ndarray]
+
+    def __init__(self, ids: np.ndarray, offsets: np.ndarray, scores: Optional[np.ndarray] = None,
+                 final_scores: Optional[np.ndarray] = None, moves: Optional[np.ndarray] = None,
+                 won: Optional[np.ndarray] = None) -> None:
+        """Initialize a new batch of the logs stored end to end in ids, starting at the given offsets.
+
+        If scores is given and final_scores is not, each game's final score is taken to be its score at its
+        last event.
+        """
+        self.ids = ids
+        self.offsets = offsets
+        self.scores = scores
+        if final_scores is None and scores is not None:
+            final_scores = scores[offsets[1:] - 1]
+        self.final_scores = final_scores
+        self.moves = moves
+        self.won = won
+
+    @classmethod
+    def from_id_logs(cls, id_logs: list[list[int]], scores: Optional[list[list[int]]] = None,
+                     final_scores: Optional[list[int]] = None, moves: Optional[list[int]] = None,
+                     won: Optional[list[bool]] = None) -> LogBatch:
+        """Return a batch of the given id logs, along with whatever else is known about each game.
+
+        Preconditions:
+            - all(len(id_log) >= 1 for id_log in id_logs)
+            - scores is None or [len(log) for log in scores] == [len(id_log) for id_log in id_logs]
+        """
+        lengths = _int_array(map(len, id_logs), len(id_logs))
+        offsets = np.zeros(len(id_logs) + 1, dtype=np.int64)
+        np.cumsum(lengths, out=offsets[1:])
+        total = int(offsets[-1])
+        return cls(_int_array(itertools.chain.from_iterable(id_logs), total), offsets,
+                   None if scores is None else _int_array(itertools.chain.from_iterable(scores), total),
+                   None if final_scores is None else np.array(final_scores, dtype=np.int64),
+                   None if moves is None else np.array(moves, dtype=np.int64),
+                   None if won is None else np.array(won, dtype=bool))
+
+    @classmethod
+    def from_batch(cls, batch: BatchResult) -> LogBatch:
+        """Return a batch of the games simulated by batch_runner.run_batch.
+
+        The simulation only keeps each game's final score, so the returned batch has no scores at each event.
+        """
+        results = batch.results
+        return cls.from_id_logs([result.id_log for result in results],
+                                final_scores=[result.score for result in results],
+                                moves=[result.moves for result in results],
+                                won=[result.won for result in results])
+
+    @classmethod
+    def from_journals(cls, journal_files: Iterable[str], rules: GameRules = DEFAULT_RULES) -> LogBatch:
+        """Return a batch of the games recorded in the given event journal files, one game per file, played by
+        the given rules.
+
+        Each game's score at each event is the sum of the points scored by the items picked up and deposited
+        before the event was added, its moves are its number of move records, and it was won if it met every
+        one of the rules' objectives.
+
+        Preconditions:
+            - every journal file records a game with at least one event
+        """
+        id_logs, scores, moves, won = [], [], [], []
+        for journal_file in journal_files:
+            id_log, score_log = [], []
+            score, num_moves, deposited = 0, 0, set()
+            for record in read_journal(journal_file):
+                kind = record[0]
+                if kind == EVENT:
+                    id_log.append(int(record[1]))
+                    score_log.append(score)
+                elif kind == GO:
+                    num_moves += 1
+                elif kind == TAKE and len(record) > 3:
+                    score += int(record[3])
+                elif kind == DEPOSIT:
+                    score += int(record[2])
+                    deposited.add(record[1])
+                elif kind == REMOVE_EVENT:
+                    id_log.pop()
+                    score_log.pop()
+            id_logs.append(id_log)
+            scores.append(score_log)
+            moves.append(num_moves)
+            won.append(len(rules.objectives) > 0 and deposited.issuperset(rules.objectives))
+        return cls.from_id_logs(id_logs, scores, moves=moves, won=won)
+
+    def __len__(self) -> int:
+        """Return the number of games in this batch."""
+        return len(self.offsets) - 1
+
+    def lengths(self) -> np.ndarray:
+        """Return the number of events of each game."""
+        return np.diff(self.offsets)
+
+    def _positions(self) -> tuple[np.ndarray, np.ndarray]:
+        """Return the game each event belongs to and the event's index within that game, aligned with ids."""
+        lengths = self.lengths()
+        games = np.repeat(np.arange(len(self)), lengths)
+        return games, np.arange(len(self.ids)) - np.repeat(self.offsets[:-1], lengths)
+
+    def padded_ids(self, fill: int = -1) -> np.ndarray:
+        """Return a two-dimensional array whose row i is the id log of game i, padded with fill to the length of
+        the longest log.
+
+        >>> LogBatch.from_id_logs([[1, 5], [1]]).padded_ids()
+        array([[ 1,  5],
+               [ 1, -1]])
+        """
+        padded = np.full((len(self), int(self.lengths().max(initial=0))), fill, dtype=np.int64)
+        padded[self._positions()] = self.ids
+        return padded
+
+    def visit_histogram(self, num_locations: int = 0) -> np.ndarray:
+        """Return the number of events at each location id, in an array of at least num_locations entries.
+
+        >>> LogBatch.from_id_logs([[1, 5, 1], [1, 2]]).visit_histogram()
+        array([0, 3, 1, 0, 0, 1])
+        """
+        return np.bincount(self.ids, minlength=num_locations)
+
+    def transitions(self) -> tuple[np.ndarray, np.ndarray, np.ndarray]:
+        """Return the distinct (source id, destination id) pairs of consecutive events of the same game, sorted,
+        and how many times each pair occurs, as three aligned arrays.
+
+        Staying at a location, for a menu command or an item command, counts as going from it to itself.
+
+        >>> sources, destinations, counts = LogBatch.from_id_logs([[1, 5, 1], [1, 5]]).transitions()
+        >>> sources.tolist(), destinations.tolist(), counts.tolist()
+        ([1, 5], [5, 1], [2, 1])
+        """
+        # Every pair of neighbours in ids except those that straddle two games
+        same_game = np.ones(max(len(self.ids) - 1, 0), dtype=bool)
+        same_game[self.offsets[1:-1] - 1] = False
+        sources, destinations = self.ids[:-1][same_game], self.ids[1:][same_game]
+
+        width = int(self.ids.max(initial=0)) + 1
+        pairs, counts = np.unique(sources * width + destinations, return_counts=True)
+        return pairs // width, pairs % width, counts
+
+    def transition_matrix(self, num_locations: int = 0, normalize: bool = False) -> np.ndarray:
+        """Return the matrix whose entry [i, j] is the number of times a game went from location i to location j,
+        or, if normalize is True, the fraction of the events at i that were followed by one at j.
+
+        The matrix is dense, with at least num_locations rows and columns, so it suits worlds of up to a few
+        thousand locations; use transitions for larger worlds.
+
+        >>> LogBatch.from_id_logs([[0, 1, 1], [0, 0]]).transition_matrix(normalize=True)
+        array([[0.5, 0.5],
+               [0. , 1. ]])
+        """
+        sources, destinations, counts = self.transitions()
+        size = max(num_locations, int(self.ids.max(initial=-1)) + 1)
+        matrix = np.zeros((size, size), dtype=np.float64 if normalize else np.int64)
+        matrix[sources, destinations] = counts
+        if normalize:
+            totals = matrix.sum(axis=1, keepdims=True)
+            np.divide(matrix, totals, out=matrix, where=totals > 0)
+        return matrix
+
+    def score_curves(self) -> np.ndarray:
+        """Return a two-dimensional array whose row i is game i's score at each of its events, padded with its
+        final score to the length of the longest log.
+
+        Raise ValueError if this batch has no scores at each event.
+
+        >>> LogBatch.from_id_logs([[1, 15, 15], [1]], scores=[[0, 0, 10], [0]]).score_curves()
+        array([[ 0,  0, 10],
+               [ 0,  0,  0]])
+        """
+        if self.scores is None:
+            raise ValueError("this batch has no scores at each event")
+        padded = np.repeat(self.final_scores[:, np.newaxis], int(self.lengths().max(initial=0)), axis=1)
+        padded[self._positions()] = self.scores
+        return padded
+
+    def mean_score_curve(self) -> np.ndarray:
+        """Return the mean score over all games at each event index, each game keeping its final score once its
+        log has ended.
+
+        Raise ValueError if this batch has no scores at each event.
+        """
+        return self.score_curves().mean(axis=0)
+
+    def events_to_first_score(self) -> np.ndarray:
+        """Return the index of the first event of each game at which its score was positive, or -1 for a game that
+        never scored.
+
+        Raise ValueError if this batch has no scores at each event.
+
+        >>> LogBatch.from_id_logs([[1, 15, 15], [1]], scores=[[0, 0, 10], [0]]).events_to_first_score()
+        array([ 2, -1])
+        """
+        if self.scores is None:
+            raise ValueError("this batch has no scores at each event")
+        # Each scoring event's index in ids, and len(ids) for every other event, so the smallest in each game is
+        # its first scoring event if it has one
+        indexes = np.where(self.scores > 0, np.arange(len(self.ids)), len(self.ids))
+        first = np.minimum.reduceat(indexes, self.offsets[:-1]) if len(self) > 0 else indexes[:0]
+        return np.where(first < len(self.ids), first - self.offsets[:-1], -1)
+
+    def win_rate_by_moves(self) -> tuple[np.ndarray, np.ndarray]:
+        """Return, for each number of moves m from 0 to the most moves made in any game, the number of games that
+        ended after exactly m moves, and the fraction of them that were won (NaN where there are none).
+
+        Raise ValueError if this batch does not know the moves made in, and the outcome of, each game.
+
+        >>> games, win_rate = LogBatch.from_id_logs([[1], [1], [1]], moves=[2, 2, 1],
+        ...                                         won=[True, False, False]).win_rate_by_moves()
+        >>> games.tolist(), win_rate.tolist()
+        ([0, 1, 2], [nan, 0.0, 0.5])
+        """
+        if self.moves is None or self.won is None:
+            raise ValueError("this batch does not know the moves and outcome of each game")
+        games = np.bincount(self.moves)
+        wins = np.bincount(self.moves, weights=self.won, minlength=len(games))
+        win_rate = np.full(len(games), np.nan)
+        np.divide(wins, games, out=win_rate, where=games > 0)
+        return games, win_rate
+
+
+def summarize(batch: LogBatch, top: int = 5) -> list[str]:
+    """Return the lines of a short summary of the given batch, listing the top most visited locations and most
+    frequent moves between different locations."""
+    lines = [f"{len(batch)} games, {len(batch.ids)} events"]
+
+    visits = batch.visit_histogram()
+    busiest = np.argsort(visits, kind='stable')[::-1][:top]
+    lines.append("Most visited locations: " + ", ".join(f"{loc_id} ({visits[loc_id]})" for loc_id in busiest
+                                                         if visits[loc_id] > 0))
+
+    sources, destinations, counts = batch.transitions()
+    moved = sources != destinations
+    sources, destinations, counts = sources[moved], destinations[moved], counts[moved]
+    frequent = np.argsort(counts, kind='stable')[::-1][:top]
+    lines.append("Most frequent moves: " + ", ".join(f"{sources[i]} -> {destinations[i]} ({counts[i]})"
+                                                      for i in frequent))
+
+    if batch.final_scores is not None:
+        lines.append(f"Mean final score: {batch.final_scores.mean():.2f}")
+    if batch.scores is not None:
+        first = batch.events_to_first_score()
+        scored = first[first >= 0]
+        if len(scored) > 0:
+            lines.append(f"Games that scored: {len(scored)}, after {scored.mean():.1f} events on average")
+    if batch.won is not None and batch.moves is not None:
+        games, win_rate = batch.win_rate_by_moves()
+        lines.append(f"Games won: {int(batch.won.sum())}")
+        lines.append("Win rate by moves: " + ", ".join(f"{moves}: {win_rate[moves]:.2f} of {games[moves]}"
+                                                        for moves in np.flatnonzero(games)))
+    return lines
+
+
+if __name__ == "__main__":
+    # When you are ready to check your work with python_ta, uncomment the following lines.
+    # (Delete the "#" and space before each line.)
+    # IMPORTANT: keep this code indented inside the "if __name__ == '__main__'" block
+    # import python_ta
+    # python_ta.check_all(config={
+    #     'max-line-length': 120,
+    #     'disable': ['R1705', 'E9998', 'E9999', 'static_type_checker']
+    # })
+
+    if len(sys.argv) > 1:
+        log_batch = LogBatch.from_journals(sys.argv[1:])
+    else:
+        log_batch = LogBatch.from_batch(run_batch('project1/game_data.json', 1, list(DEMO_SCRIPTS.values()) * 1000))
+    for line in summarize(log_batch):
+        print(line)
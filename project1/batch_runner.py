@@ -0,0 +1,176 @@
+"""CSC111 Project 1: Text Adventure Game - Batch Runner
+
+Instructions (READ THIS FIRST!)
+===============================
+
+This Python module contains code for Project 1 that replays many command scripts
+against the same game world, for example to check that a whole set of walkthroughs
+still produce the expected location logs after the game data changes.
+
+The game data file is loaded once into a GameWorld, and the scripts are spread
+across a pool of worker processes. Each worker receives the world when it starts and
+every script it simulates shares it, so no script has to open or parse the JSON file again.
+With a cache, each worker also keeps a SimulationCache (see simulation_cache.py), so a
+script that shares a prefix with one the worker simulated before only simulates the rest.
+
+Copyright and Usage Information
+===============================
+
+This file is provided solely for the personal and private use of students
+taking CSC111 at the University of Toronto St. George campus. All forms of
+distribution of this code, whether as given or with any changes, are
+expressly prohibited. For more information on copyright for CSC111 materials,
+please consult our Course Syllabus.
+
+This file is Copyright (c) 2026 CSC111 Teaching Team
+"""
+from __future__ import annotations
+import multiprocessing
+import time
+from dataclasses import dataclass
+from typing import Optional
+
+from adventure import is_won
+from game_world import GameWorld
+from output_sink import NullSink
+from simulation import AdventureGameSimulation
+from simulation_cache import SimulationCache
+
+
+@dataclass
+class ScriptResult:
+    """The outcome of simulating one command script.
+
+    Instance Attributes:
+        - id_log: The location IDs visited during the simulation, as returned by get_id_log
+        - score: The player's score after the last command
+        - moves: The number of moves the player made
+        - deposited_items: The names of the items deposited during the simulation
+        - won: Whether the game had been won by the end of the simulation
+
+    Representation Invariants:
+        - len(self.id_log) >= 1
+        - self.score >= 0
+        - self.moves >= 0
+    """
+    id_log: list[int]
+    score: int
+    moves: int
+    deposited_items: set[str]
+    won: bool
+
+
+@dataclass
+class BatchResult:
+    """The outcome of simulating a batch of command scripts.
+
+    Instance Attributes:
+        - results: One ScriptResult per script, in the same order as the scripts were given
+        - elapsed: Wall-clock time in seconds spent simulating the batch, including pool start-up
+
+    Representation Invariants:
+        - self.elapsed >= 0
+    """
+    results: list[ScriptResult]
+    elapsed: float
+
+    def scripts_per_second(self) -> float:
+        """Return the throughput of this batch, in scripts simulated per second."""
+        if self.elapsed == 0:
+            return float('inf')
+        return len(self.results) / self.elapsed
+
+
+# The game world, starting location and simulation cache (if any), set once in each worker process by _init_worker.
+_worker_data: Optional[tuple[str, int, GameWorld, Optional[SimulationCache]]] = None
+
+
+def _init_worker(game_data_file: str, initial_location_id: int, world: GameWorld,
+                 cache_bytes: Optional[int] = None) -> None:
+    """Remember the shared game world in this worker process, and start a simulation cache with a memory cap of
+    cache_bytes if it is given."""
+    global _worker_data
+    cache = None
+    if cache_bytes is not None:
+        cache = SimulationCache(game_data_file, initial_location_id, world, cache_bytes)
+    _worker_data = (game_data_file, initial_location_id, world, cache)
+
+
+def _simulate(game_data_file: str, initial_location_id: int, world: GameWorld, commands: list[str]) -> ScriptResult:
+    """Simulate the given commands on a new game in the given world and return the outcome."""
+    sim = AdventureGameSimulation(game_data_file, initial_location_id, commands, world, sink=NullSink())
+    game = sim.get_game()
+    return ScriptResult(sim.get_id_log(), game.score, game.moves, set(game.deposited_items), is_won(game))
+
+
+def _simulate_cached(cache: SimulationCache, commands: list[str]) -> ScriptResult:
+    """Simulate the given commands with the given cache and return the outcome."""
+    id_log, game = cache.simulate(commands)
+    return ScriptResult(id_log, game.score, game.moves, set(game.deposited_items), is_won(game))
+
+
+def _run_chunk(scripts: list[list[str]]) -> list[ScriptResult]:
+    """Simulate a chunk of scripts in a worker process, discarding everything the game prints."""
+    game_data_file, initial_location_id, world, cache = _worker_data
+    if cache is not None:
+        return [_simulate_cached(cache, commands) for commands in scripts]
+    return [_simulate(game_data_file, initial_location_id, world, commands) for commands in scripts]
+
+
+def run_batch(game_data_file: str, initial_location_id: int, scripts: list[list[str]],
+              processes: Optional[int] = None, chunk_size: int = 64,
+              cache_bytes: Optional[int] = None) -> BatchResult:
+    """Simulate every command script in scripts, starting at initial_location_id, and return the outcomes.
+
+    game_data_file is loaded once into a GameWorld shared by every script. The scripts are split into
+    chunks of chunk_size and simulated by a pool of the given number of worker processes (by default,
+    one per CPU). If processes is 1, the scripts are simulated in this process instead, without
+    starting a pool.
+
+    If cache_bytes is given, each worker keeps a SimulationCache with that memory cap for all the chunks it
+    simulates, so scripts that share long prefixes are only simulated from where they differ. Scripts that
+    share prefixes should then be next to each other in scripts, so they land in the same chunk.
+
+    Preconditions:
+        - game_data_file is the filename of a valid game data JSON file
+        - every script in scripts satisfies the preconditions of AdventureGameSimulation
+        - processes is None or processes >= 1
+        - chunk_size >= 1
+    """
+    start = time.perf_counter()
+
+    world = GameWorld.load(game_data_file)
+
+    chunks = [scripts[i:i + chunk_size] for i in range(0, len(scripts), chunk_size)]
+    if processes == 1:
+        _init_worker(game_data_file, initial_location_id, world, cache_bytes)
+        chunk_results = [_run_chunk(chunk) for chunk in chunks]
+    else:
+        with multiprocessing.Pool(processes, _init_worker,
+                                  (game_data_file, initial_location_id, world, cache_bytes)) as pool:
+            chunk_results = pool.map(_run_chunk, chunks)
+
+    results = [result for chunk in chunk_results for result in chunk]
+    return BatchResult(results, time.perf_counter() - start)
+
+
+if __name__ == "__main__":
+    # When you are ready to check your work with python_ta, uncomment the following lines.
+    # (Delete the "#" and space before each line.)
+    # IMPORTANT: keep this code indented inside the "if __name__ == '__main__'" block
+    import python_ta
+    python_ta.check_all(config={
+        'max-line-length': 120,
+        'disable': ['R1705', 'E9998', 'E9999', 'static_type_checker']
+    })
+
+    demo_scripts = [
+        ["go south", "go south", "go east", "go east", "pick up usb drive", "inventory"],
+        ["go south", "go north"] * 25,
+        ["go east", "go west", "go south"]
+    ] * 2000
+    batch = run_batch('project1/game_data.json', 1, demo_scripts)
+    print("Simulated", len(batch.results), "scripts in", round(batch.elapsed, 3), "seconds")
+    print("Throughput:", round(batch.scripts_per_second()), "scripts/second")
+    assert batch.results[0].id_log == [1, 5, 9, 10, 11, 11, 11]
+    assert batch.results[1].moves == 50
@@ -0,0 +1,660 @@
+"""CSC111 Project 1: Text Adventure Game - Benchmarks
+
+Instructions (READ THIS FIRST!)
+===============================
+
+This Python module contains timing benchmarks for Project 1. Run it from the
+repository root (the same place the other modules are run from).
+
+    python project1/benchmarks.py [results.json]
+
+runs the benchmark suite: loading game data (eagerly, lazily with and without an index
+sidecar, and from a compiled file), simulating, listing available actions and growing,
+shrinking and reading event logs, each at several world and log sizes, simulating with
+instrumentation enabled (see instrumentation.py) and as a stream, fuzzing the two game
+engines (see fuzzer.py) and running a regression suite of similar scripts with and
+without a prefix cache (see simulation_cache.py). It prints a table and saves the results
+as JSON (by default to benchmark_results.json), with sorted keys and one measurement per
+line, so results from two commits can be diffed directly or compared with
+
+    python project1/benchmarks.py compare old_results.json new_results.json
+
+which lists every measurement that got more than 10% slower.
+
+    python project1/benchmarks.py startup
+
+measures how long importing the adventure module and starting the game with play.py take,
+and exits with status 1 if either is over its budget in STARTUP_BUDGETS. Finally,
+
+    python project1/benchmarks.py extras
+
+runs the one-off studies behind earlier optimizations: command parsing, event log memory,
+output sinks and journal replay.
+
+A simulation stops once its game is won or lost, and most scripts here are far longer than
+the stock game's move limit, so they are simulated in copies of the stock game data (and
+grid worlds) whose rules have no move limit; see endless_stock_data.
+
+Copyright and Usage Information
+===============================
+
+This file is provided solely for the personal and private use of students
+taking CSC111 at the University of Toronto St. George campus. All forms of
+distribution of this code, whether as given or with any changes, are
+expressly prohibited. For more information on copyright for CSC111 materials,
+please consult our Course Syllabus.
+
+This file is Copyright (c) 2026 CSC111 Teaching Team
+"""
+from __future__ import annotations
+import collections
+import gc
+import json
+import os
+import platform
+import random
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+import timeit
+import tracemalloc
+from typing import Any, Callable
+
+from adventure import AdventureGame
+from batch_runner import run_batch
+from compiled_world import compile_world, load_compiled_world
+from command_parser import GO, MOVE_VERBS, PICK_UP, DROP, DEPOSIT, UNKNOWN, parse_command
+from event_journal import EventJournal
+from event_logger import Event, EventList, CompactEventList
+from fuzzer import fuzz
+import instrumentation
+from game_world import GameWorld
+from lazy_world import INDEX_SUFFIX, load_lazy_world
+from output_sink import OutputSink, StdoutSink, ListSink, NullSink
+from simulation import AdventureGameSimulation, SimulationStream
+from simulation_cache import DEFAULT_MAX_BYTES
+
+# A mix of commands like the ones in the simulation walkthroughs, including one menu command
+# and one command that no verb matches.
+SAMPLE_COMMANDS = [
+    "go south", "go east", "pick up lucky mug", "pick up t-card", "drop lucky mug",
+    "deposit laptop charger", "go north", "inventory", "deposit drop box", "jump"
+]
+
+
+def _route_by_substring(command: str) -> tuple[str, str]:
+    """Return the verb and argument of command the way the game routed commands before command_parser:
+    by testing for each verb as a substring in turn and slicing off a fixed-length prefix."""
+    if "pick up " in command:
+        return PICK_UP, command[8:]
+    elif "drop " in command:
+        return DROP, command[5:]
+    elif "deposit " in command:
+        return DEPOSIT, command[8:]
+    elif "go " in command:
+        return GO, command[3:]
+    else:
+        return UNKNOWN, ''
+
+
+def bench_command_parsing(commands: list[str], number: int = 100_000, repeat: int = 5) -> dict[str, float]:
+    """Return the best time, in nanoseconds per command, to route each of the given commands with
+    parse_command (both uncached and cached) and with the old substring tests.
+
+    Each measurement routes every command in commands number times; the best of repeat measurements is kept.
+    """
+    parse_uncached = parse_command.__wrapped__
+
+    def parse_all_uncached() -> None:
+        """Parse every command once, bypassing the parse cache."""
+        for command in commands:
+            parse_uncached(command)
+
+    def parse_all() -> None:
+        """Parse every command once."""
+        for command in commands:
+            parse_command(command)
+
+    def route_all() -> None:
+        """Route every command once by substring tests."""
+        for command in commands:
+            _route_by_substring(command)
+
+    results = {}
+    for name, func in [('parse_command_uncached', parse_all_uncached), ('parse_command', parse_all),
+                       ('substring_routing', route_all)]:
+        best = min(timeit.repeat(func, number=number, repeat=repeat))
+        results[name] = best / (number * len(commands)) * 1e9
+    return results
+
+
+def bench_event_log_memory(world: GameWorld, num_events: int,
+                           log_types: tuple[Callable, ...] = (EventList, CompactEventList)) -> dict[str, dict]:
+    """Return the memory used by each of the given kinds of event log once it holds num_events events.
+
+    The events cycle through the world's locations, each reached by a "go" command, the way a long
+    simulation would record them. The result maps each log type's name to its total size in bytes
+    and its size in bytes per event.
+    """
+    locations = list(world.locations.values())
+    results = {}
+    for log_type in log_types:
+        gc.collect()
+        tracemalloc.start()
+        before = tracemalloc.get_traced_memory()[0]
+
+        log = log_type()
+        log.add_event(Event(locations[0].id_num, locations[0].long_description))
+        for i in range(1, num_events):
+            location = locations[i % len(locations)]
+            log.add_event(Event(location.id_num, location.long_description), "go " + location.name.lower())
+
+        size = tracemalloc.get_traced_memory()[0] - before
+        tracemalloc.stop()
+        results[log_type.__name__] = {'bytes': size, 'bytes_per_event': size / num_events}
+        del log
+    return results
+
+
+def long_script(num_commands: int) -> list[str]:
+    """Return a script of num_commands commands for the stock game, starting at location 1, that walks to
+    Second Cup and then keeps picking up, dropping and walking away from the Lucky Mug."""
+    walk = ["go south", "go south", "go east", "go east", "go east", "go north", "go north"]
+    cycle = ["pick up lucky mug", "drop lucky mug", "go south", "go north"]
+    script = walk + cycle * ((num_commands - len(walk)) // len(cycle) + 1)
+    return script[:num_commands]
+
+
+def prefix_scripts(num_scripts: int, num_commands: int, seed: int = 111) -> list[list[str]]:
+    """Return num_scripts scripts, like a regression suite of variations on one walkthrough: each is a prefix of
+    long_script(num_commands) at least half as long, followed by one menu command. Scripts sharing longer prefixes
+    come first."""
+    rng = random.Random(seed)
+    script = long_script(num_commands)
+    lengths = sorted((rng.randint(num_commands // 2, num_commands) for _ in range(num_scripts)), reverse=True)
+    return [script[:length] + [rng.choice(["look", "inventory", "score"])] for length in lengths]
+
+
+def bench_journal_replay(game_data_file: str, commands: list[str]) -> dict[str, float]:
+    """Return the time in seconds to simulate the given commands from location 1, to simulate them while
+    journaling, and to rebuild the final game state from that journal: on its own, with an EventList and
+    with a CompactEventList.
+
+    Everything the simulations say goes to a NullSink.
+    """
+    world = GameWorld.load(game_data_file)
+    fd, journal_file = tempfile.mkstemp(suffix='.journal')
+    os.close(fd)
+    results = {}
+    try:
+        gc.collect()
+        start = time.perf_counter()
+        AdventureGameSimulation(game_data_file, 1, commands, world, sink=NullSink())
+        results['simulate'] = time.perf_counter() - start
+
+        gc.collect()
+        start = time.perf_counter()
+        with EventJournal(journal_file, batch_size=4096, fsync_interval=None) as journal:
+            AdventureGameSimulation(game_data_file, 1, commands, world, journal=journal, sink=NullSink())
+        results['simulate_with_journal'] = time.perf_counter() - start
+
+        for name, events in [('replay_state_only', None), ('replay_with_event_list', EventList()),
+                             ('replay_with_compact_event_list', CompactEventList())]:
+            gc.collect()
+            start = time.perf_counter()
+            AdventureGame.from_journal(game_data_file, journal_file, events, world)
+            results[name] = time.perf_counter() - start
+    finally:
+        os.remove(journal_file)
+    return results
+
+
+def bench_sinks(game_data_file: str, scripts: list[list[str]]) -> dict[str, float]:
+    """Return the throughput, in scripts per second, of simulating and then running every script in scripts
+    from location 1 with each kind of output sink.
+
+    The stdout sinks write to os.devnull, so the numbers measure formatting and write calls rather than
+    the terminal. 'stdout_unbuffered' writes every message as soon as it is said, the way print did.
+    """
+    world = GameWorld.load(game_data_file)
+    results = {}
+    with open(os.devnull, 'w') as devnull:
+        sink_factories: list[tuple[str, Callable[[], OutputSink]]] = [
+            ('stdout_unbuffered', lambda: StdoutSink(devnull, buffer_size=1)),
+            ('stdout', lambda: StdoutSink(devnull)),
+            ('list', ListSink),
+            ('null', NullSink)
+        ]
+        for name, make_sink in sink_factories:
+            gc.collect()
+            start = time.perf_counter()
+            for commands in scripts:
+                AdventureGameSimulation(game_data_file, 1, commands, world, sink=make_sink()).run()
+            results[name] = len(scripts) / (time.perf_counter() - start)
+    return results
+
+
+# The sizes the benchmark suite runs at: worlds of these many locations (the stock world for 13, grids
+# otherwise), scripts of these many commands, event logs of these many events, this many fuzzed command sequences and
+# a regression suite of this many variations on one walkthrough of this many commands
+SUITE_WORLD_SIZES = (13, 1_000, 10_000, 100_000)
+SUITE_SCRIPT_SIZES = (1_000, 100_000)
+SUITE_LOG_SIZES = (1_000, 100_000, 1_000_000)
+SUITE_FUZZ_SEQUENCES = 1_000
+SUITE_PREFIX_SCRIPTS = (1_000, 1_000)  # number of scripts, length of the walkthrough they are variations on
+
+# A measurement whose fastest time grew by more than this factor counts as a regression
+REGRESSION_THRESHOLD = 1.10
+
+# The most time, in seconds, that importing the adventure module and starting the game with play.py until it first
+# asks for a command may take
+STARTUP_BUDGETS = {'startup.import/adventure': 0.1, 'startup.first_prompt/locations=13': 0.5}
+
+
+def _measure(run: Callable[[Any], object], setup: Callable[[], Any] = lambda: None,
+             repeat: int = 5) -> dict[str, float]:
+    """Return timing and memory statistics of run(setup()).
+
+    run is timed repeat times, each time on a fresh result of setup, which is not timed. The result maps
+    'min_s' and 'median_s' to the fastest and median times in seconds, and 'peak_bytes' to the most memory
+    run had allocated at once during one more call made under tracemalloc.
+    """
+    times = []
+    for _ in range(repeat):
+        arg = setup()
+        gc.collect()
+        start = time.perf_counter()
+        run(arg)
+        times.append(time.perf_counter() - start)
+
+    arg = setup()
+    gc.collect()
+    tracemalloc.start()
+    run(arg)
+    peak = tracemalloc.get_traced_memory()[1]
+    tracemalloc.stop()
+    return {'min_s': float(f'{min(times):.4g}'), 'median_s': float(f'{statistics.median(times):.4g}'),
+            'peak_bytes': peak}
+
+
+def endless_stock_data() -> dict[str, Any]:
+    """Return the stock game data, in the format of game_data.json, with the move limit left out of its rules, so
+    that a game in it is never lost however many commands are simulated."""
+    with open('project1/game_data.json') as f:
+        data = json.load(f)
+    data['rules']['move_limit'] = None
+    return data
+
+
+def write_endless_stock_data(directory: str) -> str:
+    """Write endless_stock_data() to a file in directory and return the file's name."""
+    filename = os.path.join(directory, 'game_data_endless.json')
+    with open(filename, 'w') as f:
+        json.dump(endless_stock_data(), f, indent=2)
+    return filename
+
+
+def grid_world_data(num_locations: int) -> dict:
+    """Return game data, in the format of game_data.json, for a roughly square grid of num_locations locations
+    numbered row by row from 1, each joined to its neighbours by go north, go south, go east and go west.
+
+    The stock game's items are spread over the grid, with the Lucky Mug at location 1, and the grid plays by the
+    stock game's rules without a move limit.
+
+    Preconditions:
+        - num_locations >= 16
+    """
+    width = int(num_locations ** 0.5)
+    locations = []
+    for loc_id in range(1, num_locations + 1):
+        row, column = divmod(loc_id - 1, width)
+        commands = {}
+        if row > 0:
+            commands['go north'] = loc_id - width
+        if loc_id + width <= num_locations:
+            commands['go south'] = loc_id + width
+        if column > 0:
+            commands['go west'] = loc_id - 1
+        if column < width - 1 and loc_id < num_locations:
+            commands['go east'] = loc_id + 1
+        locations.append({
+            'id': loc_id, 'name': f'Room {loc_id}',
+            'brief_description': f'LOCATION {loc_id} - You are in room {loc_id}.\n',
+            'long_description': f'LOCATION {loc_id} - Room {loc_id}\n\nYou are in room {loc_id} of the grid.\n',
+            'available_commands': commands, 'items': [], 'visited': False
+        })
+
+    stock_data = endless_stock_data()
+    stock = GameWorld.from_data(stock_data)
+    items = []
+    for i, item in enumerate(stock.items):
+        start = 1 if item.name == 'Lucky Mug' else (i + 1) * num_locations // (len(stock.items) + 1)
+        locations[start - 1]['items'].append(item.name)
+        items.append({'name': item.name, 'description': item.description, 'start_position': start,
+                      'target_position': item.target_position, 'target_points': item.target_points})
+    return {'locations': locations, 'items': items, 'rules': stock_data['rules']}
+
+
+def walk_script(world: GameWorld, num_commands: int, seed: int = 111) -> list[str]:
+    """Return a script of num_commands commands for a game starting at location 1 of world: it picks up the
+    Lucky Mug there, then wanders at random, every so often dropping the mug and picking it up again.
+
+    The walk never tries to enter a locked location, so every go command in it succeeds.
+
+    Preconditions:
+        - 'Lucky Mug' in world.locations[1].items
+    """
+    rng = random.Random(seed)
+    script = ['pick up lucky mug']
+    loc_id = 1
+    while len(script) < num_commands:
+        if len(script) % 20 == 0:
+            script.extend(['drop lucky mug', 'pick up lucky mug'])
+            continue
+        options = [(command, next_id) for command, next_id in world.locations[loc_id].available_commands.items()
+                   if parse_command(command).verb in MOVE_VERBS and next_id not in world.rules.locks]
+        command, loc_id = rng.choice(options)
+        script.append(command)
+    return script[:num_commands]
+
+
+def _suite_world(num_locations: int, directory: str) -> tuple[str, GameWorld, list[str]]:
+    """Return the game data filename, loaded world and a 10,000-command script of the suite world with
+    num_locations locations, writing its game data to a file in directory."""
+    if num_locations == 13:
+        filename = write_endless_stock_data(directory)
+        return filename, GameWorld.load(filename), long_script(10_000)
+    filename = os.path.join(directory, f'grid_{num_locations}.json')
+    with open(filename, 'w') as f:
+        json.dump(grid_world_data(num_locations), f)
+    world = GameWorld.load(filename)
+    return filename, world, walk_script(world, 10_000)
+
+
+def _filled_log(log_type: type, num_events: int, world: GameWorld) -> EventList | CompactEventList:
+    """Return a new log of the given type holding num_events events that cycle through world's locations."""
+    locations = list(world.locations.values())
+    log = log_type()
+    log.add_event(Event(locations[0].id_num, locations[0].long_description))
+    for i in range(1, num_events):
+        location = locations[i % len(locations)]
+        log.add_event(Event(location.id_num, location.long_description), "go " + location.name.lower())
+    return log
+
+
+def _bench_world(results: dict[str, dict], num_locations: int, directory: str, repeat: int) -> None:
+    """Add the suite's measurements of the world with num_locations locations to results."""
+    filename, world, script = _suite_world(num_locations, directory)
+    size = f'locations={num_locations}'
+
+    results[f'load_game_data/{size}'] = _measure(lambda _: AdventureGame._load_game_data(filename), repeat=repeat)
+
+    def remove_index() -> None:
+        """Remove the world's location index sidecar, so the next lazy load has to scan the file."""
+        if os.path.exists(filename + INDEX_SUFFIX):
+            os.remove(filename + INDEX_SUFFIX)
+
+    results[f'load_game_data.lazy_scan/{size}'] = _measure(lambda _: load_lazy_world(filename), remove_index, repeat)
+    results[f'load_game_data.lazy/{size}'] = _measure(lambda _: load_lazy_world(filename), repeat=repeat)
+    compile_world(filename)
+    results[f'load_game_data.compiled/{size}'] = _measure(lambda _: load_compiled_world(filename), repeat=repeat)
+    results[f'simulation/{size}/commands={len(script)}'] = _measure(
+        lambda _: AdventureGameSimulation(filename, 1, script, world, sink=NullSink()), repeat=repeat)
+
+    played_game = AdventureGameSimulation(filename, 1, script, world, sink=NullSink()).get_game()
+    snapshot = played_game.snapshot()
+    results[f'snapshot.x1000/{size}/commands={len(script)}'] = _measure(
+        lambda _: [played_game.snapshot() for _ in range(1000)], repeat=repeat)
+    results[f'restore.x1000/{size}/commands={len(script)}'] = _measure(
+        lambda game: [game.restore(snapshot) for _ in range(1000)], lambda: AdventureGame(filename, 1, world), repeat)
+
+    def new_simulation() -> AdventureGameSimulation:
+        """Return a simulation that has only run the script's first command."""
+        return AdventureGameSimulation(filename, 1, script[:1], world, sink=NullSink())
+
+    results[f'generate_events/{size}/commands={len(script) - 1}'] = _measure(
+        lambda sim: sim.generate_events(script[1:], sim.get_game().get_location()), new_simulation, repeat)
+
+    def list_all_actions(game: AdventureGame) -> None:
+        """List the available actions at every location of game's world."""
+        for loc_id in world.locations:
+            game.get_available_actions(game.get_location(loc_id))
+
+    def new_game_in_new_world() -> AdventureGame:
+        """Return a new game in a new copy of the world, with none of its action tables built yet."""
+        return AdventureGame(filename, 1, GameWorld(world.locations, world.items))
+
+    def warmed_up_game() -> AdventureGame:
+        """Return a new game whose actions at every location have already been listed once."""
+        game = AdventureGame(filename, 1, world)
+        list_all_actions(game)
+        return game
+
+    results[f'get_available_actions.cold/{size}'] = _measure(list_all_actions, new_game_in_new_world, repeat)
+    results[f'get_available_actions.warm/{size}'] = _measure(list_all_actions, warmed_up_game, repeat)
+
+
+def _bench_log(results: dict[str, dict], log_type: type, num_events: int, world: GameWorld, repeat: int) -> None:
+    """Add the suite's measurements of a log of the given type holding num_events events to results."""
+    name = f'{log_type.__name__}.{{}}/events={num_events}'
+
+    def empty(log: EventList | CompactEventList) -> None:
+        """Remove every event from log, one at a time."""
+        while not log.is_empty():
+            log.remove_last_event()
+
+    results[name.format('add_event')] = _measure(lambda _: _filled_log(log_type, num_events, world), repeat=repeat)
+    results[name.format('remove_last_event')] = _measure(
+        empty, lambda: _filled_log(log_type, num_events, world), repeat)
+    results[name.format('get_id_log')] = _measure(
+        lambda log: log.get_id_log(), lambda: _filled_log(log_type, num_events, world), repeat)
+
+
+def _bench_stock(results: dict[str, dict], script_sizes: tuple[int, ...], log_sizes: tuple[int, ...],
+                 directory: str, repeat: int) -> None:
+    """Add the suite's measurements of scripts, event logs, fuzzing and batches in the stock world to results,
+    writing the stock game data without a move limit to a file in directory for the scripts to run in full."""
+    filename = write_endless_stock_data(directory)
+    stock_world = GameWorld.load(filename)
+    for num_commands in script_sizes:
+        script = long_script(num_commands)
+        results[f'simulation/locations=13/commands={num_commands}'] = _measure(
+            lambda _: AdventureGameSimulation(filename, 1, script, stock_world, sink=NullSink()), repeat=repeat)
+
+        def simulate_instrumented(_: object) -> None:
+            """Simulate script with instrumentation enabled."""
+            instrumentation.enable()
+            try:
+                AdventureGameSimulation(filename, 1, script, stock_world, sink=NullSink())
+            finally:
+                instrumentation.disable()
+
+        # The simulation above runs with instrumentation disabled, so what the disabled checks cost shows up there
+        # as a regression when results are compared with those of an earlier commit
+        results[f'simulation.instrumented/locations=13/commands={num_commands}'] = _measure(simulate_instrumented,
+                                                                                         repeat=repeat)
+
+        # Streaming the same commands, without keeping the events, takes the same memory for any number of them
+        results[f'simulation.stream/locations=13/commands={num_commands}'] = _measure(
+            lambda _: collections.deque(SimulationStream(filename, 1, iter(script), stock_world, NullSink()), maxlen=0),
+            repeat=repeat)
+
+    for log_type in (EventList, CompactEventList):
+        for num_events in log_sizes:
+            _bench_log(results, log_type, num_events, stock_world, repeat)
+
+    # Fuzzing throughput, in one process so it does not depend on the number of CPUs, by the stock game's own rules
+    played_world = GameWorld.load('project1/game_data.json')
+    results[f'fuzz/locations=13/sequences={SUITE_FUZZ_SEQUENCES}'] = _measure(
+        lambda _: fuzz('project1/game_data.json', played_world, SUITE_FUZZ_SEQUENCES, seed=111), repeat=repeat)
+
+    # A regression suite of scripts sharing long prefixes, simulated from scratch and with a prefix cache
+    num_scripts, num_commands = SUITE_PREFIX_SCRIPTS
+    scripts = prefix_scripts(num_scripts, num_commands)
+    name = f'{{}}/locations=13/scripts={num_scripts}/commands={num_commands}'
+    results[name.format('batch')] = _measure(lambda _: run_batch(filename, 1, scripts, processes=1), repeat=repeat)
+    results[name.format('batch.cached')] = _measure(
+        lambda _: run_batch(filename, 1, scripts, processes=1, cache_bytes=DEFAULT_MAX_BYTES),
+        repeat=repeat)
+
+
+def run_suite(world_sizes: tuple[int, ...] = SUITE_WORLD_SIZES, script_sizes: tuple[int, ...] = SUITE_SCRIPT_SIZES,
+              log_sizes: tuple[int, ...] = SUITE_LOG_SIZES, repeat: int = 5) -> dict[str, Any]:
+    """Run the benchmark suite and return its results.
+
+    The result maps 'meta' to a description of the machine it ran on, and 'results' to a mapping from the
+    name of each measurement to its _measure statistics. Names look like
+    'simulation/locations=1000/commands=10000', so a measurement keeps its name from one run to the next.
+    """
+    results = {}
+    with tempfile.TemporaryDirectory() as directory:
+        for num_locations in world_sizes:
+            _bench_world(results, num_locations, directory, repeat)
+        _bench_stock(results, script_sizes, log_sizes, directory, repeat)
+
+    results.update(bench_startup(repeat=repeat))
+
+    meta = {'python': platform.python_version(), 'implementation': platform.python_implementation(),
+            'machine': platform.machine(), 'system': platform.system(), 'repeat': repeat}
+    return {'meta': meta, 'results': results}
+
+
+def _time_to_prompt(game_data_file: str) -> float:
+    """Return the time in seconds from starting play.py on the given game data file in a new Python process until
+    it first asks for a command. The game is then quit."""
+    with tempfile.TemporaryDirectory() as directory:
+        start = time.perf_counter()
+        process = subprocess.Popen([sys.executable, 'project1/play.py', game_data_file,
+                                    '--journal', os.path.join(directory, 'startup.journal')],
+                                   stdin=subprocess.PIPE, stdout=subprocess.PIPE, stderr=subprocess.DEVNULL)
+        output = b''
+        while b'Enter action:' not in output:
+            chunk = process.stdout.read1(4096)
+            if chunk == b'':
+                raise RuntimeError('play.py exited before asking for a command')
+            output += chunk
+        elapsed = time.perf_counter() - start
+        process.communicate(b'quit\n')
+    return elapsed
+
+
+def _import_time(module: str) -> float:
+    """Return the time in seconds that importing the given project module takes in a new Python process."""
+    code = f'import time; start = time.perf_counter(); import {module}; print(time.perf_counter() - start)'
+    env = dict(os.environ, PYTHONPATH='project1')
+    return float(subprocess.run([sys.executable, '-c', code], env=env, capture_output=True, check=True).stdout)
+
+
+def bench_startup(game_data_file: str = 'project1/game_data.json', repeat: int = 5) -> dict[str, dict[str, float]]:
+    """Return the fastest and median times, in seconds, to import the adventure module and to start the game with
+    play.py until it first asks for a command, each measured in repeat new Python processes.
+
+    The result maps the names in STARTUP_BUDGETS to their statistics, like _measure without 'peak_bytes'.
+    """
+    results = {}
+    for name, run in [('startup.import/adventure', lambda: _import_time('adventure')),
+                      ('startup.first_prompt/locations=13', lambda: _time_to_prompt(game_data_file))]:
+        run()  # Warm up the file system cache and compile the modules
+        times = [run() for _ in range(repeat)]
+        results[name] = {'min_s': float(f'{min(times):.4g}'), 'median_s': float(f'{statistics.median(times):.4g}')}
+    return results
+
+
+def over_budget(results: dict[str, dict[str, float]]) -> list[str]:
+    """Return the names of the startup measurements in the given results whose median time is over budget."""
+    return [name for name, budget in STARTUP_BUDGETS.items() if name in results and results[name]['median_s'] > budget]
+
+
+def save_results(suite_results: dict[str, Any], filename: str) -> None:
+    """Save the given run_suite results as JSON to the file with the given name, one measurement per line in
+    order of name, so that two results files can be compared with a line-by-line diff."""
+    names = sorted(suite_results['results'])
+    lines = ['{', '  "meta": ' + json.dumps(suite_results['meta'], sort_keys=True) + ',', '  "results": {']
+    for i, name in enumerate(names):
+        separator = ',' if i < len(names) - 1 else ''
+        lines.append(f'    {json.dumps(name)}: {json.dumps(suite_results["results"][name], sort_keys=True)}{separator}')
+    lines.extend(['  }', '}'])
+    with open(filename, 'w') as f:
+        f.write('\n'.join(lines) + '\n')
+
+
+def compare_results(old_filename: str, new_filename: str,
+                    threshold: float = REGRESSION_THRESHOLD) -> list[tuple[str, float]]:
+    """Return the name and slowdown factor of every measurement whose fastest time in the results saved in
+    new_filename is more than threshold times its fastest time in the results saved in old_filename,
+    most slowed down first.
+
+    Measurements in only one of the files are ignored.
+    """
+    with open(old_filename) as f:
+        old = json.load(f)['results']
+    with open(new_filename) as f:
+        new = json.load(f)['results']
+
+    regressions = []
+    for name in old.keys() & new.keys():
+        if old[name]['min_s'] > 0 and new[name]['min_s'] > threshold * old[name]['min_s']:
+            regressions.append((name, new[name]['min_s'] / old[name]['min_s']))
+    regressions.sort(key=lambda regression: regression[1], reverse=True)
+    return regressions
+
+
+def _run_extras() -> None:
+    """Run the one-off studies behind earlier optimizations and print their results."""
+    print("Command routing cost (ns per command):")
+    for method, ns in bench_command_parsing(SAMPLE_COMMANDS).items():
+        print(f"  {method:<24} {ns:8.1f}")
+
+    stock_world = GameWorld.load('project1/game_data.json')
+    for n in (10_000, 1_000_000):
+        print(f"Event log memory, {n} events:")
+        for log_name, stats in bench_event_log_memory(stock_world, n).items():
+            print(f"  {log_name:<24} {stats['bytes'] / 2 ** 20:10.1f} MiB {stats['bytes_per_event']:8.1f} B/event")
+
+    with tempfile.TemporaryDirectory() as directory:
+        endless_file = write_endless_stock_data(directory)
+        print("Simulation throughput by output sink, 2000 scripts of 100 commands (scripts/s):")
+        for sink_name, rate in bench_sinks(endless_file, [long_script(100)] * 2000).items():
+            print(f"  {sink_name:<24} {rate:10.0f}")
+
+        print("Journal replay, 1000000 commands (s):")
+        for step, seconds in bench_journal_replay(endless_file, long_script(1_000_000)).items():
+            print(f"  {step:<32} {seconds:8.3f}")
+
+
+if __name__ == "__main__":
+    # When you are ready to check your work with python_ta, uncomment the following lines.
+    # (Delete the "#" and space before each line.)
+    # IMPORTANT: keep this code indented inside the "if __name__ == '__main__'" block
+    # import python_ta
+    # python_ta.check_all(config={
+    #     'max-line-length': 120,
+    #     'disable': ['R1705', 'E9998', 'E9999', 'static_type_checker']
+    # })
+
+    if len(sys.argv) > 1 and sys.argv[1] == 'extras':
+        _run_extras()
+    elif len(sys.argv) > 1 and sys.argv[1] == 'startup':
+        startup = bench_startup()
+        for measurement, stats in sorted(startup.items()):
+            print(f"  {measurement:<40} {stats['median_s']:8.3f} s (budget {STARTUP_BUDGETS[measurement]} s)")
+        slow_starts = over_budget(startup)
+        print("Over budget:", ', '.join(slow_starts) if slow_starts else "nothing")
+        sys.exit(1 if slow_starts else 0)
+    elif len(sys.argv) > 1 and sys.argv[1] == 'compare':
+        slower = compare_results(sys.argv[2], sys.argv[3])
+        for measurement, factor in slower:
+            print(f"  {measurement:<64} {factor:6.2f}x slower")
+        print(len(slower), "regressions")
+    else:
+        results_file = sys.argv[1] if len(sys.argv) > 1 else 'benchmark_results.json'
+        suite = run_suite()
+        for measurement, stats in sorted(suite['results'].items()):
+            memory = f"{stats['peak_bytes'] / 2 ** 20:10.1f} MiB" if 'peak_bytes' in stats else ''
+            print(f"  {measurement:<64} {stats['min_s']:10.4g} s {memory}")
+        save_results(suite, results_file)
+        print("Saved results to", results_file)
+        for measurement in over_budget(suite['results']):
+            print("Over budget:", measurement)
@@ -0,0 +1,141 @@
+"""CSC111 Project 1: Text Adventure Game - Command Parser
+
+Instructions (READ THIS FIRST!)
+===============================
+
+This Python module contains the command parser for Project 1, to be imported and used
+by the `adventure` and `simulation` modules.
+
+Every command the player types (or a simulation replays) is parsed exactly once into a
+Command record, and the game then dispatches on the record's verb instead of searching
+the command text for each possible verb in turn.
+
+Copyright and Usage Information
+===============================
+
+This file is provided solely for the personal and private use of students
+taking CSC111 at the University of Toronto St. George campus. All forms of
+distribution of this code, whether as given or with any changes, are
+expressly prohibited. For more information on copyright for CSC111 materials,
+please consult our Course Syllabus.
+
+This file is Copyright (c) 2026 CSC111 Teaching Team
+"""
+from __future__ import annotations
+import functools
+from typing import NamedTuple
+
+# Verbs that act on the game world and take an argument
+GO = "go"
+GO_TO = "go to"
+PICK_UP = "pick up"
+DROP = "drop"
+DEPOSIT = "deposit"
+
+# Menu verbs, which take no argument
+LOOK = "look"
+INVENTORY = "inventory"
+SCORE = "score"
+LOG = "log"
+QUIT = "quit"
+
+# The verb of a command that does not start with any known verb
+UNKNOWN = ""
+
+ACTION_VERBS = frozenset({GO, GO_TO, PICK_UP, DROP, DEPOSIT})
+MENU_VERBS = frozenset({LOOK, INVENTORY, SCORE, LOG, QUIT})
+
+# The verbs of the exits in a location's available commands: a "go to" command listed there is an exit like any
+# go command, and only names a destination to walk to when it is not listed
+MOVE_VERBS = frozenset({GO, GO_TO})
+
+
+class Command(NamedTuple):
+    """A parsed command.
+
+    Instance Attributes:
+        - verb: The verb this command starts with, one of the verb constants in this module
+        - argument: The rest of the command after the verb and the space following it
+        - text: The full text of the command
+
+    Representation Invariants:
+        - self.verb in ACTION_VERBS or self.verb in MENU_VERBS or self.verb == UNKNOWN
+        - self.verb not in MENU_VERBS or self.argument == ''
+    """
+    verb: str
+    argument: str
+    text: str
+
+
+def _build_verb_trie() -> dict:
+    """Return a trie over the words of every verb.
+
+    Each node maps a word to its child node. A node reached by the complete sequence of words of a verb
+    maps None to that verb.
+    """
+    trie = {}
+    for verb in ACTION_VERBS | MENU_VERBS:
+        node = trie
+        for word in verb.split(' '):
+            node = node.setdefault(word, {})
+        node[None] = verb
+    return trie
+
+
+_VERB_TRIE = _build_verb_trie()
+
+
+@functools.lru_cache(maxsize=4096)
+def parse_command(text: str) -> Command:
+    """Return the Command for the given command text.
+
+    The command's verb is the longest verb made of whole words at the start of text. Action verbs must be
+    followed by a space and a non-empty argument, and menu verbs must make up the whole command; anything
+    else is parsed as an UNKNOWN command with no argument.
+
+    Commands are immutable, so the most recently parsed commands are cached and the same Command is
+    returned again for repeated text.
+
+    Preconditions:
+        - text == text.lower().strip()
+
+    >>> parse_command("pick up lucky mug")
+    Command(verb='pick up', argument='lucky mug', text='pick up lucky mug')
+    >>> parse_command("deposit drop box")
+    Command(verb='deposit', argument='drop box', text='deposit drop box')
+    >>> parse_command("go to bahen centre")
+    Command(verb='go to', argument='bahen centre', text='go to bahen centre')
+    >>> parse_command("look")
+    Command(verb='look', argument='', text='look')
+    >>> parse_command("go")
+    Command(verb='', argument='', text='go')
+    """
+    node = _VERB_TRIE
+    verb, argument = UNKNOWN, ''
+    rest = text
+    while node is not None and rest:
+        word, _, rest = rest.partition(' ')
+        node = node.get(word)
+        if node is not None and None in node:
+            verb, argument = node[None], rest
+
+    if verb in MENU_VERBS and text == verb:
+        return Command(verb, '', text)
+    elif verb in ACTION_VERBS and argument != '':
+        return Command(verb, argument, text)
+    else:
+        return Command(UNKNOWN, '', text)
+
+
+if __name__ == "__main__":
+    import doctest
+    doctest.testmod()
+
+    # When you are ready to check your work with python_ta, uncomment the following lines.
+    # (Delete the "#" and space before each line.)
+    # IMPORTANT: keep this code indented inside the "if __name__ == '__main__'" block
+    # import python_ta
+    # python_ta.check_all(config={
+    #     'max-line-length': 120,
+    #     'disable': ['R1705', 'E9998', 'E9999', 'static_type_checker']
+    # })
@@ -0,0 +1,367 @@
+"""CSC111 Project 1: Text Adventure Game - Compiled Worlds
+
+Instructions (READ THIS FIRST!)
+===============================
+
+This Python module contains a compact binary format for game data files for Project 1,
+to be used by the `adventure` module. Compile a game data file from the repository root with
+
+    python project1/compiled_world.py compile project1/game_data.json
+
+which writes project1/game_data.json.compiled. Passing that filename to AdventureGame
+(or AdventureGameSimulation) in place of game_data.json plays the compiled world.
+
+A compiled file holds one fixed-width record per location, every command, location name
+and item name once in a table of interned strings, and all the descriptions one after
+another in a single blob. It is opened with mmap, so nothing is read when a game starts:
+a location's record is only read when the game first looks at the location, and a
+description is only decoded when it is shown.
+
+The file records the format version and the SHA-256 hash of the game data file it was
+compiled from. A compiled file whose version or hash does not match is never used; it is
+compiled again instead.
+
+Copyright and Usage Information
+===============================
+
+This file is provided solely for the personal and private use of students
+taking CSC111 at the University of Toronto St. George campus. All forms of
+distribution of this code, whether as given or with any changes, are
+expressly prohibited. For more information on copyright for CSC111 materials,
+please consult our Course Syllabus.
+
+This file is Copyright (c) 2026 CSC111 Teaching Team
+"""
+from __future__ import annotations
+import bisect
+import hashlib
+import json
+import mmap
+import os
+import shutil
+import struct
+import sys
+import tempfile
+from array import array
+from typing import Any, Iterator, Mapping, Optional
+
+from game_entities import Location
+from game_world import GameWorld, item_from_data
+from game_rules import rules_from_data
+from instrumentation import timed
+from lazy_world import scan_game_data
+
+# The suffix added to a game data file's name to get the name of its compiled file
+COMPILED_SUFFIX = '.compiled'
+
+# The version of the compiled file format; files written with another version are compiled again
+_FORMAT_VERSION = 2
+
+# A location record: id, name string, brief description offset and length, long description offset and length,
+# first command and number of commands, first item and number of items, and whether it has been visited
+_RECORD = struct.Struct('=iIqIqIIIIIB')
+
+# The sections of a compiled file, in the order they are written after the header line
+_SECTIONS = ('records', 'sorted_ids', 'sorted_positions', 'command_strings', 'command_targets', 'location_items',
+             'string_offsets', 'string_lengths', 'strings', 'descriptions')
+
+# How many bytes of a game data file are hashed at a time
+_CHUNK_SIZE = 1 << 20
+
+
+def hash_file(filename: str) -> str:
+    """Return the SHA-256 hex digest of the contents of the file with the given name, reading it a chunk at a time."""
+    sha256 = hashlib.sha256()
+    with open(filename, 'rb') as f:
+        for chunk in iter(lambda: f.read(_CHUNK_SIZE), b''):
+            sha256.update(chunk)
+    return sha256.hexdigest()
+
+
+class CompiledLocation(Location):
+    """A Location read from a compiled world file, whose descriptions stay in the file until they are read.
+
+    Reading brief_description or long_description decodes it from the file every time; nothing else about the
+    location differs from an ordinary Location.
+    """
+    # Private Instance Attributes:
+    #   - _descriptions: the description blob of the compiled file
+    #   - _brief_span: the offset and length of the brief description in _descriptions
+    #   - _long_span: the offset and length of the long description in _descriptions
+    _descriptions: memoryview
+    _brief_span: tuple[int, int]
+    _long_span: tuple[int, int]
+
+    def __init__(self, id_num: int, name: str, available_commands: dict[str, int], items: list[str], visited: bool,
+                 descriptions: memoryview, brief_span: tuple[int, int], long_span: tuple[int, int]) -> None:
+        """Initialize a new location whose descriptions are at the given spans of the given description blob."""
+        self.id_num = id_num
+        self.name = name
+        self.available_commands = available_commands
+        self.items = items
+        self.visited = visited
+        self._descriptions = descriptions
+        self._brief_span = brief_span
+        self._long_span = long_span
+
+    @property
+    def brief_description(self) -> str:
+        """Short description shown on repeat visits."""
+        offset, length = self._brief_span
+        return str(self._descriptions[offset:offset + length], 'utf-8')
+
+    @property
+    def long_description(self) -> str:
+        """Full description shown on first visits."""
+        offset, length = self._long_span
+        return str(self._descriptions[offset:offset + length], 'utf-8')
+
+
+class CompiledLocations(Mapping[int, Location]):
+    """A read-only mapping from location id to the CompiledLocation of a memory-mapped compiled world file, built
+    the first time each location is looked up and kept from then on.
+
+    Instance Attributes:
+        - filename: the name of the compiled file
+        - data_hash: the SHA-256 hex digest of the game data file it was compiled from
+        - item_records: the parsed item records of the game data file
+        - rules_record: the parsed rules section of the game data file, or None if it has none
+    """
+    filename: str
+    data_hash: str
+    item_records: list[dict[str, Any]]
+    rules_record: Optional[dict[str, Any]]
+    # Private Instance Attributes:
+    #   - _map: the memory-mapped compiled file
+    #   - _sections: a view of each section of the file, by section name
+    #   - _strings: the decoded string at each index of the string table, or None if it has not been decoded yet
+    #   - _loaded: a mapping from location id to CompiledLocation, for every location built so far
+    _map: mmap.mmap
+    _sections: dict[str, memoryview]
+    _strings: list[Optional[str]]
+    _loaded: dict[int, CompiledLocation]
+
+    def __init__(self, filename: str, expected_hash: Optional[str] = None) -> None:
+        """Open the compiled world file with the given name.
+
+        Raise ValueError if the file is not a compiled world file of this format version for this machine's byte
+        order, or if expected_hash is given and the file was compiled from game data with another hash.
+        """
+        self.filename = filename
+        with open(filename, 'rb') as f:
+            header = json.loads(f.readline())
+            data_start = f.tell()
+            if (header.get('version'), header.get('byteorder')) != (_FORMAT_VERSION, sys.byteorder):
+                raise ValueError(f'{filename} is not a compiled world file of version {_FORMAT_VERSION}')
+            if expected_hash is not None and header['hash'] != expected_hash:
+                raise ValueError(f'{filename} was compiled from other game data')
+            self._map = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+
+        self.data_hash = header['hash']
+        self.item_records = header['items']
+        self.rules_record = header['rules']
+        view = memoryview(self._map)
+        self._sections = {}
+        for name, (offset, size, item_format) in header['sections'].items():
+            if data_start + offset + size > len(view):
+                raise ValueError(f'{filename} is truncated')
+            section = view[data_start + offset:data_start + offset + size]
+            self._sections[name] = section if item_format == 'B' else section.cast(item_format)
+        self._strings = [None] * header['num_strings']
+        self._loaded = {}
+
+    def _string(self, index: int) -> str:
+        """Return the string at the given index of the string table, decoding it the first time it is asked for."""
+        string = self._strings[index]
+        if string is None:
+            offset = self._sections['string_offsets'][index]
+            string = str(self._sections['strings'][offset:offset + self._sections['string_lengths'][index]], 'utf-8')
+            self._strings[index] = string
+        return string
+
+    def _position(self, loc_id: object) -> Optional[int]:
+        """Return the position of the record of the location with the given id, or None if there is none."""
+        sorted_ids = self._sections['sorted_ids']
+        if not isinstance(loc_id, int):
+            return None
+        i = bisect.bisect_left(sorted_ids, loc_id)
+        if i < len(sorted_ids) and sorted_ids[i] == loc_id:
+            return self._sections['sorted_positions'][i]
+        return None
+
+    def __getitem__(self, loc_id: int) -> Location:
+        """Return the location with the given id, building it from its record the first time it is asked for.
+
+        Raise KeyError if the file has no such location.
+        """
+        location = self._loaded.get(loc_id)
+        if location is None:
+            position = self._position(loc_id)
+            if position is None:
+                raise KeyError(loc_id)
+            (id_num, name, brief_offset, brief_length, long_offset, long_length, first_command, num_commands,
+             first_item, num_items, visited) = _RECORD.unpack_from(self._sections['records'],
+                                                                   position * _RECORD.size)
+            command_strings = self._sections['command_strings']
+            command_targets = self._sections['command_targets']
+            commands = {self._string(command_strings[i]): command_targets[i]
+                        for i in range(first_command, first_command + num_commands)}
+            location_items = self._sections['location_items']
+            items = [self._string(location_items[i]) for i in range(first_item, first_item + num_items)]
+            location = CompiledLocation(id_num, self._string(name), commands, items, bool(visited),
+                                        self._sections['descriptions'], (brief_offset, brief_length),
+                                        (long_offset, long_length))
+            self._loaded[loc_id] = location
+        return location
+
+    def __contains__(self, loc_id: object) -> bool:
+        """Return whether the file has a location with the given id, without building it."""
+        return self._position(loc_id) is not None
+
+    def __iter__(self) -> Iterator[int]:
+        """Return an iterator over the id of every location, in the order the game data file lists them."""
+        records = self._sections['records']
+        return (_RECORD.unpack_from(records, position * _RECORD.size)[0] for position in range(len(self)))
+
+    def __len__(self) -> int:
+        """Return the number of locations in the file."""
+        return len(self._sections['sorted_ids'])
+
+    def num_loaded(self) -> int:
+        """Return the number of locations built so far."""
+        return len(self._loaded)
+
+    def __getstate__(self) -> dict[str, Any]:
+        """Return the state of this mapping to pickle: just the file, which is mapped again when unpickled."""
+        return {'filename': self.filename, 'data_hash': self.data_hash}
+
+    def __setstate__(self, state: dict[str, Any]) -> None:
+        """Map the file this mapping was pickled with again."""
+        self.__init__(state['filename'], state['data_hash'])
+
+
+def compile_world(game_data_file: str, compiled_file: Optional[str] = None) -> str:
+    """Compile the game data file with the given name into a compiled world file, and return that file's name.
+
+    The compiled file is named after the game data file plus COMPILED_SUFFIX unless compiled_file is given.
+    The game data file is read once, one location record at a time, and the descriptions are staged in a
+    temporary file, so compiling a very large world does not hold its descriptions in memory.
+
+    Preconditions:
+        - game_data_file is the filename of a valid game data JSON file
+    """
+    if compiled_file is None:
+        compiled_file = game_data_file + COMPILED_SUFFIX
+    records = bytearray()
+    ids = array('i')
+    command_strings, command_targets, location_items = array('I'), array('i'), array('I')
+    interned = {}
+    string_offsets, string_lengths = array('q'), array('I')
+    strings = bytearray()
+
+    def intern(string: str) -> int:
+        """Return the index of the given string in the string table, adding it if it is new."""
+        index = interned.get(string)
+        if index is None:
+            encoded = string.encode('utf-8')
+            index = len(string_offsets)
+            string_offsets.append(len(strings))
+            string_lengths.append(len(encoded))
+            strings.extend(encoded)
+            interned[string] = index
+        return index
+
+    with tempfile.TemporaryFile() as descriptions:
+        def add_location(loc_data: dict[str, Any], _offset: int, _length: int) -> None:
+            """Add the given location record to the compiled world."""
+            brief = loc_data['brief_description'].encode('utf-8')
+            long = loc_data['long_description'].encode('utf-8')
+            brief_offset = descriptions.tell()
+            descriptions.write(brief)
+            descriptions.write(long)
+            records.extend(_RECORD.pack(loc_data['id'], intern(loc_data['name']),
+                                        brief_offset, len(brief), brief_offset + len(brief), len(long),
+                                        len(command_strings), len(loc_data['available_commands']),
+                                        len(location_items), len(loc_data['items']), loc_data['visited']))
+            ids.append(loc_data['id'])
+            for command, target in loc_data['available_commands'].items():
+                command_strings.append(intern(command))
+                command_targets.append(target)
+            for item_name in loc_data['items']:
+                location_items.append(intern(item_name))
+
+        data_sections, data_hash = scan_game_data(game_data_file, add_location)
+
+        order = sorted(range(len(ids)), key=ids.__getitem__)
+        arrays = {'records': records, 'sorted_ids': array('i', (ids[i] for i in order)),
+                  'sorted_positions': array('i', order), 'command_strings': command_strings,
+                  'command_targets': command_targets, 'location_items': location_items,
+                  'string_offsets': string_offsets, 'string_lengths': string_lengths, 'strings': strings}
+        sections = {}
+        offset = 0
+        for name in _SECTIONS:
+            if name == 'descriptions':
+                size, item_format = descriptions.tell(), 'B'
+            else:
+                size = len(arrays[name]) * (arrays[name].itemsize if isinstance(arrays[name], array) else 1)
+                item_format = arrays[name].typecode if isinstance(arrays[name], array) else 'B'
+            sections[name] = (offset, size, item_format)
+            offset += size + (-size % 8)  # Keep every section aligned for the typed views over it
+
+        header = {'version': _FORMAT_VERSION, 'hash': data_hash, 'byteorder': sys.byteorder,
+                  'num_strings': len(string_offsets), 'items': data_sections.get('items', []),
+                  'rules': data_sections.get('rules'), 'sections': sections}
+        # Write to a temporary file first, so a reader never sees half a compiled world
+        temporary = compiled_file + '.tmp'
+        with open(temporary, 'wb') as f:
+            # Pad the header line so that the sections after it start on a multiple of 8 bytes
+            header_line = json.dumps(header).encode('utf-8')
+            f.write(header_line + b' ' * (-(len(header_line) + 1) % 8) + b'\n')
+            for name in _SECTIONS:
+                if name == 'descriptions':
+                    descriptions.seek(0)
+                    shutil.copyfileobj(descriptions, f)
+                else:
+                    f.write(arrays[name])
+                f.write(b'\0' * (-sections[name][1] % 8))
+        os.replace(temporary, compiled_file)
+    return compiled_file
+
+
+@timed('adventure_world_load', 'compiled')
+def load_compiled_world(game_data_file: str) -> GameWorld:
+    """Return the game world stored in the game data file with the given name, played from its compiled file.
+
+    The compiled file is used only if it was compiled from exactly the current contents of the game data file,
+    by this format version; otherwise the game data file is compiled again first.
+
+    Preconditions:
+        - game_data_file is the filename of a valid game data JSON file
+    """
+    compiled_file = game_data_file + COMPILED_SUFFIX
+    data_hash = hash_file(game_data_file)
+    try:
+        locations = CompiledLocations(compiled_file, data_hash)
+    except (OSError, ValueError, KeyError):
+        compile_world(game_data_file, compiled_file)
+        locations = CompiledLocations(compiled_file, data_hash)
+    items = [item_from_data(item_data) for item_data in locations.item_records]
+    return GameWorld(locations, items, game_data_file, data_hash, rules_from_data(locations.rules_record))
+
+
+if __name__ == "__main__":
+    # When you are ready to check your work with python_ta, uncomment the following lines.
+    # (Delete the "#" and space before each line.)
+    # IMPORTANT: keep this code indented inside the "if __name__ == '__main__'" block
+    # import python_ta
+    # python_ta.check_all(config={
+    #     'max-line-length': 120,
+    #     'disable': ['R1705', 'E9998', 'E9999', 'static_type_checker']
+    # })
+
+    if len(sys.argv) < 3 or sys.argv[1] != 'compile':
+        print("Usage: python project1/compiled_world.py compile GAME_DATA_FILE [COMPILED_FILE]")
+        sys.exit(2)
+    output_file = compile_world(sys.argv[2], sys.argv[3] if len(sys.argv) > 3 else None)
+    print("Compiled", sys.argv[2], "to", output_file, f"({os.path.getsize(output_file)} bytes,",
+          f"{os.path.getsize(sys.argv[2])} bytes of JSON)")
@@ -0,0 +1,221 @@
+"""CSC111 Project 1: Text Adventure Game - Event Journal
+
+Instructions (READ THIS FIRST!)
+===============================
+
+This Python module contains the write-ahead journal for Project 1, to be imported and
+used by the `adventure`, `event_logger` and `simulation` modules.
+
+A game with a journal appends a record to it for every change it makes: the event log
+growing or shrinking, items moving, the player moving and locations being visited. If
+the game crashes, AdventureGame.from_journal rebuilds its state by applying those
+records directly, without running any command through the game rules again.
+
+Each record is one line of tab-separated fields. The first field is the record kind:
+
+    S <location id>                 a game started at the given location
+    E <location id> [<command>]     an event was added to the log, reached by the given command
+    R                               the last event was removed from the log
+    T <location id> <item name> [<points>]
+                                    an item was picked up at the given location, scoring the given
+                                    number of points (none if left out)
+    D <location id> <item name>     an item was dropped at the given location
+    P <item name> <points>          an item was deposited for the given number of points
+    G <location id>                 the player moved to the given location
+    V <location id>                 the given location was visited
+
+Copyright and Usage Information
+===============================
+
+This file is provided solely for the personal and private use of students
+taking CSC111 at the University of Toronto St. George campus. All forms of
+distribution of this code, whether as given or with any changes, are
+expressly prohibited. For more information on copyright for CSC111 materials,
+please consult our Course Syllabus.
+
+This file is Copyright (c) 2026 CSC111 Teaching Team
+"""
+from __future__ import annotations
+import os
+import time
+from typing import Iterator, Optional, TextIO
+
+START = 'S'
+EVENT = 'E'
+REMOVE_EVENT = 'R'
+TAKE = 'T'
+DROP = 'D'
+DEPOSIT = 'P'
+GO = 'G'
+VISIT = 'V'
+
+_ESCAPES = str.maketrans({'\\': '\\\\', '\t': '\\t', '\n': '\\n'})
+_UNESCAPES = {'\\\\': '\\', '\\t': '\t', '\\n': '\n'}
+
+
+def _unescape(text: str) -> str:
+    """Return the field that EventJournal.append escaped into the given text."""
+    if '\\' not in text:
+        return text
+    result = []
+    i = 0
+    while i < len(text):
+        if text[i] == '\\' and i + 1 < len(text):
+            result.append(_UNESCAPES.get(text[i:i + 2], text[i + 1]))
+            i += 2
+        else:
+            result.append(text[i])
+            i += 1
+    return ''.join(result)
+
+
+def _remove_partial_record(filename: str) -> None:
+    """Truncate the journal file with the given name, if it exists, to the end of its last complete record."""
+    try:
+        f = open(filename, 'rb+')
+    except FileNotFoundError:
+        return
+    with f:
+        end = f.seek(0, os.SEEK_END)
+        position = end
+        while position > 0:
+            start = max(0, position - 4096)
+            f.seek(start)
+            newline = f.read(position - start).rfind(b'\n')
+            if newline >= 0:
+                position = start + newline + 1
+                break
+            position = start
+        if position < end:
+            f.truncate(position)
+
+
+class EventJournal:
+    """An append-only journal of game records stored in a file.
+
+    Records are kept in memory and written to the file in batches of batch_size. After a batch is
+    written, the file is also synced to disk (with os.fsync) if at least fsync_interval seconds have
+    passed since it was last synced, so at most one batch plus fsync_interval seconds of records can
+    be lost in a crash. An fsync_interval of 0 syncs after every batch, and None never syncs explicitly.
+
+    Instance Attributes:
+        - filename: the name of the journal file
+        - batch_size: the number of records kept in memory before they are written to the file
+        - fsync_interval: the minimum number of seconds between syncs, or None to never sync
+
+    Representation Invariants:
+        - self.batch_size >= 1
+        - self.fsync_interval is None or self.fsync_interval >= 0
+    """
+    filename: str
+    batch_size: int
+    fsync_interval: Optional[float]
+    # Private Instance Attributes:
+    #   - _file: the journal file, opened for appending, or None once the journal is closed
+    #   - _buffer: the lines of the records not yet written to the file
+    #   - _last_sync: the time.monotonic() time of the last sync
+    _file: Optional[TextIO]
+    _buffer: list[str]
+    _last_sync: float
+
+    def __init__(self, filename: str, batch_size: int = 64, fsync_interval: Optional[float] = 1.0) -> None:
+        """Open the journal stored in the file with the given name, creating it if it does not exist.
+
+        New records are added after any records already in the file. A last record that was only partly written
+        when the game crashed is removed first, so that the next record is not glued onto it.
+        """
+        self.filename = filename
+        self.batch_size = batch_size
+        self.fsync_interval = fsync_interval
+        _remove_partial_record(filename)
+        self._file = open(filename, 'a', encoding='utf-8')
+        self._buffer = []
+        self._last_sync = time.monotonic()
+
+    def append(self, kind: str, *fields: object) -> None:
+        """Add a record of the given kind with the given fields to the end of this journal.
+
+        Preconditions:
+            - kind is one of the record kinds in this module
+            - this journal is not closed
+        """
+        line = kind
+        for field in fields:
+            text = str(field)
+            if '\\' in text or '\t' in text or '\n' in text:
+                text = text.translate(_ESCAPES)
+            line += '\t' + text
+        self._buffer.append(line + '\n')
+        if len(self._buffer) >= self.batch_size:
+            self.flush()
+
+    def flush(self) -> None:
+        """Write every record kept in memory to the file, and sync the file if fsync_interval has passed."""
+        if self._buffer:
+            self._file.write(''.join(self._buffer))
+            self._buffer.clear()
+            self._file.flush()
+        if self.fsync_interval is not None and time.monotonic() - self._last_sync >= self.fsync_interval:
+            self.sync()
+
+    def sync(self) -> None:
+        """Make sure every record written to the file so far is on disk."""
+        os.fsync(self._file.fileno())
+        self._last_sync = time.monotonic()
+
+    def close(self) -> None:
+        """Write and sync every remaining record, then close the file. Closing a closed journal does nothing."""
+        if self._file is None:
+            return
+        self._file.write(''.join(self._buffer))
+        self._buffer.clear()
+        self._file.flush()
+        if self.fsync_interval is not None:
+            self.sync()
+        self._file.close()
+        self._file = None
+
+    def __enter__(self) -> EventJournal:
+        """Return this journal, for use in a with statement."""
+        return self
+
+    def __exit__(self, *exc_info: object) -> None:
+        """Close this journal at the end of a with statement."""
+        self.close()
+
+
+def read_journal(filename: str) -> Iterator[list[str]]:
+    """Return an iterator over the records in the journal file with the given name, in the order they were added.
+
+    Each record is a list of its fields as strings, starting with its kind. A last record that was only
+    partly written when the game crashed is skipped. The file is read in binary mode and only complete records
+    are decoded, so a record cut off in the middle of a character is skipped like any other.
+    """
+    with open(filename, 'rb') as f:
+        for raw_line in f:
+            if raw_line[-1:] != b'\n':
+                return
+            line = raw_line.decode('utf-8')
+            if '\\' in line:
+                yield [_unescape(field) for field in line[:-1].split('\t')]
+            else:
+                yield line[:-1].split('\t')
+
+
+def has_records(filename: str) -> bool:
+    """Return whether the journal file with the given name exists and holds at least one complete record."""
+    if not os.path.exists(filename):
+        return False
+    return next(read_journal(filename), None) is not None
+
+
+if __name__ == "__main__":
+    pass
+    # When you are ready to check your work with python_ta, uncomment the following lines.
+    # (Delete the "#" and space before each line.)
+    # IMPORTANT: keep this code indented inside the "if __name__ == '__main__'" block
+    # import python_ta
+    # python_ta.check_all(config={
+    #     'max-line-length': 120,
+    #     'disable': ['R1705', 'E9998', 'E9999', 'static_type_checker']
+    # })
@@ -22,13 +22,25 @@ This file is Copyright (c) 2026 CSC111 Teaching Team
 """
 
 from __future__ import annotations
+from array import array
 from dataclasses import dataclass
-from typing import Optional
+from typing import Iterator, Optional
+
+from event_journal import EventJournal, EVENT, REMOVE_EVENT
+from output_sink import OutputSink
 
 
 # TODO: Copy/paste your A1 event_logger code below, and modify it if needed to fit your game
 
 
+def _journal_event(journal: EventJournal, event: Event, command: Optional[str]) -> None:
+    """Record in the given journal that the given event was added, reached by the given command."""
+    if command is None:
+        journal.append(EVENT, event.id_num)
+    else:
+        journal.append(EVENT, event.id_num, command)
+
+
 @dataclass
 class Event:
     """
@@ -55,24 +67,28 @@ class EventList:
     Instance Attributes:
         - first : It is the first event or None if the list is empty.
         - last: It is the last even or None of the list is empty.
+        - journal: The journal that every added and removed event is recorded in, or None
 
     Representation Invariants:
         - (self.first is not None) and (self.last is not None)
     """
     first: Optional[Event]
     last: Optional[Event]
+    journal: Optional[EventJournal]
 
-    def __init__(self) -> None:
-        """Initialize a new empty event list."""
+    def __init__(self, journal: Optional[EventJournal] = None) -> None:
+        """Initialize a new empty event list, recording its events in the given journal if there is one."""
 
         self.first = None
         self.last = None
+        self.journal = journal
 
-    def display_events(self) -> None:
-        """Display all events in chronological order."""
+    def display_events(self, sink: Optional[OutputSink] = None) -> None:
+        """Display all events in chronological order, through the given sink or with print if sink is None."""
+        say = print if sink is None else sink.say
         curr = self.first
         while curr:
-            print(f"Location: {curr.id_num}, Command: {curr.next_command}")
+            say(f"Location: {curr.id_num}, Command: {curr.next_command}")
             curr = curr.next
 
     def is_empty(self) -> bool:
@@ -88,6 +104,9 @@ class EventList:
         """
         # Hint: You should update the previous node's <next_command> as needed
 
+        if self.journal is not None:
+            _journal_event(self.journal, event, command)
+
         if self.is_empty():
             self.first = event
             self.last = event
@@ -106,6 +125,8 @@ class EventList:
 
         if self.is_empty():
             return
+        if self.journal is not None:
+            self.journal.append(REMOVE_EVENT)
         if self.first == self.last:
             self.first = None
             self.last = None
@@ -125,9 +146,139 @@ class EventList:
             curr = curr.next
         return result
 
+    def __iter__(self) -> Iterator[Event]:
+        """Return an iterator over the events in this list, in chronological order."""
+        curr = self.first
+        while curr is not None:
+            yield curr
+            curr = curr.next
+
     # Note: You may add other methods to this class as needed
 
 
+class CompactEventList:
+    """
+    A log of game events with the same interface as EventList, stored in arrays instead of a linked list.
+
+    Each event takes three machine integers: its location id, and indexes into tables of the distinct
+    descriptions and commands seen so far, so repeated descriptions and commands are only stored once.
+    Unlike EventList, len() and indexing take constant time.
+
+    Indexing or iterating returns new Event objects built from the arrays. Their next and prev attributes
+    are always None, and changing them does not change this list.
+
+    Instance Attributes:
+        - journal: The journal that every added and removed event is recorded in, or None
+    """
+    journal: Optional[EventJournal]
+    # Private Instance Attributes:
+    #   - _ids: the location id of each event, in chronological order
+    #   - _description_indexes: for each event, the index in _descriptions of its description
+    #   - _command_indexes: for each event, the index in _commands of its next_command, or -1 if it is None
+    #   - _descriptions: every distinct description added so far
+    #   - _description_table: a mapping from each description in _descriptions to its index
+    #   - _commands: every distinct command added so far
+    #   - _command_table: a mapping from each command in _commands to its index
+    _ids: array
+    _description_indexes: array
+    _command_indexes: array
+    _descriptions: list[str]
+    _description_table: dict[str, int]
+    _commands: list[str]
+    _command_table: dict[str, int]
+
+    def __init__(self, journal: Optional[EventJournal] = None) -> None:
+        """Initialize a new empty event list, recording its events in the given journal if there is one."""
+        self.journal = journal
+        self._ids = array('i')
+        self._description_indexes = array('i')
+        self._command_indexes = array('i')
+        self._descriptions = []
+        self._description_table = {}
+        self._commands = []
+        self._command_table = {}
+
+    def __len__(self) -> int:
+        """Return the number of events in this list."""
+        return len(self._ids)
+
+    def __getitem__(self, index: int) -> Event:
+        """Return the event at the given index, counting from the first event (negative indexes count from the end).
+
+        Raise IndexError if there is no event at the given index.
+        """
+        command_index = self._command_indexes[index]
+        return Event(self._ids[index], self._descriptions[self._description_indexes[index]],
+                     None if command_index == -1 else self._commands[command_index])
+
+    def __iter__(self) -> Iterator[Event]:
+        """Return an iterator over the events in this list, in chronological order."""
+        for index in range(len(self._ids)):
+            yield self[index]
+
+    def display_events(self, sink: Optional[OutputSink] = None) -> None:
+        """Display all events in chronological order, through the given sink or with print if sink is None."""
+        say = print if sink is None else sink.say
+        commands = self._commands
+        for id_num, command_index in zip(self._ids, self._command_indexes):
+            command = None if command_index == -1 else commands[command_index]
+            say(f"Location: {id_num}, Command: {command}")
+
+    def is_empty(self) -> bool:
+        """Return whether this event list is empty."""
+        return len(self._ids) == 0
+
+    @staticmethod
+    def _intern(text: str, table: dict[str, int], values: list[str]) -> int:
+        """Return the index of text in values, adding it to values and table if it is not there yet."""
+        index = table.get(text)
+        if index is None:
+            index = len(values)
+            table[text] = index
+            values.append(text)
+        return index
+
+    def add_event(self, event: Event, command: str = None) -> None:
+        """
+        Add the given new event to the end of this event list.
+        The given command is the command which was used to reach this new event, or None if this is the first
+        event in the game.
+
+        Only the event's id_num and description are kept, not the event object itself.
+        """
+        if self.journal is not None:
+            _journal_event(self.journal, event, command)
+
+        if len(self._ids) > 0:
+            if command is None:
+                self._command_indexes[-1] = -1
+            else:
+                self._command_indexes[-1] = self._intern(command, self._command_table, self._commands)
+        self._ids.append(event.id_num)
+        self._description_indexes.append(
+            self._intern(event.description, self._description_table, self._descriptions))
+        self._command_indexes.append(-1)
+
+    def remove_last_event(self) -> None:
+        """
+        Remove the last event from this event list.
+        If the list is empty, do nothing.
+        """
+        if len(self._ids) == 0:
+            return
+        if self.journal is not None:
+            self.journal.append(REMOVE_EVENT)
+        self._ids.pop()
+        self._description_indexes.pop()
+        self._command_indexes.pop()
+        if len(self._ids) > 0:
+            self._command_indexes[-1] = -1
+
+    def get_id_log(self) -> list[int]:
+        """Return a list of all location IDs visited for each event in this list, in sequence."""
+        return self._ids.tolist()
+
+
 if __name__ == "__main__":
     pass
     # When you are ready to check your work with python_ta, uncomment the following lines.
@@ -0,0 +1,318 @@
+"""CSC111 Project 1: Text Adventure Game - Differential Fuzzer
+
+Instructions (READ THIS FIRST!)
+===============================
+
+This Python module contains a fuzzer for Project 1 that checks that the interactive game
+(a GameSession, as driven by play) and AdventureGameSimulation change the game's state in
+the same way. Run it from the repository root:
+
+    python project1/fuzzer.py [SEQUENCES] [--processes N] [--seed SEED] [--data GAME_DATA_FILE]
+
+plays SEQUENCES random command sequences (100000 by default) on the given game data file
+(project1/game_data.json by default), spread over N worker processes (one per CPU by
+default). It reports how many sequences and commands per second it checked, and the
+shortest sequence it found that makes the two engines disagree, exiting with status 1 if
+it found one.
+
+Each sequence is made up one command at a time from the player's situation: mostly the go
+commands of the current location, picking up, dropping and depositing items that are (or
+are not) there, "go to" commands and menu commands, with some text that is not a command
+at all. Every command is entered in the interactive game; every command it accepts is then
+simulated, and the current location, score, moves, inventory and deposited items of the
+two games are compared. A sequence that makes them disagree is shrunk, by dropping
+commands for as long as the games still disagree, before it is reported.
+
+What this fuzzer cannot find: both engines carry out every action through the same
+function, adventure.run_action, by the same GameRules, on the same AdventureGame. A mistake
+in the rules themselves (a wrong score, a lock that lets the player through, a carry limit
+that is off by one) is made the same way by both, so the games still agree and nothing is
+reported. What it does check is everything the two engines do differently around that
+function: reading commands, the menu, following "go to" routes one step at a time, and
+deciding when the game is over. The rules need their own checks, such as the solver and the
+walkthroughs of the stock game.
+
+Copyright and Usage Information
+===============================
+
+This file is provided solely for the personal and private use of students
+taking CSC111 at the University of Toronto St. George campus. All forms of
+distribution of this code, whether as given or with any changes, are
+expressly prohibited. For more information on copyright for CSC111 materials,
+please consult our Course Syllabus.
+
+This file is Copyright (c) 2026 CSC111 Teaching Team
+"""
+from __future__ import annotations
+import multiprocessing
+import random
+import sys
+import time
+from dataclasses import dataclass
+from typing import Callable, Optional
+
+from adventure import AdventureGame, GameSession, DEFAULT_GAME_DATA_FILE
+from command_parser import LOOK, INVENTORY, SCORE, LOG, QUIT
+from event_logger import CompactEventList
+from game_world import GameWorld
+from output_sink import NullSink
+from simulation import AdventureGameSimulation
+
+# The most commands in one random sequence
+MAX_SEQUENCE_LENGTH = 80
+
+# Text that is never a valid command
+NONSENSE = ["", "jump", "go", "go nowhere", "pick up", "drop", "deposit", "go to", "go to nowhere", "look around",
+            "pick up nothing", "drop everything", "deposit nothing", "inventory please"]
+
+# The state of a game that the two engines must agree on: current location id, score, moves, the names of the
+# items in inventory in order, and the names of the deposited items in sorted order
+GameState = tuple[int, int, int, tuple[str, ...], tuple[str, ...]]
+
+
+@dataclass
+class Divergence:
+    """A command sequence after which the interactive game and the simulation disagree.
+
+    Instance Attributes:
+        - commands: The commands entered in the interactive game, in order
+        - interactive: The state of the interactive game after the last command
+        - simulated: The state of the simulated game after the last command
+    """
+    commands: list[str]
+    interactive: GameState
+    simulated: GameState
+
+
+@dataclass
+class FuzzResult:
+    """The outcome of a fuzzing run.
+
+    Instance Attributes:
+        - sequences: The number of command sequences played
+        - commands: The number of commands entered in the interactive game
+        - elapsed: Wall-clock time in seconds spent fuzzing, including pool start-up
+        - divergence: The shortest sequence found that makes the two engines disagree, or None if none was found
+
+    Representation Invariants:
+        - self.sequences >= 0
+        - self.commands >= 0
+        - self.elapsed >= 0
+    """
+    sequences: int
+    commands: int
+    elapsed: float
+    divergence: Optional[Divergence]
+
+    def sequences_per_second(self) -> float:
+        """Return the throughput of this run, in sequences played per second."""
+        return self.sequences / self.elapsed if self.elapsed > 0 else float('inf')
+
+    def commands_per_second(self) -> float:
+        """Return the throughput of this run, in commands entered per second."""
+        return self.commands / self.elapsed if self.elapsed > 0 else float('inf')
+
+
+def game_state(game: AdventureGame) -> GameState:
+    """Return the state of the given game that the two engines must agree on."""
+    return (game.current_location_id, game.score, game.moves, tuple(game.inventory),
+            tuple(sorted(game.deposited_items)))
+
+
+def random_command(rng: random.Random, game: AdventureGame, location_names: list[str], item_names: list[str]) -> str:
+    """Return a random command for the player of the given game, naming any of the given locations and items."""
+    location = game.get_location()
+    roll = rng.random()
+    if roll < 0.45 and location.available_commands:
+        return rng.choice(list(location.available_commands))
+    elif roll < 0.60:
+        names = location.items if location.items and rng.random() < 0.8 else item_names
+        return "pick up " + rng.choice(names).lower()
+    elif roll < 0.80:
+        verb = "drop " if roll < 0.70 else "deposit "
+        names = list(game.inventory) if game.inventory and rng.random() < 0.8 else item_names
+        return verb + rng.choice(names).lower()
+    elif roll < 0.85:
+        return "go to " + rng.choice(location_names)
+    elif roll < 0.93:
+        return rng.choice([LOOK, INVENTORY, SCORE, LOG, LOOK, INVENTORY, SCORE, LOG, QUIT])
+    else:
+        return rng.choice(NONSENSE)
+
+
+def play_both(game_data_file: str, world: GameWorld,
+              next_command: Callable[[AdventureGame], Optional[str]]) -> tuple[list[str], Optional[Divergence]]:
+    """Play one game in the interactive engine and the simulation at once, entering the commands returned by
+    next_command, which is given the interactive game, until it returns None or the interactive game is over.
+
+    Return the commands entered, and the first point at which the two engines disagreed, if they did.
+    """
+    session = GameSession(AdventureGame(game_data_file, 1, world), CompactEventList(), NullSink())
+    session.start()
+    sim = None
+    commands = []
+    while not session.over:
+        text = next_command(session.game)
+        if text is None:
+            break
+        commands.append(text)
+        if not session.handle(text):
+            continue
+
+        choice = text.lower().strip()
+        if sim is None:
+            sim = AdventureGameSimulation(game_data_file, 1, [choice], world, CompactEventList(), sink=NullSink())
+        else:
+            sim.generate_events([choice], sim.get_game().get_location())
+        interactive, simulated = game_state(session.game), game_state(sim.get_game())
+        if interactive != simulated:
+            return commands, Divergence(list(commands), interactive, simulated)
+    return commands, None
+
+
+def replay(game_data_file: str, world: GameWorld, commands: list[str]) -> Optional[Divergence]:
+    """Play the given commands in both engines and return the first point at which they disagree, if they do."""
+    remaining = iter(commands)
+    return play_both(game_data_file, world, lambda _: next(remaining, None))[1]
+
+
+def shrink(game_data_file: str, world: GameWorld, divergence: Divergence) -> Divergence:
+    """Return a divergence whose commands are a subsequence of the given divergence's, from which no single
+    command can be dropped without the two engines agreeing."""
+    i = 0
+    while i < len(divergence.commands):
+        shorter = replay(game_data_file, world, divergence.commands[:i] + divergence.commands[i + 1:])
+        if shorter is not None:
+            divergence = shorter
+            i = 0
+        else:
+            i += 1
+    return divergence
+
+
+def fuzz(game_data_file: str, world: GameWorld, num_sequences: int, seed: int) -> tuple[int, Optional[Divergence]]:
+    """Play num_sequences random sequences, generated from the given seed, in both engines. Return the number of
+    commands entered and the shortest divergence found, after shrinking, if any."""
+    rng = random.Random(seed)
+    location_names = [location.name.lower() for location in world.locations.values()]
+    item_names = [item.name for item in world.items]
+    num_commands = 0
+    shortest = None
+    for _ in range(num_sequences):
+        length = rng.randint(1, MAX_SEQUENCE_LENGTH)
+
+        def next_command(game: AdventureGame) -> Optional[str]:
+            """Return a random command, or None once the sequence is long enough."""
+            if len(commands_so_far) >= length:
+                return None
+            commands_so_far.append(random_command(rng, game, location_names, item_names))
+            return commands_so_far[-1]
+
+        commands_so_far = []
+        commands, divergence = play_both(game_data_file, world, next_command)
+        num_commands += len(commands)
+        if divergence is not None and (shortest is None or len(divergence.commands) < len(shortest.commands)):
+            shortest = divergence
+
+    if shortest is not None:
+        shortest = shrink(game_data_file, world, shortest)
+    return num_commands, shortest
+
+
+# The game data file and world, set once in each worker process by _init_worker.
+_worker_data: Optional[tuple[str, GameWorld]] = None
+
+
+def _init_worker(game_data_file: str, world: GameWorld) -> None:
+    """Remember the shared game world in this worker process."""
+    global _worker_data
+    _worker_data = (game_data_file, world)
+
+
+def _fuzz_chunk(chunk: tuple[int, int]) -> tuple[int, int, Optional[Divergence]]:
+    """Fuzz a chunk of (seed, number of sequences) in a worker process, and return the number of sequences and
+    commands played and the shortest divergence found."""
+    game_data_file, world = _worker_data
+    seed, num_sequences = chunk
+    num_commands, divergence = fuzz(game_data_file, world, num_sequences, seed)
+    return num_sequences, num_commands, divergence
+
+
+def run_fuzzer(game_data_file: str, num_sequences: int, processes: Optional[int] = None, seed: int = 111,
+               chunk_size: int = 1000) -> FuzzResult:
+    """Play num_sequences random command sequences in both engines and return the outcome.
+
+    game_data_file is loaded once into a GameWorld shared by every sequence. The sequences are split into chunks
+    of chunk_size, each with its own seed derived from seed, and fuzzed by a pool of the given number of worker
+    processes (by default, one per CPU). If processes is 1, they are fuzzed in this process instead, without
+    starting a pool. The same arguments always play the same sequences.
+
+    Preconditions:
+        - game_data_file is the filename of a valid game data JSON file
+        - num_sequences >= 0
+        - processes is None or processes >= 1
+        - chunk_size >= 1
+    """
+    start = time.perf_counter()
+
+    world = GameWorld.load(game_data_file)
+
+    chunks = [(seed * 1_000_003 + i, min(chunk_size, num_sequences - i)) for i in range(0, num_sequences, chunk_size)]
+    if processes == 1:
+        _init_worker(game_data_file, world)
+        chunk_results = [_fuzz_chunk(chunk) for chunk in chunks]
+    else:
+        with multiprocessing.Pool(processes, _init_worker, (game_data_file, world)) as pool:
+            chunk_results = pool.map(_fuzz_chunk, chunks)
+
+    divergences = [divergence for _, _, divergence in chunk_results if divergence is not None]
+    shortest = min(divergences, key=lambda divergence: len(divergence.commands), default=None)
+    return FuzzResult(sum(result[0] for result in chunk_results), sum(result[1] for result in chunk_results),
+                      time.perf_counter() - start, shortest)
+
+
+def main(args: list[str]) -> int:
+    """Run the fuzzer with the given command line arguments, print its report and return its exit status."""
+    options = {}
+    positional = []
+    while args:
+        if args[0] in ('--processes', '--seed', '--data') and len(args) > 1:
+            options[args[0][2:]] = args[1]
+            args = args[2:]
+        elif args[0].startswith('-') or positional:
+            print("Usage: python project1/fuzzer.py [SEQUENCES] [--processes N] [--seed SEED] "
+                  "[--data GAME_DATA_FILE]", file=sys.stderr)
+            return 2
+        else:
+            positional.append(args[0])
+            args = args[1:]
+
+    result = run_fuzzer(options.get('data', DEFAULT_GAME_DATA_FILE), int(positional[0]) if positional else 100_000,
+                        int(options['processes']) if 'processes' in options else None,
+                        int(options.get('seed', 111)))
+    print("Played", result.sequences, "sequences,", result.commands, "commands, in", round(result.elapsed, 3),
+          "seconds")
+    print("Throughput:", round(result.sequences_per_second()), "sequences/second,",
+          round(result.commands_per_second()), "commands/second")
+    if result.divergence is None:
+        print("The interactive game and the simulation always agreed")
+        return 0
+    print("The engines disagree after these", len(result.divergence.commands), "commands:")
+    for command in result.divergence.commands:
+        print("   ", repr(command))
+    print("Interactive (location, score, moves, inventory, deposited):", result.divergence.interactive)
+    print("Simulated   (location, score, moves, inventory, deposited):", result.divergence.simulated)
+    return 1
+
+
+if __name__ == "__main__":
+    # When you are ready to check your work with python_ta, uncomment the following lines.
+    # (Delete the "#" and space before each line.)
+    # IMPORTANT: keep this code indented inside the "if __name__ == '__main__'" block
+    # import python_ta
+    # python_ta.check_all(config={
+    #     'max-line-length': 120,
+    #     'disable': ['R1705', 'E9998', 'E9999', 'static_type_checker']
+    # })
+
+    sys.exit(main(sys.argv[1:]))
@@ -0,0 +1,216 @@
+"""CSC111 Project 1: Text Adventure Game - Game Rules
+
+Instructions (READ THIS FIRST!)
+===============================
+
+This Python module contains the rules of a game world for Project 1: which locations are
+locked and which item unlocks each, which items cannot be dropped where, where items are
+deposited for points, how many items the player can carry, which items must be deposited
+to win, how many moves the player has and which items score when picked up. It is
+imported and used by the `game_world` module, which loads the rules with the rest of the
+world, and through the world by `adventure`, `simulation`, `solver` and `world_generator`.
+
+The rules are declared in the "rules" section of a game data file:
+
+    "rules": {
+      "carry_limit": 2,
+      "deposit_location": 15,
+      "deposit_refusal": "You can only deposit at Oak House!",
+      "locks": [{"location": 13, "key": "T-card", "refusal": "Robarts is locked! You need a T-card!"}],
+      "no_drop": [{"location": 13, "item": "T-card", "refusal": "You cannot drop the T-card here!"}],
+      "objectives": ["USB Drive", "Laptop Charger"],
+      "move_limit": 50,
+      "pickup_points": [{"item": "USB Drive", "points": 5}]
+    }
+
+Each refusal is what the player is told when the rule stops them, and may be left out.
+The game is won once every objective item has been deposited, and lost once the player
+has made move_limit moves. A world without objectives is never won, and one whose
+move_limit is left out or null is never lost. An item's pickup points are only scored the
+first time it is picked up.
+A game data file without a "rules" section is played with DEFAULT_RULES, the rules of
+the stock game.
+
+Copyright and Usage Information
+===============================
+
+This file is provided solely for the personal and private use of students
+taking CSC111 at the University of Toronto St. George campus. All forms of
+distribution of this code, whether as given or with any changes, are
+expressly prohibited. For more information on copyright for CSC111 materials,
+please consult our Course Syllabus.
+
+This file is Copyright (c) 2026 CSC111 Teaching Team
+"""
+from __future__ import annotations
+from typing import Any, Container, Optional
+
+
+class GameRules:
+    """The rules of a game world, compiled into tables indexed by location id, so that checking any rule
+    takes one or two dictionary lookups however many locations it covers.
+
+    Instance Attributes:
+        - deposit_location: the id of the location where items are deposited for points
+        - deposit_refusal: what the player is told when they try to deposit anywhere else
+        - carry_limit: the most items the player can carry at once
+        - locks: a mapping from the id of each locked location to the name of the item needed to enter it
+        - no_drop: the (item name, location id) pairs of items that cannot be dropped at a location
+        - objectives: the names of the items that must all be deposited to win, in the order they were added
+        - move_limit: the number of moves after which the game is lost, or None if it is never lost
+        - pickup_points: a mapping from the name of each item that scores when picked up to the points it scores
+          the first time it is picked up
+
+    Representation Invariants:
+        - self.carry_limit >= 1
+        - self.move_limit is None or self.move_limit >= 1
+        - len(set(self.objectives)) == len(self.objectives)
+        - all(points >= 0 for points in self.pickup_points.values())
+    """
+    deposit_location: int
+    deposit_refusal: str
+    carry_limit: int
+    locks: dict[int, str]
+    objectives: list[str]
+    move_limit: Optional[int]
+    pickup_points: dict[str, int]
+    # Private Instance Attributes:
+    #   - _lock_refusals: a mapping from the id of each locked location to what the player is told when they try
+    #                     to enter it without its key
+    #   - _drop_refusals: a mapping from the id of each location where some item cannot be dropped to a mapping
+    #                     from the name of each such item to what the player is told when they try to drop it there
+    _lock_refusals: dict[int, str]
+    _drop_refusals: dict[int, dict[str, str]]
+
+    def __init__(self, deposit_location: int, carry_limit: int, deposit_refusal: Optional[str] = None,
+                 move_limit: Optional[int] = None) -> None:
+        """Initialize new rules with the given deposit location, carry limit and move limit, and no locks,
+        no-drop rules, objectives or pickup points.
+
+        Add those with add_lock, add_no_drop, add_objective and add_pickup_points.
+        """
+        self.deposit_location = deposit_location
+        self.carry_limit = carry_limit
+        self.deposit_refusal = "You can't deposit anything here!" if deposit_refusal is None else deposit_refusal
+        self.move_limit = move_limit
+        self.locks = {}
+        self.objectives = []
+        self.pickup_points = {}
+        self._lock_refusals = {}
+        self._drop_refusals = {}
+
+    @classmethod
+    def from_data(cls, data: dict[str, Any]) -> GameRules:
+        """Return the rules described by the given parsed "rules" section of a game data JSON file."""
+        rules = cls(data['deposit_location'], data['carry_limit'], data.get('deposit_refusal'),
+                    data.get('move_limit'))
+        for lock in data.get('locks', []):
+            rules.add_lock(lock['location'], lock['key'], lock.get('refusal'))
+        for rule in data.get('no_drop', []):
+            rules.add_no_drop(rule['location'], rule['item'], rule.get('refusal'))
+        for item_name in data.get('objectives', []):
+            rules.add_objective(item_name)
+        for rule in data.get('pickup_points', []):
+            rules.add_pickup_points(rule['item'], rule['points'])
+        return rules
+
+    def to_data(self) -> dict[str, Any]:
+        """Return the "rules" section of a game data JSON file that declares these rules."""
+        return {
+            'carry_limit': self.carry_limit,
+            'deposit_location': self.deposit_location,
+            'deposit_refusal': self.deposit_refusal,
+            'locks': [{'location': loc_id, 'key': key, 'refusal': self._lock_refusals[loc_id]}
+                      for loc_id, key in self.locks.items()],
+            'no_drop': [{'location': loc_id, 'item': item_name, 'refusal': refusal}
+                        for loc_id, refusals in self._drop_refusals.items() for item_name, refusal in refusals.items()],
+            'objectives': list(self.objectives),
+            'move_limit': self.move_limit,
+            'pickup_points': [{'item': item_name, 'points': points} for item_name, points in self.pickup_points.items()]
+        }
+
+    def add_lock(self, loc_id: int, key: str, refusal: Optional[str] = None) -> None:
+        """Lock the location with the given id, so that only a player holding the item named key can enter it."""
+        self.locks[loc_id] = key
+        self._lock_refusals[loc_id] = f"That is locked! You need a {key}!" if refusal is None else refusal
+
+    def add_no_drop(self, loc_id: int, item_name: str, refusal: Optional[str] = None) -> None:
+        """Forbid dropping the item with the given name at the location with the given id."""
+        self._drop_refusals.setdefault(loc_id, {})[item_name] = \
+            f"You cannot drop the {item_name} here!" if refusal is None else refusal
+
+    def add_objective(self, item_name: str) -> None:
+        """Make depositing the item with the given name one of the objectives that must all be met to win."""
+        if item_name not in self.objectives:
+            self.objectives.append(item_name)
+
+    def add_pickup_points(self, item_name: str, points: int) -> None:
+        """Make picking up the item with the given name score the given points, the first time it is picked up.
+
+        Preconditions:
+            - points >= 0
+        """
+        self.pickup_points[item_name] = points
+
+    @property
+    def no_drop(self) -> frozenset[tuple[str, int]]:
+        """The (item name, location id) pairs of items that cannot be dropped at a location."""
+        return frozenset((item_name, loc_id) for loc_id, refusals in self._drop_refusals.items()
+                         for item_name in refusals)
+
+    def entry_refusal(self, loc_id: int, inventory: Container[str]) -> Optional[str]:
+        """Return what the player is told when they try to enter the location with the given id holding the items
+        named in inventory, or None if they may enter it."""
+        key = self.locks.get(loc_id)
+        if key is None or key in inventory:
+            return None
+        return self._lock_refusals[loc_id]
+
+    def drop_refusal(self, loc_id: int, item_name: str) -> Optional[str]:
+        """Return what the player is told when they try to drop the item with the given name at the location with
+        the given id, or None if they may drop it there."""
+        refusals = self._drop_refusals.get(loc_id)
+        if refusals is None:
+            return None
+        return refusals.get(item_name)
+
+
+# The rules of the stock game, which a game data file without a "rules" section is played with
+DEFAULT_RULES = GameRules.from_data({
+    'carry_limit': 2,
+    'deposit_location': 15,
+    'deposit_refusal': "You can only deposit at Oak House!",
+    'locks': [
+        {'location': 13, 'key': 'T-card', 'refusal': "Robarts is locked! You need a T-card!"},
+        {'location': 15, 'key': 'Dorm Key', 'refusal': "Oak House is locked! You need a Dorm Key!"}
+    ],
+    'no_drop': [
+        {'location': 13, 'item': 'T-card', 'refusal': "You cannot drop the T-card here!"},
+        {'location': 15, 'item': 'Dorm Key', 'refusal': "You cannot drop the Dorm Key here!"}
+    ],
+    'objectives': ['USB Drive', 'Laptop Charger', 'Lucky Mug'],
+    'move_limit': 50,
+    'pickup_points': [
+        {'item': 'USB Drive', 'points': 0},
+        {'item': 'Laptop Charger', 'points': 0},
+        {'item': 'Lucky Mug', 'points': 0}
+    ]
+})
+
+
+def rules_from_data(data: Optional[dict[str, Any]]) -> GameRules:
+    """Return the rules described by the given parsed "rules" section of a game data JSON file, or DEFAULT_RULES
+    if the file has no such section."""
+    return DEFAULT_RULES if data is None else GameRules.from_data(data)
+
+
+if __name__ == "__main__":
+    pass
+    # When you are ready to check your work with python_ta, uncomment the following lines.
+    # (Delete the "#" and space before each line.)
+    # IMPORTANT: keep this code indented inside the "if __name__ == '__main__'" block
+    # import python_ta
+    # python_ta.check_all(config={
+    #     'max-line-length': 120,
+    #     'disable': ['R1705', 'E9998', 'E9999', 'static_type_checker']
+    # })
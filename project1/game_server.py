@@ -0,0 +1,209 @@
+"""CSC111 Project 1: Text Adventure Game - Game Server
+
+Instructions (READ THIS FIRST!)
+===============================
+
+This Python module contains code for Project 1 that lets many players play the game at
+once over the network. Run it from the repository root:
+
+    python project1/game_server.py [GAME_DATA_FILE] [--host HOST] [--port PORT]
+    python project1/game_server.py [GAME_DATA_FILE] --unix SOCKET_PATH
+
+serves the given game data file (project1/game_data.json by default) over TCP (on
+127.0.0.1, port 1111 by default) or on a Unix socket. Each connection plays its own game,
+exactly as play.py would: the server sends what the game shows, ending with the prompt
+PROMPT, and the player answers with one command per line. The server closes the
+connection once the game is won, lost or quit. For example, to play by hand:
+
+    nc 127.0.0.1 1111
+
+The game data file is loaded once into a GameWorld that every game shares; each game only
+copies the locations it changes. Games are not journaled, so a game whose connection
+drops is gone.
+
+Copyright and Usage Information
+===============================
+
+This file is provided solely for the personal and private use of students
+taking CSC111 at the University of Toronto St. George campus. All forms of
+distribution of this code, whether as given or with any changes, are
+expressly prohibited. For more information on copyright for CSC111 materials,
+please consult our Course Syllabus.
+
+This file is Copyright (c) 2026 CSC111 Teaching Team
+"""
+from __future__ import annotations
+import asyncio
+import sys
+from typing import Optional
+
+from adventure import AdventureGame, GameSession, DEFAULT_GAME_DATA_FILE
+from event_logger import CompactEventList
+from game_world import GameWorld
+from output_sink import ListSink
+
+# The prompt sent after everything the game shows, whenever it is waiting for the player's next command
+PROMPT = "\nEnter action: "
+
+DEFAULT_HOST = '127.0.0.1'
+DEFAULT_PORT = 1111
+
+# The longest command line, in bytes, that a player can send; the connection is closed on a longer one
+MAX_COMMAND_LENGTH = 1024
+
+USAGE = "Usage: python project1/game_server.py [GAME_DATA_FILE] [--host HOST] [--port PORT]\n" \
+        "       python project1/game_server.py [GAME_DATA_FILE] --unix SOCKET_PATH"
+
+
+class GameServer:
+    """A server that plays one game per connection, with every game sharing one loaded world.
+
+    Instance Attributes:
+        - game_data_file: the game data file the world was loaded from
+        - world: the world every game is played in
+        - initial_location_id: the location every game starts at
+        - idle_timeout: the number of seconds a connection may wait before sending its next command,
+          or None if it may wait forever
+        - num_sessions: the number of games being played right now
+        - games_played: the number of games started since the server was created
+
+    Representation Invariants:
+        - self.initial_location_id in self.world.locations
+        - self.idle_timeout is None or self.idle_timeout > 0
+        - 0 <= self.num_sessions <= self.games_played
+    """
+    game_data_file: str
+    world: GameWorld
+    initial_location_id: int
+    idle_timeout: Optional[float]
+    num_sessions: int
+    games_played: int
+
+    def __init__(self, game_data_file: str = DEFAULT_GAME_DATA_FILE, initial_location_id: int = 1,
+                 world: Optional[GameWorld] = None, idle_timeout: Optional[float] = 300.0) -> None:
+        """Initialize a server for the given game data file, loading it unless its world is given.
+
+        Preconditions:
+            - game_data_file is the filename of a valid game data JSON file
+            - world is None or world was loaded from game_data_file
+        """
+        self.game_data_file = game_data_file
+        self.world = GameWorld.load(game_data_file) if world is None else world
+        self.initial_location_id = initial_location_id
+        self.idle_timeout = idle_timeout
+        self.num_sessions = 0
+        self.games_played = 0
+
+    def new_session(self) -> GameSession:
+        """Return a session for a new game in this server's world, whose output is kept in a ListSink."""
+        game = AdventureGame(self.game_data_file, self.initial_location_id, self.world)
+        return GameSession(game, CompactEventList(), ListSink())
+
+    async def serve(self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter) -> None:
+        """Play a new game with the player on the other end of the given connection, until the game is over
+        or the player disconnects, and then close the connection."""
+        session = self.new_session()
+        self.num_sessions += 1
+        self.games_played += 1
+        try:
+            session.start()
+            while True:
+                writer.write(_take_output(session).encode('utf-8'))
+                await writer.drain()
+                if session.over:
+                    break
+
+                if self.idle_timeout is None:
+                    line = await reader.readline()
+                else:
+                    line = await asyncio.wait_for(reader.readline(), self.idle_timeout)
+                if not line.endswith(b'\n'):
+                    break  # The player disconnected, possibly partway through a command
+                session.handle(line.decode('utf-8', 'replace'))
+        except (ConnectionError, ValueError, asyncio.TimeoutError):
+            pass  # The player disconnected, sent an overlong command or went idle for too long
+        finally:
+            self.num_sessions -= 1
+            writer.close()
+            try:
+                await writer.wait_closed()
+            except ConnectionError:
+                pass
+
+    async def start_tcp(self, host: str = DEFAULT_HOST, port: int = DEFAULT_PORT) -> asyncio.AbstractServer:
+        """Start accepting players over TCP on the given host and port, and return the listening server.
+
+        If port is 0, a free port is chosen; the listening server's sockets tell which one.
+        """
+        return await asyncio.start_server(self.serve, host, port, limit=MAX_COMMAND_LENGTH, backlog=1024)
+
+    async def start_unix(self, path: str) -> asyncio.AbstractServer:
+        """Start accepting players on a Unix socket at the given path, and return the listening server."""
+        return await asyncio.start_unix_server(self.serve, path, limit=MAX_COMMAND_LENGTH, backlog=1024)
+
+
+def _take_output(session: GameSession) -> str:
+    """Return everything the given session has shown since this was last called, followed by PROMPT if it is
+    waiting for a command, and forget it."""
+    lines = session.sink.lines
+    text = ''.join(line + '\n' for line in lines)
+    lines.clear()
+    if not session.over:
+        text += PROMPT
+    return text
+
+
+async def run_server(game_data_file: str, host: str = DEFAULT_HOST, port: int = DEFAULT_PORT,
+                     unix_path: Optional[str] = None) -> None:
+    """Serve the given game data file until interrupted, over TCP on host and port, or on a Unix socket at
+    unix_path if it is given."""
+    game_server = GameServer(game_data_file)
+    if unix_path is None:
+        server = await game_server.start_tcp(host, port)
+    else:
+        server = await game_server.start_unix(unix_path)
+    addresses = ', '.join(str(sock.getsockname()) for sock in server.sockets)
+    print("Serving", game_data_file, "on", addresses)
+    async with server:
+        await server.serve_forever()
+
+
+def main(args: list[str]) -> int:
+    """Run the server with the given command line arguments and return its exit status."""
+    options = {}
+    positional = []
+    while args:
+        if args[0] in ('--host', '--port', '--unix') and len(args) > 1:
+            options[args[0][2:]] = args[1]
+            args = args[2:]
+        elif args[0].startswith('-') or positional:
+            print(USAGE, file=sys.stderr)
+            return 2
+        else:
+            positional.append(args[0])
+            args = args[1:]
+    if 'unix' in options and ('host' in options or 'port' in options) \
+            or not options.get('port', '0').isdigit():
+        print(USAGE, file=sys.stderr)
+        return 2
+
+    game_data_file = positional[0] if positional else DEFAULT_GAME_DATA_FILE
+    try:
+        asyncio.run(run_server(game_data_file, options.get('host', DEFAULT_HOST),
+                               int(options.get('port', DEFAULT_PORT)), options.get('unix')))
+    except KeyboardInterrupt:
+        pass
+    return 0
+
+
+if __name__ == "__main__":
+    # When you are ready to check your work with python_ta, uncomment the following lines.
+    # (Delete the "#" and space before each line.)
+    # IMPORTANT: keep this code indented inside the "if __name__ == '__main__'" block
+    # import python_ta
+    # python_ta.check_all(config={
+    #     'max-line-length': 120,
+    #     'disable': ['R1705', 'E9998', 'E9999', 'static_type_checker']
+    # })
+
+    sys.exit(main(sys.argv[1:]))
@@ -0,0 +1,194 @@
+"""CSC111 Project 1: Text Adventure Game - Game Snapshots
+
+Instructions (READ THIS FIRST!)
+===============================
+
+This Python module contains the binary snapshot format for Project 1, to be imported and
+used by the `adventure` module through AdventureGame.snapshot and AdventureGame.restore.
+
+A snapshot records the state of one game as differences from the initial state of the
+world it is played in, so its size depends only on how much the game has changed, not on
+how big the world is. Items are stored by their index in the world's items. All numbers
+are little-endian:
+
+    header      version (B), the first 8 bytes of the world's data hash, or zeros (8s),
+                current location id, score, moves (3 x i), number of inventory items,
+                deposited items, scored pickups (3 x H), changed locations (I)
+    inventory   one item index (H) per item, in inventory order
+    deposited   one item index (H) per deposited item, in increasing order
+    scored      one item index (H) per item whose pickup points have been scored, in
+                increasing order
+    locations   for each changed location, in increasing order of id: its id (i), flags (B),
+                and, if the ITEMS flag is set, its number of items (H) followed by one item
+                index (H) per item, in order
+
+A location is changed if it has been visited, or its items have changed, since the start
+of the game. Its VISITED flag is its visited value, whether or not that changed. Because
+nothing else is stored and everything unordered is sorted, two games in the same state have
+byte-for-byte equal snapshots, however they got there.
+
+Copyright and Usage Information
+===============================
+
+This file is provided solely for the personal and private use of students
+taking CSC111 at the University of Toronto St. George campus. All forms of
+distribution of this code, whether as given or with any changes, are
+expressly prohibited. For more information on copyright for CSC111 materials,
+please consult our Course Syllabus.
+
+This file is Copyright (c) 2026 CSC111 Teaching Team
+"""
+from __future__ import annotations
+import struct
+from dataclasses import dataclass
+from typing import Iterable, Optional
+
+from game_entities import Location
+from game_world import GameWorld
+
+SNAPSHOT_VERSION = 2
+
+_HEADER = struct.Struct('<B8siiiHHHI')
+_LOCATION = struct.Struct('<iB')
+_COUNT = struct.Struct('<H')
+
+# The flags of a changed location
+VISITED = 1
+ITEMS = 2
+
+
+@dataclass
+class GameState:
+    """The state of a game decoded from a snapshot.
+
+    Instance Attributes:
+        - current_location_id: The ID of the location the player is at
+        - score: The player's score
+        - moves: The number of moves the player has made
+        - inventory: The names of the items in the player's inventory, in order
+        - deposited_items: The names of the items that have been deposited
+        - scored_pickups: The names of the items whose pickup points have been scored
+        - changed_locations: The id, visited value and item names of every location that differs from its
+          initial state, where the item names are None if the location's items have not changed
+
+    Representation Invariants:
+        - self.score >= 0
+        - self.moves >= 0
+    """
+    current_location_id: int
+    score: int
+    moves: int
+    inventory: list[str]
+    deposited_items: list[str]
+    scored_pickups: list[str]
+    changed_locations: list[tuple[int, bool, Optional[list[str]]]]
+
+
+def _world_tag(world: GameWorld) -> bytes:
+    """Return the 8 bytes identifying world in a snapshot: the start of its data hash, or zeros if it has none."""
+    if world.data_hash is None:
+        return bytes(8)
+    return bytes.fromhex(world.data_hash[:16])
+
+
+def _item_ids(world: GameWorld, item_names: Iterable[str]) -> list[int]:
+    """Return the index in world.items of each of the given item names.
+
+    Raise ValueError if any of them is not the name of an item in world.
+    """
+    ids = []
+    for item_name in item_names:
+        item_id = world.item_id(item_name)
+        if item_id is None:
+            raise ValueError(f"{item_name!r} is not an item of this world")
+        ids.append(item_id)
+    return ids
+
+
+def encode_snapshot(world: GameWorld, current_location_id: int, score: int, moves: int, inventory: Iterable[str],
+                    deposited_items: Iterable[str], scored_pickups: Iterable[str],
+                    locations: Iterable[Location]) -> bytes:
+    """Return the snapshot of a game in world with the given state.
+
+    locations must include every location whose state may differ from the world's, in any order; locations that
+    turn out not to differ are left out of the snapshot.
+
+    Preconditions:
+        - current_location_id in world.locations
+        - len(world.items) <= 2 ** 16
+    """
+    inventory_ids = _item_ids(world, inventory)
+    deposited_ids = sorted(_item_ids(world, deposited_items))
+    scored_ids = sorted(_item_ids(world, scored_pickups))
+
+    parts = []
+    num_changed = 0
+    for location in sorted(locations, key=lambda loc: loc.id_num):
+        initial = world.locations[location.id_num]
+        flags = VISITED if location.visited else 0
+        if location.items != initial.items:
+            flags |= ITEMS
+        elif location.visited == initial.visited:
+            continue
+        num_changed += 1
+        parts.append(_LOCATION.pack(location.id_num, flags))
+        if flags & ITEMS:
+            item_ids = _item_ids(world, location.items)
+            parts.append(struct.pack(f'<{len(item_ids) + 1}H', len(item_ids), *item_ids))
+
+    header = _HEADER.pack(SNAPSHOT_VERSION, _world_tag(world), current_location_id, score, moves,
+                          len(inventory_ids), len(deposited_ids), len(scored_ids), num_changed)
+    counts = len(inventory_ids) + len(deposited_ids) + len(scored_ids)
+    return b''.join([header, struct.pack(f'<{counts}H', *inventory_ids, *deposited_ids, *scored_ids)] + parts)
+
+
+def decode_snapshot(world: GameWorld, snapshot: bytes) -> GameState:
+    """Return the game state recorded in the given snapshot of a game in world.
+
+    Raise ValueError if the snapshot is of a different version, was taken in a world loaded from different
+    game data, or is truncated.
+    """
+    try:
+        version, tag, current_location_id, score, moves, num_inventory, num_deposited, num_scored, num_changed = \
+            _HEADER.unpack_from(snapshot)
+        if version != SNAPSHOT_VERSION:
+            raise ValueError(f"snapshot version {version} is not {SNAPSHOT_VERSION}")
+        if tag != _world_tag(world):
+            raise ValueError("snapshot was taken in a world with different game data")
+
+        items = world.items
+        offset = _HEADER.size
+        item_ids = struct.unpack_from(f'<{num_inventory + num_deposited + num_scored}H', snapshot, offset)
+        offset += 2 * len(item_ids)
+        inventory = [items[item_id].name for item_id in item_ids[:num_inventory]]
+        deposited_items = [items[item_id].name for item_id in item_ids[num_inventory:num_inventory + num_deposited]]
+        scored_pickups = [items[item_id].name for item_id in item_ids[num_inventory + num_deposited:]]
+
+        changed_locations = []
+        for _ in range(num_changed):
+            loc_id, flags = _LOCATION.unpack_from(snapshot, offset)
+            offset += _LOCATION.size
+            location_items = None
+            if flags & ITEMS:
+                num_items = _COUNT.unpack_from(snapshot, offset)[0]
+                location_ids = struct.unpack_from(f'<{num_items}H', snapshot, offset + _COUNT.size)
+                offset += _COUNT.size + 2 * num_items
+                location_items = [items[item_id].name for item_id in location_ids]
+            changed_locations.append((loc_id, bool(flags & VISITED), location_items))
+    except (struct.error, IndexError) as error:
+        raise ValueError(f"snapshot is truncated or corrupt: {error}") from error
+
+    return GameState(current_location_id, score, moves, inventory, deposited_items, scored_pickups,
+                     changed_locations)
+
+
+if __name__ == "__main__":
+    pass
+    # When you are ready to check your work with python_ta, uncomment the following lines.
+    # (Delete the "#" and space before each line.)
+    # IMPORTANT: keep this code indented inside the "if __name__ == '__main__'" block
+    # import python_ta
+    # python_ta.check_all(config={
+    #     'max-line-length': 120,
+    #     'disable': ['R1705', 'E9998', 'E9999', 'static_type_checker']
+    # })
@@ -0,0 +1,295 @@
+"""CSC111 Project 1: Text Adventure Game - Game World
+
+Instructions (READ THIS FIRST!)
+===============================
+
+This Python module contains the shared, read-only world data for Project 1, to be
+imported and used by the `adventure` module.
+
+A GameWorld is loaded once from a game data file and can then be shared by any
+number of AdventureGame instances. Everything a player can change (the items lying
+at a location and whether it has been visited) is kept per game in a LocationOverlay,
+which only copies a location out of the world when that game first touches it.
+
+A world's locations may be any read-only mapping from location id to Location, such as
+the LazyLocations of the `lazy_world` module, which only reads a location from the game
+data file when it is first asked for.
+
+Copyright and Usage Information
+===============================
+
+This file is provided solely for the personal and private use of students
+taking CSC111 at the University of Toronto St. George campus. All forms of
+distribution of this code, whether as given or with any changes, are
+expressly prohibited. For more information on copyright for CSC111 materials,
+please consult our Course Syllabus.
+
+This file is Copyright (c) 2026 CSC111 Teaching Team
+"""
+from __future__ import annotations
+import copy
+import hashlib
+import json
+import os
+from types import MappingProxyType
+from typing import Any, Iterable, Mapping, Optional
+
+from action_menu import ActionTable
+from game_entities import Location, Item
+from game_rules import DEFAULT_RULES, GameRules, rules_from_data
+from instrumentation import timed
+from routing import ROUTING_CACHE_DIR, RoutingTable, load_routing_table
+
+
+class GameWorld:
+    """The static data of a text adventure game world, shared by every game played in it.
+
+    A GameWorld is never modified after it is created. Games must not change the Location
+    objects it holds; they work on copies made by new_location instead.
+
+    Instance Attributes:
+        - locations: a read-only mapping from location id to the initial state of that Location
+        - items: all items in the game
+        - rules: the rules the game is played by
+        - data_file: the name of the game data file this world was loaded from, or None
+        - data_hash: the SHA-256 hex digest of the contents of data_file, or None
+        - objective_mask: the items of this world that are objectives of its rules, as a bitset of item ids;
+          an objective that names no item of this world is left out, and can never be met
+
+    Representation Invariants:
+        - all(loc_id == self.locations[loc_id].id_num for loc_id in self.locations)
+    """
+    # Private Instance Attributes:
+    #   - _locations: a mapping from location id to the initial state of that Location
+    #   - _items: all items in the game
+    #   - _items_by_name: a mapping from each item's name to the Item
+    #   - _items_by_lower_name: a mapping from each item's lower-cased name to the Item
+    #   - _item_ids: a mapping from each item's name to its index in _items
+    #   - _locations_by_lower_name: a mapping from each location's lower-cased name to its id, or None if no
+    #                               location has been looked up by name yet
+    #   - _action_tables: a mapping from location id to the ActionTable of that location, for every location
+    #                     whose table has been asked for
+    #   - _routing_table: the RoutingTable of this world, or None if it has not been asked for yet
+    rules: GameRules
+    data_file: Optional[str]
+    data_hash: Optional[str]
+    objective_mask: int
+    _locations: Mapping[int, Location]
+    _items: tuple[Item, ...]
+    _items_by_name: dict[str, Item]
+    _items_by_lower_name: dict[str, Item]
+    _item_ids: dict[str, int]
+    _locations_by_lower_name: Optional[dict[str, int]]
+    _action_tables: dict[int, ActionTable]
+    _routing_table: Optional[RoutingTable]
+
+    def __init__(self, locations: Mapping[int, Location], items: list[Item],
+                 data_file: Optional[str] = None, data_hash: Optional[str] = None,
+                 rules: Optional[GameRules] = None) -> None:
+        """Initialize a new game world with the given locations, items and rules (by default, DEFAULT_RULES),
+        loaded from the game data file with the given name and contents hash, if any.
+
+        The world takes ownership of the given Location objects; they must not be changed afterwards.
+        """
+        self.rules = DEFAULT_RULES if rules is None else rules
+        self.data_file = data_file
+        self.data_hash = data_hash
+        self._locations = locations
+        self._items = tuple(items)
+        self._locations_by_lower_name = None
+
+        self._items_by_name = {}
+        self._items_by_lower_name = {}
+        self._item_ids = {}
+        for item_id, item in enumerate(self._items):
+            self._items_by_name.setdefault(item.name, item)
+            self._items_by_lower_name.setdefault(item.name.lower(), item)
+            self._item_ids.setdefault(item.name, item_id)
+        self.objective_mask = 0
+        for item_name in self.rules.objectives:
+            item_id = self._item_ids.get(item_name)
+            if item_id is not None:
+                self.objective_mask |= 1 << item_id
+
+        self._action_tables = {}
+        self._routing_table = None
+
+    @classmethod
+    @timed('adventure_world_load', 'json')
+    def load(cls, filename: str) -> GameWorld:
+        """Return the game world stored in the JSON file with the given filename.
+
+        Preconditions:
+            - filename is the filename of a valid game data JSON file
+        """
+        with open(filename, 'rb') as f:
+            contents = f.read()
+        data = json.loads(contents)  # This loads all the data from the JSON file
+
+        return cls.from_data(data, filename, hashlib.sha256(contents).hexdigest())
+
+    @classmethod
+    def from_data(cls, data: dict[str, Any], data_file: Optional[str] = None,
+                  data_hash: Optional[str] = None) -> GameWorld:
+        """Return the game world described by the given parsed game data JSON, read from the game data file
+        with the given name and contents hash, if any."""
+
+        locations = {}
+        for loc_data in data['locations']:  # Go through each element associated with the 'locations' key in the file
+            locations[loc_data['id']] = location_from_data(loc_data)
+
+        items = [item_from_data(item_data) for item_data in data['items']]
+
+        return cls(locations, items, data_file, data_hash, rules_from_data(data.get('rules')))
+
+    @property
+    def locations(self) -> Mapping[int, Location]:
+        """A read-only mapping from location id to the initial state of that Location."""
+        return MappingProxyType(self._locations)
+
+    @property
+    def items(self) -> tuple[Item, ...]:
+        """All items in the game."""
+        return self._items
+
+    def get_item(self, name: str) -> Optional[Item]:
+        """Return the item with exactly the given name, or None if no such item exists."""
+        return self._items_by_name.get(name)
+
+    def item_id(self, name: str) -> Optional[int]:
+        """Return the index in items of the item with exactly the given name, or None if no such item exists."""
+        return self._item_ids.get(name)
+
+    def item_mask(self, names: Iterable[str]) -> Optional[int]:
+        """Return the items with the given names as a bitset, with bit i set for the item whose index in items is
+        i, or None if any of the names is not the name of an item."""
+        mask = 0
+        for name in names:
+            item_id = self._item_ids.get(name)
+            if item_id is None:
+                return None
+            mask |= 1 << item_id
+        return mask
+
+    def find_item(self, name: str) -> Optional[Item]:
+        """Return the item whose lower-cased name is the given name, or None if no such item exists.
+
+        Preconditions:
+            - name == name.lower()
+        """
+        return self._items_by_lower_name.get(name)
+
+    def find_location(self, name: str) -> Optional[int]:
+        """Return the id of the location whose lower-cased name is the given name, or None if no such location
+        exists.
+
+        The first lookup goes through every location in the world.
+
+        Preconditions:
+            - name == name.lower()
+        """
+        if self._locations_by_lower_name is None:
+            self._locations_by_lower_name = {}
+            for loc_id, location in self._locations.items():
+                self._locations_by_lower_name.setdefault(location.name.lower(), loc_id)
+        return self._locations_by_lower_name.get(name)
+
+    def get_routing_table(self) -> RoutingTable:
+        """Return the routing table of this world, getting it the first time it is asked for.
+
+        A world loaded from a file keeps its table in a cache directory next to that file, under the file's
+        hash, so the table is only built once for the same game data.
+        """
+        if self._routing_table is None:
+            if self.data_file is None or self.data_hash is None:
+                self._routing_table = RoutingTable(self._locations, self.rules.locks)
+            else:
+                cache_dir = os.path.join(os.path.dirname(self.data_file), ROUTING_CACHE_DIR)
+                self._routing_table = load_routing_table(self._locations, self.rules.locks, self.data_hash,
+                                                         cache_dir)
+        return self._routing_table
+
+    def get_action_table(self, loc_id: int) -> ActionTable:
+        """Return the action table of the location with the given id, building it the first time it is asked for.
+
+        Preconditions:
+            - loc_id in self.locations
+        """
+        table = self._action_tables.get(loc_id)
+        if table is None:
+            table = ActionTable(self._locations[loc_id])
+            self._action_tables[loc_id] = table
+        return table
+
+    def new_location(self, loc_id: int) -> Location:
+        """Return a fresh copy of the location with the given id, in its initial state, that a game may change.
+
+        Only the item list is copied; descriptions and available commands are shared with this world. The copy
+        is of the same class as the world's location, so a location whose descriptions are read on demand, such
+        as a CompiledLocation, stays that way.
+
+        Preconditions:
+            - loc_id in self.locations
+        """
+        template = self._locations[loc_id]
+        if type(template) is not Location:
+            location = copy.copy(template)
+            location.items = list(template.items)
+            return location
+        return Location(template.id_num, template.brief_description, template.long_description,
+                        template.available_commands, list(template.items), template.name, template.visited)
+
+
+def location_from_data(loc_data: dict[str, Any]) -> Location:
+    """Return the Location described by the given parsed location record of a game data JSON file."""
+    return Location(loc_data['id'], loc_data['brief_description'], loc_data['long_description'],
+                    loc_data['available_commands'], loc_data['items'], loc_data['name'], loc_data['visited'])
+
+
+def item_from_data(item_data: dict[str, Any]) -> Item:
+    """Return the Item described by the given parsed item record of a game data JSON file."""
+    return Item(item_data['name'], item_data['start_position'], item_data['target_position'],
+                item_data['target_points'], item_data['description'])
+
+
+class LocationOverlay(dict):
+    """A mapping from location id to the Location objects of one game, copied out of a GameWorld on demand.
+
+    Looking up a location that this game has not touched yet copies it from the world and remembers
+    the copy, so a new game costs nothing up front and only holds the locations it has actually used.
+    Iterating over an overlay, or taking its length, only covers the locations copied so far.
+
+    Instance Attributes:
+        - world: the world this overlay copies locations from
+    """
+    world: GameWorld
+
+    def __init__(self, world: GameWorld) -> None:
+        """Initialize a new overlay over the given world, with no locations touched yet."""
+        super().__init__()
+        self.world = world
+
+    def __missing__(self, loc_id: int) -> Location:
+        """Copy the location with the given id out of the world, remember it and return it.
+
+        Raise KeyError if the world has no such location.
+        """
+        location = self.world.new_location(loc_id)
+        self[loc_id] = location
+        return location
+
+    def __contains__(self, loc_id: object) -> bool:
+        """Return whether the world has a location with the given id, whether or not it has been touched."""
+        return loc_id in self.world.locations
+
+
+if __name__ == "__main__":
+    pass
+    # When you are ready to check your work with python_ta, uncomment the following lines.
+    # (Delete the "#" and space before each line.)
+    # IMPORTANT: keep this code indented inside the "if __name__ == '__main__'" block
+    # import python_ta
+    # python_ta.check_all(config={
+    #     'max-line-length': 120,
+    #     'disable': ['R1705', 'E9998', 'E9999', 'static_type_checker']
+    # })
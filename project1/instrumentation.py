@@ -0,0 +1,285 @@
+"""CSC111 Project 1: Text Adventure Game - Instrumentation
+
+Instructions (READ THIS FIRST!)
+===============================
+
+This Python module contains opt-in instrumentation for Project 1, to be imported and used
+by the `adventure`, `simulation`, `game_world`, `lazy_world` and `compiled_world` modules.
+
+While instrumentation is enabled, the game records how long each command takes and how
+many memory blocks it leaves allocated, both by command kind (go, go to, pick up, drop,
+deposit or menu) and by the id of the location the command was entered at, as well as how
+long listing the available actions and loading a world take. Every measurement is added
+to a histogram, and the histograms can be written to a file in the Prometheus text
+exposition format, which most monitoring tools read.
+
+Instrumentation is off by default; it costs the game one check of the module-level
+recorder per command while it is off. It is enabled by calling enable, or, for any
+program in this project, by setting the ADVENTURE_METRICS environment variable to the
+name of a file, which the histograms are then written to when the program exits:
+
+    ADVENTURE_METRICS=metrics.prom python project1/simulation.py
+
+Only the measurements of the process that imported this module first are written; worker
+processes started by batch_runner or fuzzer record their own, which are not collected.
+
+Copyright and Usage Information
+===============================
+
+This file is provided solely for the personal and private use of students
+taking CSC111 at the University of Toronto St. George campus. All forms of
+distribution of this code, whether as given or with any changes, are
+expressly prohibited. For more information on copyright for CSC111 materials,
+please consult our Course Syllabus.
+
+This file is Copyright (c) 2026 CSC111 Teaching Team
+"""
+from __future__ import annotations
+import atexit
+import bisect
+import functools
+import os
+import sys
+import time
+from typing import Any, Callable, Optional
+
+from command_parser import MENU_VERBS
+
+# The environment variable that, when set to a filename, enables instrumentation and names the file the histograms
+# are written to when the program exits
+METRICS_ENV = 'ADVENTURE_METRICS'
+
+# The label value of every menu command (look, inventory, score, log and quit)
+MENU = "menu"
+
+# The upper bounds of the histogram buckets of times, in seconds: 1, 2.5 and 5 times each power of ten from a
+# microsecond to a second, and ten seconds
+SECONDS_BUCKETS = tuple(m * 10.0 ** e for e in range(-6, 1) for m in (1, 2.5, 5)) + (10.0,)
+
+# The upper bounds of the histogram buckets of allocated memory blocks: zero and each power of two up to 2 ** 20
+BLOCKS_BUCKETS = (0.0,) + tuple(float(2 ** e) for e in range(21))
+
+# The name and help text of every metric. Each measurement is a time and a number of allocated blocks,
+# recorded in the '_seconds' and '_allocated_blocks' histograms of the same metric.
+METRICS = {
+    'adventure_command': "A command carried out by the game, by command kind",
+    'adventure_location_command': "A command carried out by the game, by the id of the location it was entered at",
+    'adventure_get_available_actions': "Listing the actions available at a location",
+    'adventure_world_load': "Loading a game world, by loader"
+}
+
+# The label name of each metric's histograms, or None if they have no label
+LABEL_NAMES = {
+    'adventure_command': 'command',
+    'adventure_location_command': 'location',
+    'adventure_get_available_actions': None,
+    'adventure_world_load': 'loader'
+}
+
+
+class Histogram:
+    """A histogram of measurements, counted in buckets with fixed upper bounds.
+
+    Instance Attributes:
+        - bounds: the upper bound of each bucket but the last, in increasing order; the last bucket has no bound
+        - counts: the number of measurements in each bucket: counts[i] counts the measurements that are greater
+          than bounds[i - 1] (if i > 0) and at most bounds[i] (if i < len(bounds))
+        - total: the sum of all measurements
+        - count: the number of measurements
+
+    Representation Invariants:
+        - len(self.counts) == len(self.bounds) + 1
+        - self.count == sum(self.counts)
+    """
+    bounds: tuple[float, ...]
+    counts: list[int]
+    total: float
+    count: int
+
+    def __init__(self, bounds: tuple[float, ...]) -> None:
+        """Initialize a new empty histogram with buckets of the given upper bounds."""
+        self.bounds = bounds
+        self.counts = [0] * (len(bounds) + 1)
+        self.total = 0.0
+        self.count = 0
+
+    def observe(self, value: float) -> None:
+        """Add the given measurement to this histogram.
+
+        >>> histogram = Histogram((1.0, 10.0))
+        >>> for value in [0.5, 1.0, 3.0, 20.0]:
+        ...     histogram.observe(value)
+        >>> histogram.counts
+        [2, 1, 1]
+        """
+        self.counts[bisect.bisect_left(self.bounds, value)] += 1
+        self.total += value
+        self.count += 1
+
+
+def _label(name: Optional[str], value: str, bound: Optional[str] = None) -> str:
+    """Return the label set of a sample with the given label name and value, and bucket bound if it is a bucket.
+
+    >>> _label('command', 'go', '0.5')
+    '{command="go",le="0.5"}'
+    >>> _label(None, '')
+    ''
+    """
+    labels = []
+    if name is not None:
+        escaped = value.replace('\\', '\\\\').replace('"', '\\"').replace('\n', '\\n')
+        labels.append(f'{name}="{escaped}"')
+    if bound is not None:
+        labels.append(f'le="{bound}"')
+    return '{' + ','.join(labels) + '}' if labels else ''
+
+
+class Recorder:
+    """The histograms of everything measured while instrumentation is enabled.
+
+    Instance Attributes:
+        - histograms: a mapping from the name of each histogram (a metric's name followed by '_seconds' or
+          '_allocated_blocks') to a mapping from each label value to its histogram
+
+    Representation Invariants:
+        - all(any(name in (metric + '_seconds', metric + '_allocated_blocks') for metric in METRICS)
+              for name in self.histograms)
+    """
+    histograms: dict[str, dict[str, Histogram]]
+
+    def __init__(self) -> None:
+        """Initialize a new recorder with no measurements."""
+        self.histograms = {}
+
+    @staticmethod
+    def start() -> tuple[float, int]:
+        """Return the current time and number of allocated memory blocks, to be passed to record once the
+        measured work is done."""
+        return time.perf_counter(), sys.getallocatedblocks()
+
+    def record(self, metric: str, label_value: str, start: tuple[float, int]) -> None:
+        """Record the time taken and memory blocks left allocated since start, which start returned, as one
+        measurement of the given metric with the given label value.
+
+        A measurement that freed more blocks than it allocated is recorded as allocating none.
+
+        Preconditions:
+            - metric in METRICS
+        """
+        seconds = time.perf_counter() - start[0]
+        blocks = max(0, sys.getallocatedblocks() - start[1])
+        self._histogram(metric + '_seconds', label_value, SECONDS_BUCKETS).observe(seconds)
+        self._histogram(metric + '_allocated_blocks', label_value, BLOCKS_BUCKETS).observe(blocks)
+
+    def start_command(self, verb: str, loc_id: int) -> tuple[str, int, float, int]:
+        """Return what finish_command needs to record a command with the given verb, entered at the location with
+        the given id, that starts now."""
+        return verb, loc_id, time.perf_counter(), sys.getallocatedblocks()
+
+    def finish_command(self, started: tuple[str, int, float, int]) -> None:
+        """Record the command that start_command returned started, which is now done, under its command kind and
+        its location id."""
+        verb, loc_id, seconds, blocks = started
+        start = (seconds, blocks)
+        self.record('adventure_command', MENU if verb in MENU_VERBS else verb, start)
+        self.record('adventure_location_command', str(loc_id), start)
+
+    def _histogram(self, name: str, label_value: str, bounds: tuple[float, ...]) -> Histogram:
+        """Return the histogram with the given name and label value, creating it with the given bounds if it
+        does not exist yet."""
+        by_label = self.histograms.setdefault(name, {})
+        histogram = by_label.get(label_value)
+        if histogram is None:
+            histogram = by_label[label_value] = Histogram(bounds)
+        return histogram
+
+    def to_prometheus(self) -> str:
+        """Return every histogram in the Prometheus text exposition format."""
+        lines = []
+        for name in sorted(self.histograms):
+            metric = name[:-len('_seconds')] if name.endswith('_seconds') else name[:-len('_allocated_blocks')]
+            unit = "seconds" if name.endswith('_seconds') else "memory blocks left allocated"
+            label_name = LABEL_NAMES[metric]
+            lines.append(f"# HELP {name} {METRICS[metric]}, in {unit}.")
+            lines.append(f"# TYPE {name} histogram")
+            for label_value, histogram in sorted(self.histograms[name].items()):
+                cumulative = 0
+                for bound, count in zip(histogram.bounds, histogram.counts):
+                    cumulative += count
+                    lines.append(f"{name}_bucket{_label(label_name, label_value, repr(bound))} {cumulative}")
+                lines.append(f"{name}_bucket{_label(label_name, label_value, '+Inf')} {histogram.count}")
+                lines.append(f"{name}_sum{_label(label_name, label_value)} {histogram.total!r}")
+                lines.append(f"{name}_count{_label(label_name, label_value)} {histogram.count}")
+        return ''.join(line + '\n' for line in lines)
+
+    def write(self, filename: str) -> None:
+        """Write every histogram to the file with the given name, in the Prometheus text exposition format."""
+        with open(filename, 'w', encoding='utf-8') as f:
+            f.write(self.to_prometheus())
+
+
+# The recorder measurements are added to, or None while instrumentation is disabled
+recorder: Optional[Recorder] = None
+
+
+def enable() -> Recorder:
+    """Enable instrumentation, if it is not enabled already, and return the recorder measurements are added to."""
+    global recorder
+    if recorder is None:
+        recorder = Recorder()
+    return recorder
+
+
+def disable() -> Optional[Recorder]:
+    """Disable instrumentation and return the recorder that measurements were added to, if it was enabled."""
+    global recorder
+    disabled, recorder = recorder, None
+    return disabled
+
+
+def timed(metric: str, label_value: str = '') -> Callable[[Callable], Callable]:
+    """Return a decorator that records each call of the function it decorates as one measurement of the given
+    metric with the given label value, while instrumentation is enabled.
+
+    Preconditions:
+        - metric in METRICS
+    """
+    def decorate(func: Callable) -> Callable:
+        """Return func, recording each of its calls while instrumentation is enabled."""
+        @functools.wraps(func)
+        def wrapper(*args: Any, **kwargs: Any) -> Any:
+            """Call func, recording the call while instrumentation is enabled."""
+            active = recorder
+            if active is None:
+                return func(*args, **kwargs)
+            start = active.start()
+            try:
+                return func(*args, **kwargs)
+            finally:
+                active.record(metric, label_value, start)
+        return wrapper
+    return decorate
+
+
+def _enable_from_environment() -> None:
+    """Enable instrumentation if METRICS_ENV names a file, and write the histograms to that file at exit."""
+    filename = os.environ.get(METRICS_ENV)
+    if filename:
+        atexit.register(enable().write, filename)
+
+
+_enable_from_environment()
+
+
+if __name__ == "__main__":
+    # When you are ready to check your work with python_ta, uncomment the following lines.
+    # (Delete the "#" and space before each line.)
+    # IMPORTANT: keep this code indented inside the "if __name__ == '__main__'" block
+    # import python_ta
+    # python_ta.check_all(config={
+    #     'max-line-length': 120,
+    #     'disable': ['R1705', 'E9998', 'E9999', 'static_type_checker']
+    # })
+
+    import doctest
+    doctest.testmod()
@@ -0,0 +1,402 @@
+"""CSC111 Project 1: Text Adventure Game - Lazy World Loading
+
+Instructions (READ THIS FIRST!)
+===============================
+
+This Python module contains a lazy loader for very large game data files for Project 1,
+to be used in place of GameWorld.load. For example,
+
+    world = load_lazy_world('project1/grid_1m.json')
+    game = AdventureGame('project1/grid_1m.json', 1, world)
+
+starts a game without building a Location for every location in the file first.
+
+The first time a file is loaded, it is read once from start to end to find where each
+location record starts and ends, without keeping any of the records. That index is saved
+in a sidecar file next to the game data file (game_data.json.index for game_data.json), so
+later loads of the same, unchanged file skip the scan. A location is then read from the
+file, parsed and kept the first time the game asks for it.
+
+Copyright and Usage Information
+===============================
+
+This file is provided solely for the personal and private use of students
+taking CSC111 at the University of Toronto St. George campus. All forms of
+distribution of this code, whether as given or with any changes, are
+expressly prohibited. For more information on copyright for CSC111 materials,
+please consult our Course Syllabus.
+
+This file is Copyright (c) 2026 CSC111 Teaching Team
+"""
+from __future__ import annotations
+import codecs
+import hashlib
+import json
+import os
+import re
+import sys
+from array import array
+from typing import Any, BinaryIO, Callable, Iterator, Mapping, Optional
+
+from game_entities import Location
+from game_world import GameWorld, item_from_data, location_from_data
+from game_rules import rules_from_data
+from instrumentation import timed
+
+# The suffix added to a game data file's name to get the name of its index sidecar file
+INDEX_SUFFIX = '.index'
+
+# The version of the index sidecar file format; files written with another version are rebuilt
+_INDEX_VERSION = 2
+
+# How many bytes of the game data file are read at a time while scanning it
+_CHUNK_SIZE = 1 << 20
+
+_NON_WHITESPACE = re.compile(r'\S')
+
+
+def _utf8_length(text: str) -> int:
+    """Return the number of bytes in the UTF-8 encoding of text."""
+    return len(text) if text.isascii() else len(text.encode('utf-8'))
+
+
+class _JsonScanner:
+    """A reader that walks through a JSON file one value at a time, keeping only a chunk of it in memory.
+
+    Instance Attributes:
+        - offset: the position in the file, in bytes, of the next character to be read
+        - sha256: the hash of every byte read from the file so far
+    """
+    offset: int
+    sha256: Any
+    # Private Instance Attributes:
+    #   - _file: the file being scanned
+    #   - _decoder: decodes the file's bytes into text, even when a chunk ends in the middle of a character
+    #   - _buffer: the text read from the file but not yet scanned past, starting at _buffer[_position]
+    #   - _position: the position in _buffer of the next character to be read
+    #   - _at_end: whether the whole file has been read into _buffer
+    _file: BinaryIO
+    _decoder: codecs.IncrementalDecoder
+    _buffer: str
+    _position: int
+    _at_end: bool
+
+    def __init__(self, file: BinaryIO) -> None:
+        """Initialize a new scanner at the start of the given file."""
+        self.offset = 0
+        self.sha256 = hashlib.sha256()
+        self._file = file
+        self._decoder = codecs.getincrementaldecoder('utf-8')()
+        self._buffer = ''
+        self._position = 0
+        self._at_end = False
+
+    def _read_more(self) -> None:
+        """Read the next chunk of the file into the buffer, dropping the text already scanned past."""
+        chunk = self._file.read(_CHUNK_SIZE)
+        self._at_end = chunk == b''
+        self.sha256.update(chunk)
+        self._buffer = self._buffer[self._position:] + self._decoder.decode(chunk, self._at_end)
+        self._position = 0
+
+    def _advance(self, end: int) -> None:
+        """Move past the text of the buffer up to position end."""
+        self.offset += _utf8_length(self._buffer[self._position:end])
+        self._position = end
+
+    def peek(self) -> str:
+        """Skip whitespace and return the next character without moving past it, or '' at the end of the file."""
+        while True:
+            match = _NON_WHITESPACE.search(self._buffer, self._position)
+            if match is not None:
+                self._advance(match.start())
+                return match.group()
+            self._advance(len(self._buffer))
+            if self._at_end:
+                return ''
+            self._read_more()
+
+    def expect(self, character: str) -> None:
+        """Skip whitespace and move past the given character.
+
+        Raise ValueError if the next character is something else.
+        """
+        if self.peek() != character:
+            raise ValueError(f'expected {character!r} at byte {self.offset} of the game data file')
+        self._advance(self._position + 1)
+
+    def read_to_end(self) -> None:
+        """Read the rest of the file, so that sha256 is the hash of the whole file."""
+        while not self._at_end:
+            self._read_more()
+
+    def value(self) -> tuple[Any, int, int]:
+        """Skip whitespace, then parse and move past the next JSON value.
+
+        Return the value, and the position and length of its text in the file in bytes.
+        """
+        decoder = json.JSONDecoder()
+        self.peek()
+        while True:
+            try:
+                value, end = decoder.raw_decode(self._buffer, self._position)
+            except json.JSONDecodeError:
+                if self._at_end:
+                    raise
+            else:
+                # A number may go on past the end of the buffer; every other value ends with its last character
+                if end < len(self._buffer) or self._at_end:
+                    start = self.offset
+                    self._advance(end)
+                    return value, start, self.offset - start
+            self._read_more()
+
+
+def scan_game_data(filename: str,
+                   visit: Callable[[dict[str, Any], int, int], None]) -> tuple[dict[str, Any], str]:
+    """Read the game data file with the given name once from start to end, calling visit on each parsed location
+    record with the position and length of its text in the file in bytes. Return a mapping from the key of each
+    other section of the file, such as 'items' and 'rules', to its parsed value, and the SHA-256 hex digest of the
+    file's contents.
+
+    Only one location record is held in memory at a time, unless visit keeps them.
+
+    Preconditions:
+        - filename is the filename of a valid game data JSON file
+    """
+    sections = {}
+    with open(filename, 'rb') as f:
+        scanner = _JsonScanner(f)
+        scanner.expect('{')
+        while scanner.peek() != '}':
+            key = scanner.value()[0]
+            scanner.expect(':')
+            if key == 'locations':
+                scanner.expect('[')
+                while scanner.peek() != ']':
+                    visit(*scanner.value())
+                    if scanner.peek() == ',':
+                        scanner.expect(',')
+                scanner.expect(']')
+            else:
+                sections[key] = scanner.value()[0]
+            if scanner.peek() == ',':
+                scanner.expect(',')
+        scanner.expect('}')
+        scanner.read_to_end()
+    return sections, scanner.sha256.hexdigest()
+
+
+class LocationIndex:
+    """The position of every location record in a game data file, and the file's items and rules.
+
+    Instance Attributes:
+        - ids: the id of each location, in the order the file lists them
+        - offsets: the position in the file, in bytes, of the record of the location with id ids[i]
+        - lengths: the length, in bytes, of the record of the location with id ids[i]
+        - items: the parsed item records of the file
+        - rules: the parsed rules section of the file, or None if it has none
+        - data_hash: the SHA-256 hex digest of the file's contents
+
+    Representation Invariants:
+        - len(self.ids) == len(self.offsets) == len(self.lengths)
+    """
+    ids: array
+    offsets: array
+    lengths: array
+    items: list[dict[str, Any]]
+    rules: Optional[dict[str, Any]]
+    data_hash: str
+
+    def __init__(self, ids: array, offsets: array, lengths: array, items: list[dict[str, Any]],
+                 rules: Optional[dict[str, Any]], data_hash: str) -> None:
+        """Initialize a new index with the given location positions, item records, rules and file hash."""
+        self.ids = ids
+        self.offsets = offsets
+        self.lengths = lengths
+        self.items = items
+        self.rules = rules
+        self.data_hash = data_hash
+
+    @classmethod
+    def scan(cls, filename: str) -> LocationIndex:
+        """Return the index of the game data file with the given name, reading it once from start to end.
+
+        Only the item records and rules are kept; each location record is parsed to find its id and end, then dropped.
+
+        Preconditions:
+            - filename is the filename of a valid game data JSON file
+        """
+        ids, offsets, lengths = array('i'), array('q'), array('q')
+
+        def record(loc_data: dict[str, Any], offset: int, length: int) -> None:
+            """Record the position of the given location record."""
+            ids.append(loc_data['id'])
+            offsets.append(offset)
+            lengths.append(length)
+
+        sections, data_hash = scan_game_data(filename, record)
+        return cls(ids, offsets, lengths, sections.get('items', []), sections.get('rules'), data_hash)
+
+    def save(self, filename: str, data_stat: os.stat_result) -> None:
+        """Save this index to the sidecar file with the given name, labelled with the size and modification time
+        of the game data file it was built from."""
+        header = {'version': _INDEX_VERSION, 'size': data_stat.st_size, 'mtime_ns': data_stat.st_mtime_ns,
+                  'byteorder': sys.byteorder, 'count': len(self.ids), 'hash': self.data_hash, 'items': self.items,
+                  'rules': self.rules}
+        # Write to a temporary file first, so a reader never sees half an index
+        temporary = filename + '.tmp'
+        with open(temporary, 'wb') as f:
+            f.write(json.dumps(header).encode('utf-8') + b'\n')
+            self.ids.tofile(f)
+            self.offsets.tofile(f)
+            self.lengths.tofile(f)
+        os.replace(temporary, filename)
+
+    @classmethod
+    def load(cls, filename: str, data_stat: os.stat_result) -> Optional[LocationIndex]:
+        """Return the index saved in the sidecar file with the given name, or None if the file does not exist or
+        was saved for a game data file of another size or modification time."""
+        try:
+            with open(filename, 'rb') as f:
+                header = json.loads(f.readline())
+                if (header.get('version'), header.get('size'), header.get('mtime_ns'), header.get('byteorder')) \
+                        != (_INDEX_VERSION, data_stat.st_size, data_stat.st_mtime_ns, sys.byteorder):
+                    return None
+                ids, offsets, lengths = array('i'), array('q'), array('q')
+                ids.fromfile(f, header['count'])
+                offsets.fromfile(f, header['count'])
+                lengths.fromfile(f, header['count'])
+        except (OSError, ValueError, EOFError, KeyError):
+            return None
+        return cls(ids, offsets, lengths, header['items'], header['rules'], header['hash'])
+
+
+class LazyLocations(Mapping[int, Location]):
+    """A read-only mapping from location id to Location that reads each location from its game data file the
+    first time it is looked up, and keeps it from then on.
+
+    Iterating over the mapping gives every location id in the file, but looking up every location reads and
+    keeps all of them, just like loading the file eagerly.
+
+    Instance Attributes:
+        - filename: the name of the game data file the locations are read from
+        - index: the positions of the location records in that file
+    """
+    filename: str
+    index: LocationIndex
+    # Private Instance Attributes:
+    #   - _positions: a mapping from each location id to its position in the index, or None if the file lists
+    #                 its locations with consecutive ids, so that position is the id minus the first id
+    #   - _loaded: a mapping from location id to Location, for every location read so far
+    #   - _file: the game data file, opened the first time a location is read, or None
+    _positions: Optional[dict[int, int]]
+    _loaded: dict[int, Location]
+    _file: Optional[BinaryIO]
+
+    def __init__(self, filename: str, index: LocationIndex) -> None:
+        """Initialize a new mapping over the locations of the game data file with the given name and index."""
+        self.filename = filename
+        self.index = index
+        first_id = index.ids[0] if index.ids else 0
+        if index.ids == array('i', range(first_id, first_id + len(index.ids))):
+            self._positions = None
+        else:
+            self._positions = {loc_id: position for position, loc_id in enumerate(index.ids)}
+        self._loaded = {}
+        self._file = None
+
+    def __getitem__(self, loc_id: int) -> Location:
+        """Return the location with the given id, reading it from the file if it has not been read yet.
+
+        Raise KeyError if the file has no such location.
+        """
+        location = self._loaded.get(loc_id)
+        if location is None:
+            position = self._position(loc_id)
+            if position is None:
+                raise KeyError(loc_id)
+            if self._file is None:
+                self._file = open(self.filename, 'rb')
+            self._file.seek(self.index.offsets[position])
+            location = location_from_data(json.loads(self._file.read(self.index.lengths[position])))
+            self._loaded[loc_id] = location
+        return location
+
+    def _position(self, loc_id: object) -> Optional[int]:
+        """Return the position in the index of the location with the given id, or None if there is none."""
+        if self._positions is not None:
+            return self._positions.get(loc_id)
+        elif isinstance(loc_id, int) and 0 <= loc_id - self.index.ids[0] < len(self.index.ids):
+            return loc_id - self.index.ids[0]
+        else:
+            return None
+
+    def __contains__(self, loc_id: object) -> bool:
+        """Return whether the file has a location with the given id, without reading it."""
+        return self._position(loc_id) is not None
+
+    def __iter__(self) -> Iterator[int]:
+        """Return an iterator over the id of every location in the file."""
+        return iter(self.index.ids)
+
+    def __len__(self) -> int:
+        """Return the number of locations in the file."""
+        return len(self.index.ids)
+
+    def num_loaded(self) -> int:
+        """Return the number of locations read from the file so far."""
+        return len(self._loaded)
+
+    def __getstate__(self) -> dict[str, Any]:
+        """Return the state of this mapping to pickle, without the open file, which is reopened when needed."""
+        state = self.__dict__.copy()
+        state['_file'] = None
+        return state
+
+
+def load_index(filename: str, use_sidecar: bool = True) -> LocationIndex:
+    """Return the location index of the game data file with the given name.
+
+    If use_sidecar is True, the index is loaded from the file's sidecar if it is up to date, and otherwise built
+    by scanning the file and saved to the sidecar. An index that cannot be saved is still returned.
+    """
+    sidecar = filename + INDEX_SUFFIX
+    data_stat = os.stat(filename)
+    index = LocationIndex.load(sidecar, data_stat) if use_sidecar else None
+    if index is None:
+        index = LocationIndex.scan(filename)
+        if use_sidecar:
+            try:
+                index.save(sidecar, data_stat)
+            except OSError:
+                pass
+    return index
+
+
+@timed('adventure_world_load', 'lazy')
+def load_lazy_world(filename: str, use_sidecar: bool = True) -> GameWorld:
+    """Return the game world stored in the game data file with the given name, reading each location from the
+    file only when it is first asked for.
+
+    If use_sidecar is True, the file's location index is kept in a sidecar file next to it, so only the first
+    load of the file has to scan it.
+
+    Preconditions:
+        - filename is the filename of a valid game data JSON file
+    """
+    index = load_index(filename, use_sidecar)
+    items = [item_from_data(item_data) for item_data in index.items]
+    return GameWorld(LazyLocations(filename, index), items, filename, index.data_hash, rules_from_data(index.rules))
+
+
+if __name__ == "__main__":
+    pass
+    # When you are ready to check your work with python_ta, uncomment the following lines.
+    # (Delete the "#" and space before each line.)
+    # IMPORTANT: keep this code indented inside the "if __name__ == '__main__'" block
+    # import python_ta
+    # python_ta.check_all(config={
+    #     'max-line-length': 120,
+    #     'disable': ['R1705', 'E9998', 'E9999', 'static_type_checker']
+    # })
@@ -0,0 +1,206 @@
+"""CSC111 Project 1: Text Adventure Game - Load Test
+
+Instructions (READ THIS FIRST!)
+===============================
+
+This Python module contains a load test for the game server in game_server.py. Run it
+from the repository root:
+
+    python project1/load_test.py [SESSIONS] [--concurrency N] [--port PORT | --unix SOCKET_PATH]
+
+plays SESSIONS games (10000 by default) against a game server, at most N of them (1000 by
+default) connected at once. Each game replays one of the demo scripts in simulation.py,
+taking turns through DEMO_SCRIPTS. The load test reports the 50th and 99th percentile
+latency of a command, measured from sending the command to receiving the prompt for the
+next one (or the end of the game), along with the latency of connecting and receiving
+the first prompt, and the overall throughput.
+
+With --port or --unix, the load test connects to a server that is already running (on
+127.0.0.1 for --port). Otherwise, it starts a server on a free port in its own process,
+which is convenient, but then the client and the server share one CPU.
+
+Copyright and Usage Information
+===============================
+
+This file is provided solely for the personal and private use of students
+taking CSC111 at the University of Toronto St. George campus. All forms of
+distribution of this code, whether as given or with any changes, are
+expressly prohibited. For more information on copyright for CSC111 materials,
+please consult our Course Syllabus.
+
+This file is Copyright (c) 2026 CSC111 Teaching Team
+"""
+from __future__ import annotations
+import asyncio
+import math
+import sys
+import time
+from dataclasses import dataclass, field
+from typing import Optional
+
+from game_server import GameServer, PROMPT, DEFAULT_HOST
+from simulation import DEMO_SCRIPTS
+
+# The largest reply, in bytes, the client reads at once; the log command's reply grows with the game
+MAX_REPLY_LENGTH = 2 ** 20
+
+USAGE = "Usage: python project1/load_test.py [SESSIONS] [--concurrency N] [--port PORT | --unix SOCKET_PATH]"
+
+
+@dataclass
+class LoadTestResult:
+    """The outcome of a load test.
+
+    Instance Attributes:
+        - sessions: The number of games played
+        - command_latencies: The number of seconds each command took, from sending it to receiving the reply
+        - connect_latencies: The number of seconds each game took from connecting to receiving its first prompt
+        - elapsed: The number of seconds the whole load test took
+
+    Representation Invariants:
+        - self.sessions >= 0
+        - len(self.connect_latencies) <= self.sessions
+        - self.elapsed >= 0
+    """
+    sessions: int
+    command_latencies: list[float] = field(default_factory=list)
+    connect_latencies: list[float] = field(default_factory=list)
+    elapsed: float = 0.0
+
+    def commands_per_second(self) -> float:
+        """Return the number of commands answered per second over the whole load test."""
+        return len(self.command_latencies) / self.elapsed if self.elapsed > 0 else 0.0
+
+
+def percentile(values: list[float], fraction: float) -> float:
+    """Return the smallest of the given values that at least the given fraction of them are no larger than.
+
+    Preconditions:
+        - values != []
+        - 0 < fraction <= 1
+
+    >>> percentile([4.0, 1.0, 3.0, 2.0], 0.5)
+    2.0
+    >>> percentile([4.0, 1.0, 3.0, 2.0], 0.99)
+    4.0
+    """
+    ordered = sorted(values)
+    return ordered[max(1, math.ceil(fraction * len(ordered))) - 1]
+
+
+async def _read_reply(reader: asyncio.StreamReader) -> bytes:
+    """Return the server's reply up to and including the next prompt, or up to the end of the game."""
+    try:
+        return await reader.readuntil(PROMPT.encode('utf-8'))
+    except asyncio.IncompleteReadError as error:
+        return error.partial
+
+
+async def play_script(script: list[str], result: LoadTestResult, port: Optional[int] = None,
+                      unix_path: Optional[str] = None) -> None:
+    """Play one game with the given commands against the server on the given TCP port or Unix socket, adding
+    its latencies to result. The game stops early if the server ends it before the script does."""
+    start = time.perf_counter()
+    if unix_path is None:
+        reader, writer = await asyncio.open_connection(DEFAULT_HOST, port, limit=MAX_REPLY_LENGTH)
+    else:
+        reader, writer = await asyncio.open_unix_connection(unix_path, limit=MAX_REPLY_LENGTH)
+    try:
+        reply = await _read_reply(reader)
+        result.connect_latencies.append(time.perf_counter() - start)
+
+        for command in script:
+            if not reply.endswith(PROMPT.encode('utf-8')):
+                break  # The game is over
+            start = time.perf_counter()
+            writer.write(command.encode('utf-8') + b'\n')
+            await writer.drain()
+            reply = await _read_reply(reader)
+            result.command_latencies.append(time.perf_counter() - start)
+    finally:
+        writer.close()
+        await writer.wait_closed()
+
+
+async def run_load_test(sessions: int, concurrency: int, port: Optional[int] = None,
+                        unix_path: Optional[str] = None) -> LoadTestResult:
+    """Play the given number of games, at most concurrency at once, replaying the demo scripts in turn, and
+    return the outcome.
+
+    The games are played against the server on the given TCP port or Unix socket; if neither is given, a
+    GameServer for project1/game_data.json is started in this process for the duration of the load test.
+
+    Preconditions:
+        - sessions >= 0
+        - concurrency >= 1
+    """
+    result = LoadTestResult(sessions)
+    server = None
+    if port is None and unix_path is None:
+        server = await GameServer().start_tcp(port=0)
+        port = server.sockets[0].getsockname()[1]
+
+    scripts = list(DEMO_SCRIPTS.values())
+    slots = asyncio.Semaphore(concurrency)
+
+    async def play_one(index: int) -> None:
+        """Play the index-th game once a slot is free."""
+        async with slots:
+            await play_script(scripts[index % len(scripts)], result, port, unix_path)
+
+    start = time.perf_counter()
+    try:
+        await asyncio.gather(*[play_one(i) for i in range(sessions)])
+    finally:
+        result.elapsed = time.perf_counter() - start
+        if server is not None:
+            server.close()
+            await server.wait_closed()
+    return result
+
+
+def main(args: list[str]) -> int:
+    """Run the load test with the given command line arguments, print its report and return its exit status."""
+    options = {'concurrency': '1000'}
+    positional = []
+    while args:
+        if args[0] in ('--concurrency', '--port', '--unix') and len(args) > 1:
+            options[args[0][2:]] = args[1]
+            args = args[2:]
+        elif args[0].startswith('-') or positional:
+            print(USAGE, file=sys.stderr)
+            return 2
+        else:
+            positional.append(args[0])
+            args = args[1:]
+    numbers = positional + [options['concurrency'], options.get('port', '0')]
+    if not all(number.isdigit() for number in numbers) or 'port' in options and 'unix' in options \
+            or int(options['concurrency']) < 1:
+        print(USAGE, file=sys.stderr)
+        return 2
+
+    sessions = int(positional[0]) if positional else 10_000
+    port = int(options['port']) if 'port' in options else None
+    result = asyncio.run(run_load_test(sessions, int(options['concurrency']), port, options.get('unix')))
+
+    print("Played", result.sessions, "games,", len(result.command_latencies), "commands, in",
+          round(result.elapsed, 3), "seconds")
+    print("Throughput:", round(result.commands_per_second()), "commands/second")
+    for name, latencies in [('command', result.command_latencies), ('connect', result.connect_latencies)]:
+        if latencies:
+            print(f"  {name + ' latency':<16} p50 {percentile(latencies, 0.5) * 1000:8.3f} ms"
+                  f"   p99 {percentile(latencies, 0.99) * 1000:8.3f} ms")
+    return 0
+
+
+if __name__ == "__main__":
+    # When you are ready to check your work with python_ta, uncomment the following lines.
+    # (Delete the "#" and space before each line.)
+    # IMPORTANT: keep this code indented inside the "if __name__ == '__main__'" block
+    # import python_ta
+    # python_ta.check_all(config={
+    #     'max-line-length': 120,
+    #     'disable': ['R1705', 'E9998', 'E9999', 'static_type_checker']
+    # })
+
+    sys.exit(main(sys.argv[1:]))
@@ -0,0 +1,125 @@
+"""CSC111 Project 1: Text Adventure Game - Output Sinks
+
+Instructions (READ THIS FIRST!)
+===============================
+
+This Python module contains the output sinks for Project 1, to be imported and used by
+the `adventure` and `simulation` modules.
+
+Everything the game tells the player goes through a sink's say method, which takes the
+same arguments as print. The sink decides what happens to the message: StdoutSink writes
+it to standard output in batches, ListSink keeps it so tests can look at it, and
+NullSink throws it away without ever turning the arguments into text.
+
+Copyright and Usage Information
+===============================
+
+This file is provided solely for the personal and private use of students
+taking CSC111 at the University of Toronto St. George campus. All forms of
+distribution of this code, whether as given or with any changes, are
+expressly prohibited. For more information on copyright for CSC111 materials,
+please consult our Course Syllabus.
+
+This file is Copyright (c) 2026 CSC111 Teaching Team
+"""
+from __future__ import annotations
+import sys
+from typing import Optional, TextIO
+
+
+class OutputSink:
+    """An abstract destination for the messages a game shows the player.
+
+    Instance Attributes:
+        - enabled: whether messages said to this sink go anywhere. Code that has to do extra work
+          just to build a message can skip it when this is False.
+    """
+    enabled: bool = True
+
+    def say(self, *values: object) -> None:
+        """Show a message made of the given values, like print(*values)."""
+        raise NotImplementedError
+
+    def flush(self) -> None:
+        """Make sure every message said so far has reached its destination."""
+
+
+class StdoutSink(OutputSink):
+    """A sink that writes messages to a text stream, standard output by default, in batches.
+
+    Messages are kept in memory until buffer_size of them have been said or flush is called, and then
+    written to the stream all at once. Call flush before waiting for input from the player.
+
+    Instance Attributes:
+        - buffer_size: the number of messages kept in memory before they are written
+
+    Representation Invariants:
+        - self.buffer_size >= 1
+    """
+    buffer_size: int
+    # Private Instance Attributes:
+    #   - _stream: the stream messages are written to
+    #   - _buffer: the messages not yet written, each ending with a newline
+    _stream: TextIO
+    _buffer: list[str]
+
+    def __init__(self, stream: Optional[TextIO] = None, buffer_size: int = 256) -> None:
+        """Initialize a new sink that writes to the given stream, or to standard output if stream is None."""
+        self._stream = sys.stdout if stream is None else stream
+        self.buffer_size = buffer_size
+        self._buffer = []
+
+    def say(self, *values: object) -> None:
+        """Show a message made of the given values, like print(*values)."""
+        self._buffer.append(' '.join([str(value) for value in values]) + '\n')
+        if len(self._buffer) >= self.buffer_size:
+            self.flush()
+
+    def flush(self) -> None:
+        """Write every message kept in memory to the stream."""
+        if self._buffer:
+            self._stream.write(''.join(self._buffer))
+            self._buffer.clear()
+        self._stream.flush()
+
+
+class ListSink(OutputSink):
+    """A sink that keeps every message, for tests and for anything that needs to look at the output.
+
+    Instance Attributes:
+        - lines: the text of every message said to this sink, in order, without trailing newlines.
+          A message containing newlines is kept as one string.
+    """
+    lines: list[str]
+
+    def __init__(self) -> None:
+        """Initialize a new sink with no messages."""
+        self.lines = []
+
+    def say(self, *values: object) -> None:
+        """Show a message made of the given values, like print(*values)."""
+        self.lines.append(' '.join([str(value) for value in values]))
+
+    def text(self) -> str:
+        """Return everything said to this sink, as print would have written it."""
+        return ''.join(line + '\n' for line in self.lines)
+
+
+class NullSink(OutputSink):
+    """A sink that discards every message without formatting it."""
+    enabled = False
+
+    def say(self, *values: object) -> None:
+        """Discard the message made of the given values."""
+
+
+if __name__ == "__main__":
+    pass
+    # When you are ready to check your work with python_ta, uncomment the following lines.
+    # (Delete the "#" and space before each line.)
+    # IMPORTANT: keep this code indented inside the "if __name__ == '__main__'" block
+    # import python_ta
+    # python_ta.check_all(config={
+    #     'max-line-length': 120,
+    #     'disable': ['R1705', 'E9998', 'E9999', 'static_type_checker']
+    # })
@@ -0,0 +1,74 @@
+"""CSC111 Project 1: Text Adventure Game - Launcher
+
+Instructions (READ THIS FIRST!)
+===============================
+
+This Python module is the quickest way to start the game for Project 1. Run it from the
+repository root:
+
+    python project1/play.py [GAME_DATA_FILE] [--journal JOURNAL_FILE]
+
+plays the given game data file (project1/game_data.json by default, or a compiled file),
+journaling to the given journal file (project1/adventure.journal by default). Unlike
+running adventure.py, it never imports python_ta, and it does not import the game at all
+for --lint or a bad command line. Importing the game is not lazy: adventure brings in the
+world, rules, routing, snapshot, journal and instrumentation modules up front, and only the
+compiled_world module is left until a compiled file is played. To check the code with
+python_ta instead, run
+
+    python project1/play.py --lint
+
+Copyright and Usage Information
+===============================
+
+This file is provided solely for the personal and private use of students
+taking CSC111 at the University of Toronto St. George campus. All forms of
+distribution of this code, whether as given or with any changes, are
+expressly prohibited. For more information on copyright for CSC111 materials,
+please consult our Course Syllabus.
+
+This file is Copyright (c) 2026 CSC111 Teaching Team
+"""
+import sys
+
+USAGE = "Usage: python project1/play.py [GAME_DATA_FILE] [--journal JOURNAL_FILE]\n" \
+        "       python project1/play.py --lint"
+
+
+def lint() -> None:
+    """Check the project's code with python_ta."""
+    import python_ta
+    python_ta.check_all('project1/adventure.py', config={
+        'max-line-length': 120,
+        'disable': ['R1705', 'E9998', 'E9999', 'static_type_checker']
+    })
+
+
+def main(args: list[str]) -> int:
+    """Run the launcher with the given command line arguments and return its exit status."""
+    if args == ['--lint']:
+        lint()
+        return 0
+
+    options = {}
+    positional = []
+    while args:
+        if args[0] == '--journal' and len(args) > 1:
+            options['journal_file'] = args[1]
+            args = args[2:]
+        elif args[0].startswith('-') or positional:
+            print(USAGE, file=sys.stderr)
+            return 2
+        else:
+            positional.append(args[0])
+            args = args[1:]
+    if positional:
+        options['game_data_file'] = positional[0]
+
+    from adventure import play
+    play(**options)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main(sys.argv[1:]))
@@ -0,0 +1,309 @@
+"""CSC111 Project 1: Text Adventure Game - Routing Tables
+
+Instructions (READ THIS FIRST!)
+===============================
+
+This Python module contains the routing tables for Project 1, to be imported and used by
+the `game_world` module. A routing table answers "how far is location X from location Y
+with the keys I am holding" and "which go commands take me there" without searching the map.
+
+A table holds one layer for every combination of keys the player can hold (with the stock
+rules, no key, the T-card, the Dorm Key, or both). Each layer stores the distance from every
+location to every other location, and the first step of a shortest walk between them, so a
+whole route is read off the table one step at a time in time proportional to its length.
+
+Building a table runs a breadth-first search from every location in every layer, so tables
+are saved in a cache directory, under the hash of the game data file they were built from,
+and loaded from there the next time the same file is played. A world too large for its
+layers to fit in MAX_TABLE_ENTRIES gets no layers at all: each question is then answered by
+one breadth-first search from the location it is asked about, and nothing is cached.
+
+Copyright and Usage Information
+===============================
+
+This file is provided solely for the personal and private use of students
+taking CSC111 at the University of Toronto St. George campus. All forms of
+distribution of this code, whether as given or with any changes, are
+expressly prohibited. For more information on copyright for CSC111 materials,
+please consult our Course Syllabus.
+
+This file is Copyright (c) 2026 CSC111 Teaching Team
+"""
+from __future__ import annotations
+import json
+import os
+import sys
+from array import array
+from collections import deque
+from typing import Iterable, Mapping, Optional
+
+from command_parser import MOVE_VERBS, parse_command
+from game_entities import Location
+
+# The name of the directory, next to a game data file, where the routing tables built for it are saved
+ROUTING_CACHE_DIR = '.routing_cache'
+
+# The version of the routing cache file format; files written with another version are rebuilt
+_CACHE_VERSION = 1
+
+# The most distances a routing table stores, over all of its layers; a table that would need more searches the
+# map for every question instead
+MAX_TABLE_ENTRIES = 1 << 20
+
+_UNREACHABLE = -1
+
+
+class RoutingTable:
+    """Shortest walks between every pair of locations, for every combination of held keys.
+
+    A table over n locations and k keys stores n * n * 2 ** k distances. When that is more than
+    MAX_TABLE_ENTRIES, the table stores none: distance and route run a breadth-first search from the
+    source location each time they are called instead, which takes time proportional to the size of the map.
+
+    Instance Attributes:
+        - keys: the names of the items that unlock locations; holding keys[i] sets bit i of a key mask
+        - precomputed: whether this table stores the distances between every pair of locations
+
+    Representation Invariants:
+        - len(self.keys) == len(set(self.keys))
+    """
+    keys: tuple[str, ...]
+    precomputed: bool
+    # Private Instance Attributes:
+    #   - _loc_ids: the id of each location, by location index
+    #   - _loc_indexes: the index of each location, by location id
+    #   - _edges: for each location index, a mapping from the index of each location a go command leads to,
+    #             to the first such go command
+    #   - _lock_masks: for each location index, the key mask bit needed to enter it, or 0 if it is not locked
+    #   - _distances: for each key mask, the fewest moves from location index i to location index j at
+    #                 position i * len(self._loc_ids) + j, or _UNREACHABLE; empty if the table is not precomputed
+    #   - _next_hops: for each key mask, the location index of the first step from location index i towards
+    #                 location index j at position i * len(self._loc_ids) + j, or _UNREACHABLE; empty if the
+    #                 table is not precomputed
+    _loc_ids: list[int]
+    _loc_indexes: dict[int, int]
+    _edges: list[dict[int, str]]
+    _lock_masks: list[int]
+    _distances: list[array]
+    _next_hops: list[array]
+
+    def __init__(self, locations: Mapping[int, Location], locks: Mapping[int, str]) -> None:
+        """Build the routing table of the given locations, where locks maps a locked location's id to the name
+        of the item needed to enter it, as in GameRules.locks.
+
+        This runs a breadth-first search from every location for every combination of keys, unless the table
+        would be too large to be precomputed.
+        """
+        self._set_up(locations, locks)
+        self._distances = []
+        self._next_hops = []
+        if not self.precomputed:
+            return
+        for key_mask in range(1 << len(self.keys)):
+            distances, next_hops = self._build_layer(key_mask)
+            self._distances.append(distances)
+            self._next_hops.append(next_hops)
+
+    def _set_up(self, locations: Mapping[int, Location], locks: Mapping[int, str]) -> None:
+        """Record the location graph and locks of the given locations."""
+        self.keys = tuple(dict.fromkeys(locks.values()))
+        self._loc_ids = list(locations)
+        self._loc_indexes = {loc_id: index for index, loc_id in enumerate(self._loc_ids)}
+
+        self._edges = []
+        for loc_id in self._loc_ids:
+            edges = {}
+            for command, next_id in locations[loc_id].available_commands.items():
+                if parse_command(command).verb in MOVE_VERBS and next_id in self._loc_indexes:
+                    edges.setdefault(self._loc_indexes[next_id], command)
+            self._edges.append(edges)
+
+        self._lock_masks = [0] * len(self._loc_ids)
+        for loc_id, key in locks.items():
+            if loc_id in self._loc_indexes:
+                self._lock_masks[self._loc_indexes[loc_id]] = 1 << self.keys.index(key)
+        self.precomputed = len(self._loc_ids) ** 2 << len(self.keys) <= MAX_TABLE_ENTRIES
+
+    def _build_layer(self, key_mask: int) -> tuple[array, array]:
+        """Return the distances and next hops between every pair of locations while holding the keys in key_mask."""
+        num_locations = len(self._loc_ids)
+        distances = array('i')
+        next_hops = array('i')
+        for source in range(num_locations):
+            row_distances = [_UNREACHABLE] * num_locations
+            row_next_hops = [_UNREACHABLE] * num_locations
+            row_distances[source] = 0
+            row_next_hops[source] = source
+            queue = deque([source])
+            while queue:
+                index = queue.popleft()
+                for next_index in self._edges[index]:
+                    lock = self._lock_masks[next_index]
+                    if row_distances[next_index] == _UNREACHABLE and (lock == 0 or key_mask & lock):
+                        row_distances[next_index] = row_distances[index] + 1
+                        # The first step towards a location is the first step towards whoever found it
+                        row_next_hops[next_index] = next_index if index == source else row_next_hops[index]
+                        queue.append(next_index)
+            distances.extend(row_distances)
+            next_hops.extend(row_next_hops)
+        return distances, next_hops
+
+    def _search(self, source: int, target: int, key_mask: int) -> Optional[list[int]]:
+        """Return the location indexes of a shortest walk from location index source to location index target,
+        after source, while holding the keys in key_mask, or None if there is no way there.
+
+        The walk is the one the precomputed layer for key_mask would give.
+        """
+        previous = {source: source}
+        queue = deque([source])
+        while queue and target not in previous:
+            index = queue.popleft()
+            for next_index in self._edges[index]:
+                lock = self._lock_masks[next_index]
+                if next_index not in previous and (lock == 0 or key_mask & lock):
+                    previous[next_index] = index
+                    queue.append(next_index)
+        if target not in previous:
+            return None
+
+        walk = []
+        index = target
+        while index != source:
+            walk.append(index)
+            index = previous[index]
+        walk.reverse()
+        return walk
+
+    def key_mask(self, inventory: Iterable[str]) -> int:
+        """Return the key mask of a player holding the items with the given names."""
+        mask = 0
+        for name in inventory:
+            if name in self.keys:
+                mask |= 1 << self.keys.index(name)
+        return mask
+
+    def distance(self, source_id: int, target_id: int, inventory: Iterable[str] = ()) -> Optional[int]:
+        """Return the fewest moves from the location with id source_id to the location with id target_id for a
+        player holding the items in inventory, or None if there is no way there.
+
+        Preconditions:
+            - source_id and target_id are ids of locations in this table
+        """
+        source = self._loc_indexes[source_id]
+        target = self._loc_indexes[target_id]
+        if not self.precomputed:
+            walk = self._search(source, target, self.key_mask(inventory))
+            return None if walk is None else len(walk)
+
+        moves = self._distances[self.key_mask(inventory)][source * len(self._loc_ids) + target]
+        return None if moves == _UNREACHABLE else moves
+
+    def route(self, source_id: int, target_id: int, inventory: Iterable[str] = ()) -> Optional[list[str]]:
+        """Return the go commands of a shortest walk from the location with id source_id to the location with
+        id target_id for a player holding the items in inventory, or None if there is no way there.
+
+        Preconditions:
+            - source_id and target_id are ids of locations in this table
+        """
+        index = self._loc_indexes[source_id]
+        target = self._loc_indexes[target_id]
+        if not self.precomputed:
+            walk = self._search(index, target, self.key_mask(inventory))
+            if walk is None:
+                return None
+            commands = []
+            for next_index in walk:
+                commands.append(self._edges[index][next_index])
+                index = next_index
+            return commands
+
+        num_locations = len(self._loc_ids)
+        next_hops = self._next_hops[self.key_mask(inventory)]
+        if next_hops[index * num_locations + target] == _UNREACHABLE:
+            return None
+
+        commands = []
+        while index != target:
+            next_index = next_hops[index * num_locations + target]
+            commands.append(self._edges[index][next_index])
+            index = next_index
+        return commands
+
+    def save(self, filename: str, data_hash: str) -> None:
+        """Save this table to the file with the given name, labelled with the hash of the game data it was
+        built from."""
+        header = {'version': _CACHE_VERSION, 'hash': data_hash, 'byteorder': sys.byteorder,
+                  'itemsize': array('i').itemsize, 'keys': list(self.keys), 'locations': self._loc_ids,
+                  'locks': self._lock_masks}
+        # Write to a temporary file first, so a reader never sees half a table
+        temporary = filename + '.tmp'
+        with open(temporary, 'wb') as f:
+            f.write(json.dumps(header).encode('utf-8') + b'\n')
+            for distances, next_hops in zip(self._distances, self._next_hops):
+                distances.tofile(f)
+                next_hops.tofile(f)
+        os.replace(temporary, filename)
+
+    @classmethod
+    def load(cls, filename: str, locations: Mapping[int, Location], locks: Mapping[int, str],
+             data_hash: str) -> Optional[RoutingTable]:
+        """Return the table saved in the file with the given name for the given locations and locks, or None if
+        the file does not exist or was saved for other game data, or the table is too large to be precomputed."""
+        table = cls.__new__(cls)
+        table._set_up(locations, locks)
+        if not table.precomputed:
+            return None
+        expected = {'version': _CACHE_VERSION, 'hash': data_hash, 'byteorder': sys.byteorder,
+                    'itemsize': array('i').itemsize, 'keys': list(table.keys), 'locations': table._loc_ids,
+                    'locks': table._lock_masks}
+        size = len(table._loc_ids) ** 2
+        try:
+            with open(filename, 'rb') as f:
+                if json.loads(f.readline()) != expected:
+                    return None
+                table._distances = []
+                table._next_hops = []
+                for _ in range(1 << len(table.keys)):
+                    distances = array('i')
+                    distances.fromfile(f, size)
+                    next_hops = array('i')
+                    next_hops.fromfile(f, size)
+                    table._distances.append(distances)
+                    table._next_hops.append(next_hops)
+        except (OSError, ValueError, EOFError):
+            return None
+        return table
+
+
+def load_routing_table(locations: Mapping[int, Location], locks: Mapping[int, str], data_hash: str,
+                       cache_dir: str) -> RoutingTable:
+    """Return the routing table of the given locations and locks, loading it from cache_dir if it was saved
+    there for the game data with the given hash, and otherwise building it and saving it there.
+
+    A table that cannot be saved is still returned; it is just built again next time. A table too large to be
+    precomputed is returned without touching cache_dir.
+    """
+    filename = os.path.join(cache_dir, data_hash + '.routes')
+    table = RoutingTable.load(filename, locations, locks, data_hash)
+    if table is None:
+        table = RoutingTable(locations, locks)
+        if not table.precomputed:
+            return table
+        try:
+            os.makedirs(cache_dir, exist_ok=True)
+            table.save(filename, data_hash)
+        except OSError:
+            pass
+    return table
+
+
+if __name__ == "__main__":
+    pass
+    # When you are ready to check your work with python_ta, uncomment the following lines.
+    # (Delete the "#" and space before each line.)
+    # IMPORTANT: keep this code indented inside the "if __name__ == '__main__'" block
+    # import python_ta
+    # python_ta.check_all(config={
+    #     'max-line-length': 120,
+    #     'disable': ['R1705', 'E9998', 'E9999', 'static_type_checker']
+    # })
@@ -22,30 +22,207 @@ please consult our Course Syllabus.
 This file is Copyright (c) 2026 CSC111 Teaching Team
 """
 from __future__ import annotations
-from event_logger import Event, EventList
-from adventure import AdventureGame
+from collections import deque
+from typing import Callable, Generator, Iterable, Iterator, Optional
+from command_parser import MENU_VERBS, parse_command
+from event_journal import EventJournal
+from event_logger import Event, EventList, CompactEventList
+from output_sink import OutputSink, StdoutSink
+from adventure import AdventureGame, run_action, is_won, is_lost
+import instrumentation
+from game_world import GameWorld
 from game_entities import Location
 
 
+# The command scripts of the demo playthroughs checked below, each starting from location 1 of
+# project1/game_data.json. Other tools, such as the load test client in game_server, replay them too.
+WIN_WALKTHROUGH = [
+    "go south",
+    "go south",
+    "go east",
+    "go east",
+    "go east",
+    "go north",
+    "go north",
+    "pick up lucky mug",
+    "pick up t-card",
+    "go south",
+    "go south",
+    "go west",
+    "go west",
+    "go south",
+    "drop lucky mug",
+    "go west",
+    "pick up dorm key",
+    "go east",
+    "drop t-card",
+    "pick up lucky mug",
+    "go east",
+    "deposit lucky mug",
+    "go north",
+    "pick up laptop charger",
+    "go south",
+    "deposit laptop charger",
+    "go north",
+    "pick up usb drive",
+    "go south",
+    "deposit usb drive"
+]
+
+LOSE_DEMO = ["go south", "go north"] * 25
+
+INVENTORY_DEMO = [
+    "go south",
+    "go south",
+    "go east",
+    "go east",
+    "pick up usb drive",
+    "inventory"
+]
+
+SCORES_DEMO = [
+    "go south",
+    "go south",
+    "go east",
+    "go east",
+    "go east",
+    "go north",
+    "go north",
+    "pick up lucky mug",
+    "pick up t-card",
+    "go south",
+    "go south",
+    "go west",
+    "go west",
+    "go south",
+    "drop lucky mug",
+    "go west",
+    "pick up dorm key",
+    "go east",
+    "drop t-card",
+    "pick up lucky mug",
+    "go east",
+    "deposit lucky mug"
+]
+
+ENHANCEMENT1_DEMO = [
+    "go south",
+    "go south",
+    "go east",
+    "go east",
+    "go east",
+    "go north",
+    "go north",
+    "pick up lucky mug",
+    "pick up t-card",
+    "go south",
+    "go south",
+    "go west",
+    "go west",
+    "go south",
+    "drop lucky mug",
+    "go west",
+    "pick up dorm key",
+    "go east",
+    "drop t-card",
+    "pick up lucky mug",
+    "go east",
+    "deposit lucky mug"
+]
+
+ENHANCEMENT2_DEMO = [
+    "go south",
+    "go south",
+    "go east",
+    "go east",
+    "go east",
+    "go north",
+    "go north",
+    "pick up lucky mug",
+    "pick up t-card",
+    "go south",
+    "go south",
+    "go south",
+    "go west",
+    "go north",
+    "go west",
+    "go west",
+    "go south",
+    "drop lucky mug",
+    "go west",
+    "pick up dorm key",
+    "go east",
+    "go east"
+]
+
+DEMO_SCRIPTS = {
+    'win_walkthrough': WIN_WALKTHROUGH, 'lose_demo': LOSE_DEMO, 'inventory_demo': INVENTORY_DEMO,
+    'scores_demo': SCORES_DEMO, 'enhancement1_demo': ENHANCEMENT1_DEMO, 'enhancement2_demo': ENHANCEMENT2_DEMO
+}
+
+
+def _carry_out(game: AdventureGame, events: EventList | CompactEventList | _EventFeed, sink: OutputSink, text: str,
+               location: Location) -> list[str]:
+    """Carry out the single valid command text, chosen at location, in game, add the event it leads to to events,
+    and return the go commands still to take to finish it, which is only ever non-empty for a "go to" command."""
+    recorder = instrumentation.recorder
+    command = parse_command(text)
+    started = None if recorder is None else recorder.start_command(command.verb, location.id_num)
+    route = []
+    if command.verb not in MENU_VERBS:
+        route = run_action(text, command, game, location, sink)
+        location = game.get_location()
+    events.add_event(Event(location.id_num, location.long_description), text)
+    if recorder is not None:
+        recorder.finish_command(started)
+    return route
+
+
 class AdventureGameSimulation:
     """A simulation of an adventure game playthrough.
     """
     # Private Instance Attributes:
     #   - _game: The AdventureGame instance that this simulation uses.
     #   - _events: A collection of the events to process during the simulation.
+    #   - _sink: Where everything the simulation shows the player goes.
     _game: AdventureGame
-    _events: EventList
-
-    def __init__(self, game_data_file: str, initial_location_id: int, commands: list[str]) -> None:
+    _events: EventList | CompactEventList
+    _sink: OutputSink
+
+    def __init__(self, game_data_file: str, initial_location_id: int, commands: list[str],
+                 world: Optional[GameWorld] = None,
+                 events: Optional[EventList | CompactEventList] = None,
+                 journal: Optional[EventJournal] = None, sink: Optional[OutputSink] = None,
+                 game: Optional[AdventureGame] = None) -> None:
         """
         Initialize a new game simulation based on the given game data, that runs through the given commands.
+        If world is given, the simulation is played in that already-loaded world instead of reading game_data_file.
+        If events is given, the simulation's events are recorded in it instead of in a new EventList.
+        If journal is given, the game's state changes and the simulation's events are recorded in it, so
+        AdventureGame.from_journal can rebuild the final state without simulating again.
+        Messages are shown through the given sink, or written to standard output if sink is None.
+        If game is given, the simulation continues that game from its current state instead of starting a new
+        game at initial_location_id; the first event is then the game's current location.
+        Like play, the simulation stops once the game is won or lost, ignoring any commands left.
 
         Preconditions:
         - len(commands) > 0
         - all commands in the given list are valid commands when starting from the location at initial_location_id
+          (or the current location of game, if it is given)
+        - events is None or events.is_empty()
+        - game is None or journal is None
         """
-        self._events = EventList()
-        self._game = AdventureGame(game_data_file, initial_location_id)
+        if events is None:
+            events = EventList()
+        if journal is not None:
+            events.journal = journal
+        if sink is None:
+            sink = StdoutSink()
+        self._sink = sink
+        self._events = events
+        if game is None:
+            game = AdventureGame(game_data_file, initial_location_id, world, journal)
+        self._game = game
 
         # Hint: self._game.get_location() gives you back the current location
         current_location = self._game.get_location()
@@ -53,115 +230,19 @@ class AdventureGameSimulation:
         self._events.add_event(first_event)
 
         # Hint: Call self.generate_events with the appropriate arguments
-        self.generate_events(commands, current_location)
-
-    def _find_item(self, item_name: str, item_list: list) -> str:
-        """
-        Find the matched item from the list
-        """
-        for item in item_list:
-            if item.lower() == item_name:
-                return item
-        return ""
-
-    def _remove_item(self, item_found: str) -> None:
-        """
-        Remove the item from the user's inventory
-        """
-        new_inventory = {}
-        for item_name in self._game.inventory:
-            if item_name != item_found:
-                new_inventory[item_name] = self._game.inventory[item_name]
-        self._game.inventory = new_inventory
-
-    def _pick_up(self, command: str, current_location: Location) -> None:
-        """
-        The helper function for pick up command
-        """
-        item_name_input = command[8:]
-        item_found = self._find_item(item_name_input, current_location.items)
-        if item_found == "":
-            print("Item is not here!")
-        elif len(self._game.inventory) >= 2:
-            print("Inventory is full!")
-        else:
-            item = self._game.get_item(item_found)
-            if item is not None:
-                self._game.inventory[item_found] = item
-                current_location.items.remove(item_found)
-                print("Picked up:", item_found)
-
-                if item_found in ["USB Drive", "Laptop Charger", "Lucky Mug"]:
-                    self._game.score = self._game.score + 0
-                    print("Score:", self._game.score)
-
-    def _drop(self, command: str, current_location: Location) -> None:
-        """
-        The helper function for drop
-        """
-        item_name_input = command[5:]
-        item_found = self._find_item(item_name_input, list(self._game.inventory.keys()))
-        if item_found != "":
-            if item_found.lower() == "t-card" and current_location.id_num == 13:
-                print("You cannot drop the T-card here! You need it to exit the library!")
-            elif item_found.lower() == "dorm key" and current_location.id_num == 15:
-                print("You cannot drop the Dorm Key here! You need it to enter Oak House again!")
-            else:
-                self._remove_item(item_found)
-                current_location.items.append(item_found)
-                print("Dropped:", item_found)
-        else:
-            print("You don't have that!")
-
-    def _deposit(self, command: str, current_location: Location) -> None:
-        """
-        The helper function for deposit
-        """
-        item_name_input = command[8:]
-        if current_location.id_num != 15:
-            print("You can only deposit at Oak House!")
-        else:
-            item_found = self._find_item(item_name_input, list(self._game.inventory.keys()))
-            if item_found != "":
-                points = 0
-                item = self._game.get_item(item_found)
-                if item is not None and current_location.id_num == item.target_position:
-                    points = item.target_points
-                self._remove_item(item_found)
-                self._game.deposited_items.add(item_found)
-                print("Deposited:", item_found)
-
-                if points > 0:
-                    self._game.score = self._game.score + points
-                    print("Earned", points, "points!")
-                    print("Score:", self._game.score)
-            else:
-                print("You don't have that!")
-
-    def _go(self, command: str, current_location: Location) -> Location:
-        """
-        The helper function for go
-        """
-        next_id = current_location.available_commands[command]
-        can_enter = True
-        if next_id == 13:
-            if "T-card" not in self._game.inventory:
-                print("Robarts is locked! You need a T-card!")
-                can_enter = False
-        if next_id == 15:
-            if "Dorm Key" not in self._game.inventory:
-                print("Oak House is locked! You need a Dorm Key!")
-                can_enter = False
-        if can_enter:
-            self._game.current_location_id = next_id
-            self._game.moves = self._game.moves + 1
-            return self._game.get_location()
-        return current_location
+        try:
+            self.generate_events(commands, current_location)
+        finally:
+            self._sink.flush()
 
     def generate_events(self, commands: list[str], current_location: Location) -> None:
         """
         Generate events in this simulation, based on current_location and commands, a valid list of commands.
 
+        No more events are generated once the game is won or lost, which is checked after every command and
+        every step of a "go to" route, exactly where play checks it. The check only reads the won and lost flags
+        the game keeps up to date as items are deposited and the player moves, so it takes constant time.
+
         Preconditions:
         - len(commands) > 0
         - all commands in the given list are valid commands when starting from current_location
@@ -169,17 +250,26 @@ class AdventureGameSimulation:
 
         # Hint: current_location.available_commands[command] will return the next location ID
         # which executing <command> while in <current_location_id> leads to
-        for command in commands:
-            if "pick up " in command:
-                self._pick_up(command, current_location)
-            elif "drop " in command:
-                self._drop(command, current_location)
-            elif "deposit " in command:
-                self._deposit(command, current_location)
-            elif "go " in command:
-                current_location = self._go(command, current_location)
-            event = Event(current_location.id_num, current_location.long_description)
-            self._events.add_event(event, command)
+        game = self._game
+        for text in commands:
+            if game.won or game.lost:
+                return
+            route = _carry_out(game, self._events, self._sink, text, current_location)
+            current_location = game.get_location()
+
+            # A "go to" command is followed by each go command of the shortest walk to the named location,
+            # with an event recorded for every step
+            for step in route:
+                if game.won or game.lost:
+                    return
+                _carry_out(game, self._events, self._sink, step, current_location)
+                current_location = game.get_location()
+
+    def get_game(self) -> AdventureGame:
+        """
+        Return the game this simulation was played on, in its state after the last command.
+        """
+        return self._game
 
     def get_id_log(self) -> list[int]:
         """
@@ -194,17 +284,153 @@ class AdventureGameSimulation:
         """
         Run the game simulation and log location descriptions.
         """
-        # Note: We have completed this method for you. Do NOT modify it for A1.
+        if not self._sink.enabled:
+            return
+        previous_event = None
+
+        for current_event in self._events:
+            # Each event's command is shown once we know another event follows it
+            if previous_event is not None:
+                self._sink.say("You choose:", previous_event.next_command)
+            self._sink.say(current_event.description)
+            previous_event = current_event
+        self._sink.flush()
+
 
-        current_event = self._events.first  # Start from the first event in the list
+# Why a SimulationStream stopped before its commands ran out
+WON = "won"
+LOST = "lost"
+STOPPED = "stopped"
 
-        while current_event:
-            print(current_event.description)
-            if current_event is not self._events.last:
-                print("You choose:", current_event.next_command)
 
-            # Move to the next event in the linked list
-            current_event = current_event.next
+class _EventFeed:
+    """An event log that keeps each event only until it is taken, for SimulationStream.
+
+    Instance Attributes:
+        - journal: Always None; a feed is never journaled
+    """
+    journal: None
+    # Private Instance Attributes:
+    #   - _pending: each event added and not yet taken, with the command that reached it, in order
+    _pending: deque[tuple[Optional[str], Event]]
+
+    def __init__(self) -> None:
+        """Initialize a new feed with no events."""
+        self.journal = None
+        self._pending = deque()
+
+    def is_empty(self) -> bool:
+        """Return whether no event is waiting to be taken."""
+        return not self._pending
+
+    def add_event(self, event: Event, command: Optional[str] = None) -> None:
+        """Add the given new event, which the given command reached, for the next take."""
+        self._pending.append((command, event))
+
+    def take(self) -> Iterator[tuple[Optional[str], Event]]:
+        """Return an iterator that takes each waiting event, with the command that reached it, in order."""
+        pending = self._pending
+        while pending:
+            yield pending.popleft()
+
+
+class SimulationStream:
+    """A simulation that reads its commands from any iterable, such as a file, a socket or a generator, only
+    as it needs them, and yields each event as it happens.
+
+    Iterating over a stream carries out one command at a time, exactly as AdventureGameSimulation does, and yields
+    a (command, event) pair for each event the command adds, where command is the command that reached the event,
+    or None for the first event. No event is kept once it has been yielded, so a stream takes the same memory
+    however many commands it reads. Its events are new Event objects whose next_command, next and prev
+    attributes are always None. A stream can only be iterated over once.
+
+    For example, the commands of a bot writing one command per line to standard input are simulated with
+
+        for command, event in SimulationStream(game_data_file, 1, (line.strip() for line in sys.stdin)):
+            ...
+
+    The steps of a "go to" command's route are carried out one at a time, each only once the event of the step
+    before it has been yielded, so the game is always in the state of the last event yielded. The stream stops
+    early, with outcome set to why, once the game is won or lost, or once until, called with the game and each
+    event as it is yielded, returns True.
+
+    Instance Attributes:
+        - outcome: WON, LOST or STOPPED if the stream stopped before its commands ran out, and None otherwise
+    """
+    outcome: Optional[str]
+    # Private Instance Attributes:
+    #   - _commands: the commands not read yet
+    #   - _game: the game the commands are simulated in
+    #   - _sink: where everything the simulation shows the player goes
+    #   - _until: the predicate that stops the stream, or None
+    _commands: Iterator[str]
+    _game: AdventureGame
+    _sink: OutputSink
+    _until: Optional[Callable[[AdventureGame, Event], bool]]
+
+    def __init__(self, game_data_file: str, initial_location_id: int, commands: Iterable[str],
+                 world: Optional[GameWorld] = None, sink: Optional[OutputSink] = None,
+                 game: Optional[AdventureGame] = None,
+                 until: Optional[Callable[[AdventureGame, Event], bool]] = None) -> None:
+        """
+        Initialize a new stream of the events of a simulation of the given commands, which are only read as the
+        stream is iterated over. world, sink and game are as for AdventureGameSimulation.
+
+        Preconditions:
+        - all commands in the given iterable are valid commands when starting from the location at
+          initial_location_id (or the current location of game, if it is given)
+        """
+        self._commands = iter(commands)
+        if game is None:
+            game = AdventureGame(game_data_file, initial_location_id, world)
+        self._game = game
+        self._sink = StdoutSink() if sink is None else sink
+        self._until = until
+        self.outcome = None
+
+    def get_game(self) -> AdventureGame:
+        """
+        Return the game this stream is simulated on, in its state at the last event yielded so far.
+        """
+        return self._game
+
+    def __iter__(self) -> Iterator[tuple[Optional[str], Event]]:
+        """Carry out the commands one at a time, yielding each event as it happens, until the commands run out
+        or the stream stops early."""
+        game = self._game
+        feed = _EventFeed()
+        location = game.get_location()
+        feed.add_event(Event(location.id_num, location.long_description))
+        if (yield from self._take(feed)):
+            return
+
+        for text in self._commands:
+            route = _carry_out(game, feed, self._sink, text, game.get_location())
+            self._sink.flush()
+            if (yield from self._take(feed)):
+                return
+            for step in route:
+                _carry_out(game, feed, self._sink, step, game.get_location())
+                self._sink.flush()
+                if (yield from self._take(feed)):
+                    return
+
+    def _take(self, feed: _EventFeed) -> Generator[tuple[Optional[str], Event], None, bool]:
+        """Yield each event waiting in feed, then return whether the stream stops there, setting outcome to why
+        if it does."""
+        game = self._game
+        for command, event in feed.take():
+            yield command, event
+            if self._until is not None and self._until(game, event):
+                self.outcome = STOPPED
+                return True
+        if is_won(game):
+            self.outcome = WON
+            return True
+        if is_lost(game):
+            self.outcome = LOST
+            return True
+        return False
 
 
 if __name__ == "__main__":
@@ -217,38 +443,7 @@ if __name__ == "__main__":
         'disable': ['R1705', 'E9998', 'E9999', 'static_type_checker']
     })
 
-    win_walkthrough = [
-        "go south",
-        "go south",
-        "go east",
-        "go east",
-        "go east",
-        "go north",
-        "go north",
-        "pick up lucky mug",
-        "pick up t-card",
-        "go south",
-        "go south",
-        "go west",
-        "go west",
-        "go south",
-        "drop lucky mug",
-        "go west",
-        "pick up dorm key",
-        "go east",
-        "drop t-card",
-        "pick up lucky mug",
-        "go east",
-        "deposit lucky mug",
-        "go north",
-        "pick up laptop charger",
-        "go south",
-        "deposit laptop charger",
-        "go north",
-        "pick up usb drive",
-        "go south",
-        "deposit usb drive"
-    ]  # Create a list of all the commands needed to walk through your game to win it
+    win_walkthrough = WIN_WALKTHROUGH  # Create a list of all the commands needed to walk through your game to win it
     expected_log = [1, 5, 9, 10, 11, 12, 8, 4, 4, 4, 8, 12, 11, 10, 14, 14, 13, 13, 14, 14, 14, 15, 15,
                     11, 11, 15, 15, 11, 11, 15, 15]
     # Update this log list to include the IDs of all locations that would be visited
@@ -257,58 +452,7 @@ if __name__ == "__main__":
     assert expected_log == sim.get_id_log()
 
     # Create a list of all the commands needed to walk through your game to reach a 'game over' state
-    lose_demo = [
-        "go south",
-        "go north",
-        "go south",
-        "go north",
-        "go south",
-        "go north",
-        "go south",
-        "go north",
-        "go south",
-        "go north",
-        "go south",
-        "go north",
-        "go south",
-        "go north",
-        "go south",
-        "go north",
-        "go south",
-        "go north",
-        "go south",
-        "go north",
-        "go south",
-        "go north",
-        "go south",
-        "go north",
-        "go south",
-        "go north",
-        "go south",
-        "go north",
-        "go south",
-        "go north",
-        "go south",
-        "go north",
-        "go south",
-        "go north",
-        "go south",
-        "go north",
-        "go south",
-        "go north",
-        "go south",
-        "go north",
-        "go south",
-        "go north",
-        "go south",
-        "go north",
-        "go south",
-        "go north",
-        "go south",
-        "go north",
-        "go south",
-        "go north"
-    ]
+    lose_demo = LOSE_DEMO
     expected_log = [1, 5, 1, 5, 1, 5, 1, 5, 1, 5, 1, 5, 1, 5, 1, 5, 1, 5, 1, 5, 1, 5, 1, 5, 1, 5, 1, 5, 1, 5,
                     1, 5, 1, 5, 1, 5, 1, 5, 1, 5, 1, 5, 1, 5, 1, 5, 1, 5, 1, 5, 1]
     # Update this log list to include the IDs of all locations that would be visited
@@ -316,42 +460,12 @@ if __name__ == "__main__":
     sim = AdventureGameSimulation('project1/game_data.json', 1, lose_demo)
     assert expected_log == sim.get_id_log()
 
-    inventory_demo = [
-        "go south",
-        "go south",
-        "go east",
-        "go east",
-        "pick up usb drive",
-        "inventory"
-    ]
+    inventory_demo = INVENTORY_DEMO
     expected_log = [1, 5, 9, 10, 11, 11, 11]
     sim = AdventureGameSimulation('project1/game_data.json', 1, inventory_demo)
     assert expected_log == sim.get_id_log()
 
-    scores_demo = [
-        "go south",
-        "go south",
-        "go east",
-        "go east",
-        "go east",
-        "go north",
-        "go north",
-        "pick up lucky mug",
-        "pick up t-card",
-        "go south",
-        "go south",
-        "go west",
-        "go west",
-        "go south",
-        "drop lucky mug",
-        "go west",
-        "pick up dorm key",
-        "go east",
-        "drop t-card",
-        "pick up lucky mug",
-        "go east",
-        "deposit lucky mug"
-    ]
+    scores_demo = SCORES_DEMO
     expected_log = [1, 5, 9, 10, 11, 12, 8, 4, 4, 4, 8, 12, 11, 10, 14, 14, 13, 13, 14, 14, 14, 15, 15]
     sim = AdventureGameSimulation('project1/game_data.json', 1, scores_demo)
     assert expected_log == sim.get_id_log()
@@ -359,59 +473,13 @@ if __name__ == "__main__":
     # Add more enhancement_demos if you have more enhancements
     # Showing the differences between drop and deposit (drop is just dropping the item,
     # while deposit is for the item to earn a score)
-    enhancement1_demo = [
-        "go south",
-        "go south",
-        "go east",
-        "go east",
-        "go east",
-        "go north",
-        "go north",
-        "pick up lucky mug",
-        "pick up t-card",
-        "go south",
-        "go south",
-        "go west",
-        "go west",
-        "go south",
-        "drop lucky mug",
-        "go west",
-        "pick up dorm key",
-        "go east",
-        "drop t-card",
-        "pick up lucky mug",
-        "go east",
-        "deposit lucky mug"
-    ]
+    enhancement1_demo = ENHANCEMENT1_DEMO
     expected_log = [1, 5, 9, 10, 11, 12, 8, 4, 4, 4, 8, 12, 11, 10, 14, 14, 13, 13, 14, 14, 14, 15, 15]
     sim = AdventureGameSimulation('project1/game_data.json', 1, enhancement1_demo)
     assert expected_log == sim.get_id_log()
 
     # Enhancement2: Showing the locked and unlocked (only at the oak house and robarts library)
-    enhancement2_demo = [
-        "go south",
-        "go south",
-        "go east",
-        "go east",
-        "go east",
-        "go north",
-        "go north",
-        "pick up lucky mug",
-        "pick up t-card",
-        "go south",
-        "go south",
-        "go south",
-        "go west",
-        "go north",
-        "go west",
-        "go west",
-        "go south",
-        "drop lucky mug",
-        "go west",
-        "pick up dorm key",
-        "go east",
-        "go east"
-    ]
+    enhancement2_demo = ENHANCEMENT2_DEMO
     expected_log = [1, 5, 9, 10, 11, 12, 8, 4, 4, 4, 8, 12, 16, 16, 12, 11, 10, 14, 14, 13, 13, 14, 15]
     sim = AdventureGameSimulation('project1/game_data.json', 1, enhancement2_demo)
     assert expected_log == sim.get_id_log()
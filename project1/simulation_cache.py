@@ -0,0 +1,232 @@
+"""CSC111 Project 1: Text Adventure Game - Simulation Cache
+
+Instructions (READ THIS FIRST!)
+===============================
+
+This Python module contains a cache for Project 1 that simulates many command scripts
+sharing long prefixes (like the walkthroughs and demos in simulation.py) without
+replaying each one from the start. It is imported and used by the `batch_runner` module.
+
+The cache is a trie of the scripts it has simulated, one node per command. Each node
+keeps the location ids of the events its command added, and every checkpoint_interval
+commands (and at the end of every script) a snapshot of the game's state after the
+command (see game_snapshot.py). A new script is resumed from the snapshot of its longest
+prefix that has one, and only the rest of it is simulated, adding new nodes to the trie.
+
+The trie's estimated size is kept under a memory cap by evicting its least recently used
+nodes. Every node is used whenever a script passes through it, and its ancestors are
+always counted as used after it, so the least recently used node is always a leaf and
+evicting it never cuts another script's path short.
+
+Copyright and Usage Information
+===============================
+
+This file is provided solely for the personal and private use of students
+taking CSC111 at the University of Toronto St. George campus. All forms of
+distribution of this code, whether as given or with any changes, are
+expressly prohibited. For more information on copyright for CSC111 materials,
+please consult our Course Syllabus.
+
+This file is Copyright (c) 2026 CSC111 Teaching Team
+"""
+from __future__ import annotations
+from collections import OrderedDict
+from typing import Optional
+
+from adventure import AdventureGame
+from event_logger import CompactEventList
+from game_world import GameWorld
+from output_sink import NullSink
+from simulation import AdventureGameSimulation
+
+# The estimated memory, in bytes, that one trie node takes besides its snapshot and location ids
+NODE_OVERHEAD = 400
+
+# The default memory cap of a cache, in bytes
+DEFAULT_MAX_BYTES = 64 * 2 ** 20
+
+# The default number of commands between two snapshots along a script. Taking a snapshot costs a few times as much
+# as simulating a command, so taking one after every command would make simulating new scripts much slower.
+DEFAULT_CHECKPOINT_INTERVAL = 16
+
+
+class _Node:
+    """A node of a simulation cache's trie: the last command of a script prefix.
+
+    Instance Attributes:
+        - parent: the node of the prefix without this command, or None for the root, which stands for no commands
+        - command: the command this node adds to its parent's prefix
+        - children: a mapping from each command simulated after this prefix to its node
+        - ids: the location ids of the events this node's command added
+        - snapshot: the snapshot of the game's state after this prefix, or None if there is none
+        - size: the estimated memory this node takes, in bytes
+
+    Representation Invariants:
+        - self.parent is None or self.parent.children[self.command] is self
+    """
+    parent: Optional[_Node]
+    command: str
+    children: dict[str, _Node]
+    ids: tuple[int, ...]
+    snapshot: Optional[bytes]
+    size: int
+
+    def __init__(self, parent: Optional[_Node], command: str) -> None:
+        """Initialize a new node, without location ids or a snapshot, for the given command after parent."""
+        self.parent = parent
+        self.command = command
+        self.children = {}
+        self.ids = ()
+        self.snapshot = None
+        self.size = NODE_OVERHEAD
+
+
+class SimulationCache:
+    """A cache of simulated games, keyed by the commands they were simulated with, which resumes each new script
+    from its longest cached prefix.
+
+    Instance Attributes:
+        - max_bytes: the memory cap of the cache, in bytes, which its estimated size is kept under
+        - checkpoint_interval: the number of commands between two snapshots along a script
+        - size: the estimated memory the cache takes, in bytes
+        - commands_simulated: the number of commands simulated so far
+        - commands_reused: the number of commands not simulated again so far, thanks to a cached snapshot
+        - evictions: the number of nodes evicted so far
+
+    Representation Invariants:
+        - self.max_bytes >= 0
+        - self.checkpoint_interval >= 1
+    """
+    max_bytes: int
+    checkpoint_interval: int
+    size: int
+    commands_simulated: int
+    commands_reused: int
+    evictions: int
+    # Private Instance Attributes:
+    #   - _game_data_file: the game data file the scripts are simulated with
+    #   - _initial_location_id: the id of the location every script starts at
+    #   - _world: the world every script is simulated in
+    #   - _root: the root of the trie
+    #   - _recency: every node of the trie but the root, from least to most recently used
+    _game_data_file: str
+    _initial_location_id: int
+    _world: GameWorld
+    _root: _Node
+    _recency: OrderedDict[_Node, None]
+
+    def __init__(self, game_data_file: str, initial_location_id: int, world: Optional[GameWorld] = None,
+                 max_bytes: int = DEFAULT_MAX_BYTES, checkpoint_interval: int = DEFAULT_CHECKPOINT_INTERVAL) -> None:
+        """Initialize a new empty cache of scripts simulated with the given game data from initial_location_id, in
+        the given world (by default, loaded from game_data_file)."""
+        self._game_data_file = game_data_file
+        self._initial_location_id = initial_location_id
+        self._world = GameWorld.load(game_data_file) if world is None else world
+        self._root = _Node(None, "")
+        self._recency = OrderedDict()
+        self.max_bytes = max_bytes
+        self.checkpoint_interval = checkpoint_interval
+        self.size = 0
+        self.commands_simulated = 0
+        self.commands_reused = 0
+        self.evictions = 0
+
+    def simulate(self, commands: list[str]) -> tuple[list[int], AdventureGame]:
+        """Return the id log of a simulation of the given commands, and its game in its state after the last
+        command, simulating only the commands after the longest prefix of commands with a cached snapshot.
+
+        Preconditions:
+            - len(commands) > 0
+            - all commands in the given list are valid commands when starting from the initial location
+        """
+        # The nodes of the longest cached prefix, and the length of the longest prefix with a snapshot
+        path = [self._root]
+        resume_at = 0
+        for command in commands:
+            node = path[-1].children.get(command)
+            if node is None:
+                break
+            path.append(node)
+            if node.snapshot is not None:
+                resume_at = len(path) - 1
+
+        game = AdventureGame(self._game_data_file, self._initial_location_id, self._world)
+        if resume_at > 0:
+            game.restore(path[resume_at].snapshot)
+        if resume_at < len(commands):
+            self._simulate_rest(game, commands, resume_at, path)
+        self.commands_reused += resume_at
+
+        id_log = [self._initial_location_id]
+        for node in path[1:]:
+            id_log.extend(node.ids)
+
+        # Using the path from its end back to the root keeps every node more recently used than its descendants
+        recency = self._recency
+        for node in reversed(path[1:]):
+            if node in recency:
+                recency.move_to_end(node)
+            else:
+                recency[node] = None
+        self._evict()
+        return id_log, game
+
+    def _simulate_rest(self, game: AdventureGame, commands: list[str], start: int, path: list[_Node]) -> None:
+        """Simulate the commands from index start onwards in game, whose state is the one after the commands
+        before start, extending path, the nodes of the cached prefix of commands, to the nodes of all of them.
+
+        Preconditions:
+            - 0 <= start < len(commands)
+            - len(path) > start
+        """
+        events = CompactEventList()
+        sim = AdventureGameSimulation(self._game_data_file, self._initial_location_id, commands[start:start + 1],
+                                      events=events, sink=NullSink(), game=game)
+        # For each new node, the index in the event log of the first and last (exclusive) events its command added
+        new_nodes = []
+        end = 1
+        for depth in range(start + 1, len(commands) + 1):
+            if depth > start + 1:
+                sim.generate_events(commands[depth - 1:depth], game.get_location())
+            begin, end = end, len(events)
+
+            if depth < len(path):
+                node = path[depth]
+            else:
+                node = _Node(path[-1], commands[depth - 1])
+                node.parent.children[node.command] = node
+                path.append(node)
+                self.size += node.size
+                new_nodes.append((node, begin, end))
+            if node.snapshot is None and (depth % self.checkpoint_interval == 0 or depth == len(commands)):
+                node.snapshot = game.snapshot()
+                node.size += len(node.snapshot)
+                self.size += len(node.snapshot)
+        self.commands_simulated += len(commands) - start
+
+        id_log = events.get_id_log()
+        for node, begin, end in new_nodes:
+            node.ids = tuple(id_log[begin:end])
+            node.size += 8 * len(node.ids)
+            self.size += 8 * len(node.ids)
+
+    def _evict(self) -> None:
+        """Evict the least recently used nodes until the estimated size of the cache is within its memory cap."""
+        recency = self._recency
+        while self.size > self.max_bytes and recency:
+            node = recency.popitem(last=False)[0]
+            del node.parent.children[node.command]
+            self.size -= node.size
+            self.evictions += 1
+
+
+if __name__ == "__main__":
+    pass
+    # When you are ready to check your work with python_ta, uncomment the following lines.
+    # (Delete the "#" and space before each line.)
+    # IMPORTANT: keep this code indented inside the "if __name__ == '__main__'" block
+    # import python_ta
+    # python_ta.check_all(config={
+    #     'max-line-length': 120,
+    #     'disable': ['R1705', 'E9998', 'E9999', 'static_type_checker']
+    # })
@@ -0,0 +1,547 @@
+"""CSC111 Project 1: Text Adventure Game - Walkthrough Solver
+
+Instructions (READ THIS FIRST!)
+===============================
+
+This Python module contains a solver for Project 1 that finds a shortest winning walkthrough
+for a game world, so we can check that the game can still be won within the move limit after
+game_data.json changes. Run it from the repository root, for example:
+
+    python project1/solver.py
+
+The solver runs an A* search over game states. A state is the player's location together with
+the position of every item that matters: the items that have to be deposited to win and the
+keys that unlock locations. Each of those items is on the ground somewhere, in the inventory,
+or deposited. A state is packed into a single int, so states are hashed and deduplicated cheaply.
+
+Walking is not searched one go command at a time. Items can only be picked up, dropped or
+deposited at a few "points of interest": the starting location, where the tracked items start,
+the deposit location, and the locked locations and the locations leading into them. One step of
+the search either walks straight to another point of interest along a shortest path for the keys
+in hand, or handles an item where the player stands. The size of the search therefore depends on
+the number of items and points of interest, not on the number of locations, which only affects
+the breadth-first searches that find the walks.
+
+The rules the solver follows are the ones AdventureGameSimulation plays by: some locations can
+only be entered while holding their key, some items cannot be dropped at some locations, the
+player can carry at most two items, and items are deposited at Oak House.
+
+Copyright and Usage Information
+===============================
+
+This file is provided solely for the personal and private use of students
+taking CSC111 at the University of Toronto St. George campus. All forms of
+distribution of this code, whether as given or with any changes, are
+expressly prohibited. For more information on copyright for CSC111 materials,
+please consult our Course Syllabus.
+
+This file is Copyright (c) 2026 CSC111 Teaching Team
+"""
+from __future__ import annotations
+import heapq
+from collections import deque
+from typing import Optional, Union
+
+from adventure import is_won
+from command_parser import MOVE_VERBS, parse_command
+from game_world import GameWorld
+from output_sink import NullSink
+from simulation import AdventureGameSimulation
+
+_UNREACHABLE = -1
+# The key mask of a player holding every key, used to measure distances with every lock open.
+_ALL_KEYS = -1
+# The most stops the heuristic plans a walk through exactly; the work grows as 2 ** n * n ** 2.
+_MAX_TOUR_STOPS = 8
+
+# One step of the search: an item command, or a walk given as (key mask, source location index,
+# target location index).
+_Step = Union[str, tuple[int, int, int]]
+
+
+class WalkthroughSolver:
+    """A solver that finds winning walkthroughs for one game world.
+
+    The player wins once every goal item has been deposited. A walkthrough is optimal if it makes
+    as few moves (successful go commands) as possible, and, among those, uses as few commands as
+    possible, given that items are only dropped at points of interest. A walkthrough needs to drop an
+    item to make room for another one, which happens where that one is picked up, or to leave a key
+    behind at its lock, so this is rarely a restriction. Passing every location id as drop_locations
+    lifts it, at the cost of a search that grows with the size of the world.
+
+    Instance Attributes:
+        - world: the game world to solve
+        - goal_items: the names of the items that must be deposited to win
+        - states_expanded: the number of states the last call to solve took out of its queue
+
+    Representation Invariants:
+        - all(self.world.get_item(name) is not None for name in self.goal_items)
+        - self.states_expanded >= 0
+    """
+    world: GameWorld
+    goal_items: tuple[str, ...]
+    states_expanded: int
+    # Private Instance Attributes:
+    #   - _deposit_location: the index of the location where items are deposited
+    #   - _carry_limit: the most items the player can hold at once
+    #   - _drop_locations: the ids of the locations where items may be dropped, or None for every point
+    #   - _no_drop: the (item name, location id) pairs of items that cannot be dropped at a location
+    #   - _loc_ids: the id of each location, by location index
+    #   - _loc_indexes: the index of each location, by location id
+    #   - _edges: for each location index, the go commands available there and the index each one leads to
+    #   - _lock_bits: for each location index, the key mask bit needed to enter it, 0 if it is not locked,
+    #                 or _UNREACHABLE if its key is not in the world
+    #   - _tracked: the names of every item packed into a state: the goal items, then the keys
+    #   - _key_items: the index of the tracked item that each key mask bit stands for
+    #   - _key_bits: the key mask bit of each tracked item, or 0 for items that open no lock
+    #   - _pois: the location index of each point of interest, by point index
+    #   - _poi_indexes: the point index of each point of interest, by location index
+    #   - _droppable: for each point index, the indexes of the tracked items that may be dropped there
+    #   - _start_positions: the point index where each tracked item starts, or _UNREACHABLE if it starts nowhere
+    #   - _walks: for each (key mask, location index) pair the search has needed, the fewest moves from
+    #             that location to every location index holding exactly those keys, and the
+    #             (previous location index, go command) step into each location on a shortest walk
+    #   - _tours: the _tour_length of every (point index, stops) pair the search has needed
+    _deposit_location: int
+    _carry_limit: int
+    _drop_locations: Optional[set[int]]
+    _no_drop: frozenset[tuple[str, int]]
+    _loc_ids: list[int]
+    _loc_indexes: dict[int, int]
+    _edges: list[list[tuple[str, int]]]
+    _lock_bits: list[int]
+    _tracked: list[str]
+    _key_items: dict[int, int]
+    _key_bits: list[int]
+    _pois: list[int]
+    _poi_indexes: dict[int, int]
+    _droppable: list[frozenset[int]]
+    _start_positions: list[int]
+    _walks: dict[tuple[int, int], tuple[list[int], list[Optional[tuple[int, str]]]]]
+    _tours: dict[tuple[int, tuple[int, ...]], int]
+
+    def __init__(self, world: GameWorld, goal_items: Optional[list[str]] = None,
+                 deposit_location: Optional[int] = None, carry_limit: Optional[int] = None,
+                 locks: Optional[dict[int, str]] = None,
+                 no_drop: Optional[frozenset[tuple[str, int]]] = None,
+                 drop_locations: Optional[set[int]] = None) -> None:
+        """Initialize a new solver for the given world.
+
+        By default deposit_location, carry_limit, locks, no_drop and the goal items (its objectives) are those of the
+        world's rules. locks maps a location id to the name
+        of the item needed to enter it, and no_drop holds (item name, location id) pairs. If
+        drop_locations is given, items may be dropped at those locations and nowhere else.
+
+        Preconditions:
+            - deposit_location is None or deposit_location in world.locations
+            - carry_limit is None or carry_limit >= 1
+            - goal_items is None or all(world.get_item(name) is not None for name in goal_items)
+            - drop_locations is None or all(loc_id in world.locations for loc_id in drop_locations)
+        """
+        if deposit_location is None:
+            deposit_location = world.rules.deposit_location
+        if carry_limit is None:
+            carry_limit = world.rules.carry_limit
+        if locks is None:
+            locks = world.rules.locks
+        if no_drop is None:
+            no_drop = world.rules.no_drop
+        if goal_items is None:
+            goal_items = world.rules.objectives
+
+        self.world = world
+        self.goal_items = tuple(goal_items)
+        self.states_expanded = 0
+        self._carry_limit = carry_limit
+        self._drop_locations = drop_locations
+        self._no_drop = no_drop
+        self._walks = {}
+        self._tours = {}
+
+        self._loc_ids = list(world.locations)
+        self._loc_indexes = {loc_id: index for index, loc_id in enumerate(self._loc_ids)}
+        self._deposit_location = self._loc_indexes[deposit_location]
+
+        self._edges = []
+        for loc_id in self._loc_ids:
+            edges = []
+            for command, next_id in world.locations[loc_id].available_commands.items():
+                if parse_command(command).verb in MOVE_VERBS and next_id in self._loc_indexes:
+                    edges.append((command, self._loc_indexes[next_id]))
+            self._edges.append(edges)
+
+        self._tracked = list(self.goal_items)
+        for key in locks.values():
+            if key not in self._tracked and world.get_item(key) is not None:
+                self._tracked.append(key)
+        item_indexes = {name: index for index, name in enumerate(self._tracked)}
+
+        self._key_items = {}
+        self._key_bits = [0] * len(self._tracked)
+        self._lock_bits = [0] * len(self._loc_ids)
+        for loc_id, key in locks.items():
+            if loc_id not in self._loc_indexes:
+                continue
+            if key not in item_indexes:
+                self._lock_bits[self._loc_indexes[loc_id]] = _UNREACHABLE
+                continue
+            index = item_indexes[key]
+            if self._key_bits[index] == 0:
+                self._key_bits[index] = 1 << len(self._key_items)
+                self._key_items[self._key_bits[index]] = index
+            self._lock_bits[self._loc_indexes[loc_id]] = self._key_bits[index]
+
+        self._pois = []
+        self._poi_indexes = {}
+        self._droppable = []
+        self._add_poi(self._deposit_location)
+        for index, edges in enumerate(self._edges):
+            for _, next_index in edges:
+                if self._lock_bits[next_index] != 0:
+                    self._add_poi(index)
+                    self._add_poi(next_index)
+        if drop_locations is not None:
+            for loc_id in drop_locations:
+                self._add_poi(self._loc_indexes[loc_id])
+
+        self._start_positions = [_UNREACHABLE] * len(self._tracked)
+        for loc_id in self._loc_ids:
+            for name in world.locations[loc_id].items:
+                if name in item_indexes and self._start_positions[item_indexes[name]] == _UNREACHABLE:
+                    self._start_positions[item_indexes[name]] = self._add_poi(self._loc_indexes[loc_id])
+
+    def _add_poi(self, loc: int) -> int:
+        """Make the location with index loc a point of interest, if it is not one already, and return its
+        point index."""
+        poi = self._poi_indexes.get(loc)
+        if poi is None:
+            poi = len(self._pois)
+            self._pois.append(loc)
+            self._poi_indexes[loc] = poi
+            loc_id = self._loc_ids[loc]
+            if self._drop_locations is not None and loc_id not in self._drop_locations:
+                self._droppable.append(frozenset())
+            else:
+                self._droppable.append(frozenset(index for index, name in enumerate(self._tracked)
+                                                 if (name, loc_id) not in self._no_drop))
+        return poi
+
+    def _walk(self, key_mask: int, source: int) -> tuple[list[int], list[Optional[tuple[int, str]]]]:
+        """Return the fewest moves from the location with index source to every location index while holding
+        the keys in key_mask (or _UNREACHABLE), and the step into each location on a shortest walk,
+        computing them the first time they are needed."""
+        walk = self._walks.get((key_mask, source))
+        if walk is not None:
+            return walk
+
+        distances = [_UNREACHABLE] * len(self._loc_ids)
+        steps: list[Optional[tuple[int, str]]] = [None] * len(self._loc_ids)
+        distances[source] = 0
+        queue = deque([source])
+        while queue:
+            index = queue.popleft()
+            for command, next_index in self._edges[index]:
+                if distances[next_index] != _UNREACHABLE:
+                    continue
+                lock = self._lock_bits[next_index]
+                if lock == 0 or (lock != _UNREACHABLE and key_mask & lock):
+                    distances[next_index] = distances[index] + 1
+                    steps[next_index] = (index, command)
+                    queue.append(next_index)
+
+        walk = (distances, steps)
+        self._walks[(key_mask, source)] = walk
+        return walk
+
+    def _tour_length(self, poi: int, stops: tuple[int, ...]) -> int:
+        """Return the fewest moves of a walk that starts at point index poi, visits every point index in stops
+        in some order and ends at the deposit location, with every lock open, or _UNREACHABLE if there is none.
+
+        The walk is found with the Held-Karp dynamic program over subsets of stops.
+
+        Preconditions:
+            - stops is sorted and has no duplicates
+            - len(stops) <= _MAX_TOUR_STOPS
+        """
+        length = self._tours.get((poi, stops))
+        if length is not None:
+            return length
+
+        num_stops = len(stops)
+        infinity = len(self._loc_ids) * (num_stops + 1) + 1
+        from_poi = self._walk(_ALL_KEYS, self._pois[poi])[0]
+        from_stops = [self._walk(_ALL_KEYS, self._pois[stop])[0] for stop in stops]
+
+        def moves(distances: list[int], loc: int) -> int:
+            """Return distances[loc], or infinity if it is _UNREACHABLE."""
+            return infinity if distances[loc] == _UNREACHABLE else distances[loc]
+
+        if num_stops == 0:
+            length = moves(from_poi, self._deposit_location)
+        else:
+            # best[mask][j] is the shortest walk from poi through exactly the stops in mask, ending at stops[j]
+            best = [[infinity] * num_stops for _ in range(1 << num_stops)]
+            for j in range(num_stops):
+                best[1 << j][j] = moves(from_poi, self._pois[stops[j]])
+            for mask in range(1, 1 << num_stops):
+                for j in range(num_stops):
+                    if best[mask][j] >= infinity or not mask & (1 << j):
+                        continue
+                    for k in range(num_stops):
+                        if not mask & (1 << k):
+                            candidate = best[mask][j] + moves(from_stops[j], self._pois[stops[k]])
+                            best[mask | (1 << k)][k] = min(best[mask | (1 << k)][k], candidate)
+            full = (1 << num_stops) - 1
+            length = min(best[full][j] + moves(from_stops[j], self._deposit_location) for j in range(num_stops))
+
+        if length >= infinity:
+            length = _UNREACHABLE
+        self._tours[(poi, stops)] = length
+        return length
+
+    def _heuristic(self, poi: int, positions: list[int], key_mask: int) -> Optional[tuple[int, int]]:
+        """Return a lower bound on the moves and commands still needed to win from the given state, where the
+        player holds the keys in key_mask, or None if the game can no longer be won.
+
+        Every goal item on the ground has to be visited, and so does the key of every locked location the
+        player still has to enter, before the player ends at the deposit location. The move bound is the
+        shortest such walk with every lock open; with more than _MAX_TOUR_STOPS stops it is the longest trip
+        that a single goal item still has to make instead. The command bound adds a pick up for every item
+        to visit and a deposit for every undeposited goal item.
+        """
+        held = len(self._pois)
+        deposited = held + 1
+        stops = set()
+        item_commands = 0
+        for index in range(len(self.goal_items)):
+            position = positions[index]
+            if position == _UNREACHABLE:
+                return None
+            elif position == held:
+                item_commands += 1
+            elif position != deposited:
+                stops.add(position)
+                item_commands += 2
+        if item_commands == 0:
+            return 0, 0
+
+        deposit_poi = self._poi_indexes[self._deposit_location]
+        to_enter = [stop for stop in stops if stop != poi]
+        if stops or poi != deposit_poi:
+            to_enter.append(deposit_poi)
+        entered = set()
+        while to_enter:
+            point = to_enter.pop()
+            if point in entered:
+                continue
+            entered.add(point)
+            lock = self._lock_bits[self._pois[point]]
+            if lock == _UNREACHABLE:
+                return None
+            if lock == 0 or key_mask & lock:
+                continue
+            key_position = positions[self._key_items[lock]]
+            if key_position == _UNREACHABLE or key_position == deposited:
+                return None
+            if key_position not in stops:
+                stops.add(key_position)
+                item_commands += 1
+                if key_position != poi:
+                    to_enter.append(key_position)
+
+        if len(stops) <= _MAX_TOUR_STOPS:
+            moves = self._tour_length(poi, tuple(sorted(stops)))
+        else:
+            from_poi = self._walk(_ALL_KEYS, self._pois[poi])[0]
+            moves = 0
+            for stop in stops:
+                to_deposit = self._walk(_ALL_KEYS, self._pois[stop])[0][self._deposit_location]
+                if from_poi[self._pois[stop]] == _UNREACHABLE or to_deposit == _UNREACHABLE:
+                    return None
+                moves = max(moves, from_poi[self._pois[stop]] + to_deposit)
+        if moves == _UNREACHABLE:
+            return None
+        return moves, moves + item_commands
+
+    def _encode(self, poi: int, positions: list[int]) -> int:
+        """Return the int that packs the given point index and item positions into one state.
+
+        Positions run from _UNREACHABLE to len(self._pois) + 1 (deposited), so each is stored shifted up by one.
+        """
+        radix = len(self._pois) + 3
+        packed = 0
+        for position in reversed(positions):
+            packed = packed * radix + position + 1
+        return packed * len(self._pois) + poi
+
+    def _decode(self, state: int) -> tuple[int, list[int]]:
+        """Return the point index and item positions packed into the given state."""
+        radix = len(self._pois) + 3
+        packed, poi = divmod(state, len(self._pois))
+        positions = []
+        for _ in self._tracked:
+            packed, position = divmod(packed, radix)
+            positions.append(position - 1)
+        return poi, positions
+
+    def solve(self, initial_location_id: int, max_moves: Optional[int] = None) -> Optional[list[str]]:
+        """Return an optimal winning walkthrough for a new game starting at initial_location_id, as a list
+        of commands AdventureGameSimulation accepts, or None if the game cannot be won (within max_moves
+        moves, if max_moves is not None).
+
+        Preconditions:
+            - initial_location_id in self.world.locations
+            - max_moves is None or max_moves >= 0
+        """
+        self.states_expanded = 0
+        poi = self._add_poi(self._loc_indexes[initial_location_id])
+        num_pois = len(self._pois)
+        held = num_pois
+        deposited = num_pois + 1
+        num_goals = len(self.goal_items)
+
+        positions = list(self._start_positions)
+        estimate = self._heuristic(poi, positions, 0)
+        if estimate is None or (max_moves is not None and estimate[0] > max_moves):
+            return None
+
+        start = self._encode(poi, positions)
+        best_costs = {start: (0, 0)}
+        parents: dict[int, tuple[int, _Step]] = {}
+        # Entries are (estimated total moves, estimated total commands, -moves, -commands, state), so among
+        # states that look equally good the one furthest along is expanded first
+        queue = [(estimate[0], estimate[1], 0, 0, start)]
+
+        while queue:
+            _, _, negative_moves, negative_commands, state = heapq.heappop(queue)
+            moves, commands = -negative_moves, -negative_commands
+            if best_costs[state] != (moves, commands):
+                continue  # A cheaper way to this state was found after this entry was queued
+            self.states_expanded += 1
+            poi, positions = self._decode(state)
+            if all(positions[index] == deposited for index in range(num_goals)):
+                return self._walkthrough(parents, start, state)
+
+            key_mask = 0
+            for index, position in enumerate(positions):
+                if position == held:
+                    key_mask |= self._key_bits[index]
+
+            # Each successor is (point index, positions, key mask, step, moves, commands)
+            successors = []
+            distances = self._walk(key_mask, self._pois[poi])[0]
+            for next_poi, loc in enumerate(self._pois):
+                if next_poi != poi and distances[loc] != _UNREACHABLE:
+                    successors.append((next_poi, positions, key_mask, (key_mask, self._pois[poi], loc),
+                                       distances[loc], distances[loc]))
+
+            num_held = positions.count(held)
+            at_deposit = self._pois[poi] == self._deposit_location
+            for index, position in enumerate(positions):
+                if position == poi and num_held < self._carry_limit:
+                    successors.append((poi, positions[:index] + [held] + positions[index + 1:],
+                                       key_mask | self._key_bits[index],
+                                       'pick up ' + self._tracked[index].lower(), 0, 1))
+                elif position == held:
+                    if index in self._droppable[poi]:
+                        successors.append((poi, positions[:index] + [poi] + positions[index + 1:],
+                                           key_mask & ~self._key_bits[index],
+                                           'drop ' + self._tracked[index].lower(), 0, 1))
+                    if at_deposit:
+                        successors.append((poi, positions[:index] + [deposited] + positions[index + 1:],
+                                           key_mask & ~self._key_bits[index],
+                                           'deposit ' + self._tracked[index].lower(), 0, 1))
+
+            for next_poi, next_positions, next_mask, step, step_moves, step_commands in successors:
+                next_state = self._encode(next_poi, next_positions)
+                next_costs = (moves + step_moves, commands + step_commands)
+                old_costs = best_costs.get(next_state)
+                if old_costs is not None and old_costs <= next_costs:
+                    continue
+                estimate = self._heuristic(next_poi, next_positions, next_mask)
+                if estimate is None or (max_moves is not None and next_costs[0] + estimate[0] > max_moves):
+                    continue
+                best_costs[next_state] = next_costs
+                parents[next_state] = (state, step)
+                heapq.heappush(queue, (next_costs[0] + estimate[0], next_costs[1] + estimate[1],
+                                       -next_costs[0], -next_costs[1], next_state))
+        return None
+
+    def _walkthrough(self, parents: dict[int, tuple[int, _Step]], start: int, goal: int) -> list[str]:
+        """Return the commands that lead from the start state to the goal state, following parents."""
+        steps = []
+        state = goal
+        while state != start:
+            state, step = parents[state]
+            steps.append(step)
+
+        commands = []
+        for step in reversed(steps):
+            if isinstance(step, str):
+                commands.append(step)
+            else:
+                key_mask, source, loc = step
+                walk_steps = self._walk(key_mask, source)[1]
+                go_commands = []
+                while loc != source:
+                    loc, command = walk_steps[loc]
+                    go_commands.append(command)
+                commands.extend(reversed(go_commands))
+        return commands
+
+
+def moves_allowed(world: GameWorld) -> Optional[int]:
+    """Return the most moves a winning walkthrough of world can make, or None if its rules have no move limit.
+
+    The game is lost as soon as the moves reach the move limit, before the player can make the deposit that would
+    win it, so a winning walkthrough has to make fewer moves than that.
+    """
+    move_limit = world.rules.move_limit
+    return None if move_limit is None else move_limit - 1
+
+
+def solve(game_data_file: str, initial_location_id: int, max_moves: Optional[int] = None) -> Optional[list[str]]:
+    """Return an optimal winning walkthrough under the rules of the game stored in game_data_file, starting at
+    initial_location_id, or None if it cannot be won within max_moves moves (by default, moves_allowed).
+
+    Preconditions:
+        - game_data_file is the filename of a valid game data JSON file
+        - initial_location_id is the id of a location in that file
+    """
+    world = GameWorld.load(game_data_file)
+    if max_moves is None:
+        max_moves = moves_allowed(world)
+    walkthrough = WalkthroughSolver(world).solve(initial_location_id, max_moves)
+    if walkthrough is not None:
+        game = AdventureGameSimulation(game_data_file, initial_location_id, walkthrough, world,
+                                       sink=NullSink()).get_game()
+        assert is_won(game), "The solver's walkthrough does not win the game"
+    return walkthrough
+
+
+if __name__ == "__main__":
+    # When you are ready to check your work with python_ta, uncomment the following lines.
+    # (Delete the "#" and space before each line.)
+    # IMPORTANT: keep this code indented inside the "if __name__ == '__main__'" block
+    # import python_ta
+    # python_ta.check_all(config={
+    #     'max-line-length': 120,
+    #     'disable': ['R1705', 'E9998', 'E9999', 'static_type_checker']
+    # })
+    stock_world = GameWorld.load('project1/game_data.json')
+    solver = WalkthroughSolver(stock_world)
+    walkthrough = solver.solve(1, max_moves=moves_allowed(stock_world))
+    assert walkthrough is not None, "The game can no longer be won within its move limit"
+
+    sim = AdventureGameSimulation('project1/game_data.json', 1, walkthrough, stock_world, sink=NullSink())
+    game = sim.get_game()
+    assert is_won(game)
+
+    # Searching every drop location must not find anything shorter in the stock world
+    exhaustive = WalkthroughSolver(stock_world, drop_locations=set(stock_world.locations)).solve(1)
+    assert exhaustive is not None and len(exhaustive) == len(walkthrough)
+
+    print("Optimal walkthrough:", game.moves, "moves,", len(walkthrough), "commands,",
+          solver.states_expanded, "states expanded")
+    for step in walkthrough:
+        print(" ", step)
@@ -0,0 +1,338 @@
+"""CSC111 Project 1: Text Adventure Game - World Generator
+
+Instructions (READ THIS FIRST!)
+===============================
+
+This Python module contains code for Project 1 that generates large game worlds for
+scale testing. Each world is written to a game data file in the same format as
+game_data.json, together with a command script that wins it. Run it from the repository
+root, for example:
+
+    python project1/world_generator.py grid 100000 project1/grid_100k.json
+
+writes a 100,000-location grid world to project1/grid_100k.json, writes its winning script
+to project1/grid_100k.script, one command per line, and checks the script with
+AdventureGameSimulation. The topology can be grid, tree or random, and an optional fourth
+argument sets the random seed, so the same arguments always generate the same files.
+
+Every world plays by the stock game's rules, except that it has no move limit, since its
+winning script is far longer than the stock game's. Location 1 is the start, Robarts Library
+(location 13) needs the T-card and Oak House (location 15) needs the Dorm Key, which is
+found in Robarts Library. The five stock items are spread over the world together with
+many souvenirs that score nothing. Locations are written one at a time, so even
+1,000,000-location worlds are generated without holding the whole file in memory.
+
+Copyright and Usage Information
+===============================
+
+This file is provided solely for the personal and private use of students
+taking CSC111 at the University of Toronto St. George campus. All forms of
+distribution of this code, whether as given or with any changes, are
+expressly prohibited. For more information on copyright for CSC111 materials,
+please consult our Course Syllabus.
+
+This file is Copyright (c) 2026 CSC111 Teaching Team
+"""
+from __future__ import annotations
+import json
+import random
+import sys
+from array import array
+from collections import deque
+from typing import Callable, Optional
+
+from adventure import is_won
+from game_rules import DEFAULT_RULES
+from output_sink import NullSink
+from simulation import AdventureGameSimulation
+
+TOPOLOGIES = ('grid', 'tree', 'random')
+
+# Every generated world plays by the stock game's rules without their move limit, which are written into its game
+# data file
+DEPOSIT_LOCATION = DEFAULT_RULES.deposit_location
+LOCKS = DEFAULT_RULES.locks
+RULES_DATA = dict(DEFAULT_RULES.to_data(), move_limit=None)
+
+# The stock game's items, as (name, description, target position, target points)
+STOCK_ITEMS = [
+    ('USB Drive', 'A silver USB drive with all your project files.', DEPOSIT_LOCATION, 50),
+    ('Laptop Charger', 'Your laptop charger. Your battery is almost dead.', DEPOSIT_LOCATION, 75),
+    ('Lucky Mug', 'Your lucky U of T mug.', DEPOSIT_LOCATION, 60),
+    ('T-card', 'Your student ID card. Required to enter Robarts Library.', 13, 0),
+    ('Dorm Key', 'A key to Oak House residence.', DEPOSIT_LOCATION, 0)
+]
+
+# The names of the locations the game's messages refer to by name
+LANDMARKS = {13: 'Robarts Library', DEPOSIT_LOCATION: 'Oak House'}
+
+_SCENERY = [
+    'The hallway smells of burnt coffee.', 'A poster advertises a club fair that ended last week.',
+    'Students are napping on the benches.', 'The lights flicker every few seconds.',
+    'Someone left a half-finished problem set on the floor.', 'A squirrel watches you suspiciously.'
+]
+
+# A function from a location id to the (go command, location id) pairs of its exits
+Neighbours = Callable[[int], list[tuple[str, int]]]
+
+
+def _grid_neighbours(num_locations: int) -> Neighbours:
+    """Return the exits of a roughly square grid of num_locations locations numbered row by row from 1,
+    each joined to its neighbours by go north, go south, go west and go east."""
+    width = max(int(num_locations ** 0.5), 4)
+
+    def neighbours(loc_id: int) -> list[tuple[str, int]]:
+        """Return the exits of the location with id loc_id."""
+        row, column = divmod(loc_id - 1, width)
+        exits = []
+        if row > 0:
+            exits.append(('go north', loc_id - width))
+        if loc_id + width <= num_locations:
+            exits.append(('go south', loc_id + width))
+        if column > 0:
+            exits.append(('go west', loc_id - 1))
+        if column < width - 1 and loc_id < num_locations:
+            exits.append(('go east', loc_id + 1))
+        return exits
+
+    return neighbours
+
+
+def _spanning_tree(num_locations: int, rng: random.Random) -> list[tuple[int, int]]:
+    """Return the edges of a random tree over locations 1 to num_locations, where each location is joined to
+    one location with a smaller id.
+
+    The locations before Oak House are joined to locations before Robarts Library, so Oak House and
+    everything before it can be reached without entering Robarts Library.
+    """
+    edges = []
+    for loc_id in range(2, num_locations + 1):
+        highest_parent = min(loc_id - 1, 12) if loc_id <= DEPOSIT_LOCATION else loc_id - 1
+        edges.append((rng.randint(1, highest_parent), loc_id))
+    return edges
+
+
+def _edge_neighbours(num_locations: int, edges: list[tuple[int, int]]) -> Neighbours:
+    """Return the exits of the locations 1 to num_locations joined both ways by the given edges.
+
+    A location's exits are named go path 1, go path 2, and so on. They are stored in flat arrays
+    indexed by location id, so a million-location world costs a few bytes per exit.
+    """
+    starts = array('i', [0]) * (num_locations + 2)
+    for u, v in edges:
+        starts[u + 1] += 1
+        starts[v + 1] += 1
+    for loc_id in range(1, num_locations + 2):
+        starts[loc_id] += starts[loc_id - 1]
+    targets = array('i', [0]) * starts[num_locations + 1]
+    filled = array('i', starts)
+    for u, v in edges:
+        targets[filled[u]] = v
+        filled[u] += 1
+        targets[filled[v]] = u
+        filled[v] += 1
+
+    def neighbours(loc_id: int) -> list[tuple[str, int]]:
+        """Return the exits of the location with id loc_id."""
+        return [(f'go path {k}', targets[i]) for k, i in enumerate(range(starts[loc_id], starts[loc_id + 1]), 1)]
+
+    return neighbours
+
+
+def _neighbours(topology: str, num_locations: int, rng: random.Random) -> Neighbours:
+    """Return the exits of a world of num_locations locations with the given topology.
+
+    A tree world is a random tree. A random world is a random tree with half as many edges again added
+    between random locations.
+    """
+    if topology == 'grid':
+        return _grid_neighbours(num_locations)
+    edges = _spanning_tree(num_locations, rng)
+    if topology == 'random':
+        for _ in range(num_locations // 2):
+            u, v = rng.randint(1, num_locations), rng.randint(1, num_locations)
+            if u != v:
+                edges.append((u, v))
+    return _edge_neighbours(num_locations, edges)
+
+
+def _search(neighbours: Neighbours, num_locations: int, source: int, locked: set[int],
+            target: Optional[int] = None) -> array:
+    """Return the parent of every location in a breadth-first search from source that never enters a location
+    in locked, or 0 for locations it did not reach. The search stops early once it reaches target.
+    """
+    parents = array('i', [0]) * (num_locations + 1)
+    parents[source] = source
+    queue = deque([source])
+    while queue:
+        loc_id = queue.popleft()
+        if loc_id == target:
+            break
+        for _, next_id in neighbours(loc_id):
+            if parents[next_id] == 0 and next_id not in locked:
+                parents[next_id] = loc_id
+                queue.append(next_id)
+    return parents
+
+
+def _path(neighbours: Neighbours, num_locations: int, source: int, target: int, locked: set[int]) -> list[str]:
+    """Return the go commands of a shortest walk from source to target that never enters a location in locked.
+
+    Raise ValueError if there is no such walk.
+    """
+    parents = _search(neighbours, num_locations, source, locked, target)
+    if parents[target] == 0:
+        raise ValueError(f'location {target} cannot be reached from location {source}')
+    commands = []
+    loc_id = target
+    while loc_id != source:
+        parent = parents[loc_id]
+        commands.append(next(command for command, next_id in neighbours(parent) if next_id == loc_id))
+        loc_id = parent
+    commands.reverse()
+    return commands
+
+
+def _place_items(neighbours: Neighbours, num_locations: int, num_souvenirs: int,
+                 rng: random.Random) -> dict[str, int]:
+    """Return the start position of each stock item and souvenir.
+
+    Everything but the Dorm Key, which is in Robarts Library, starts somewhere that can be reached from
+    location 1 without entering a locked location.
+    """
+    parents = _search(neighbours, num_locations, 1, set(LOCKS))
+    open_locations = [loc_id for loc_id in range(1, num_locations + 1) if parents[loc_id] != 0]
+    positions = {name: rng.choice(open_locations) for name, _, _, _ in STOCK_ITEMS}
+    positions['Dorm Key'] = 13
+    for k in range(1, num_souvenirs + 1):
+        positions[f'Souvenir {k}'] = rng.choice(open_locations)
+    return positions
+
+
+def _winning_script(neighbours: Neighbours, num_locations: int, positions: dict[str, int]) -> list[str]:
+    """Return a command script that wins the world with the given exits and item positions from location 1.
+
+    The script fetches the T-card, takes the Dorm Key from Robarts Library, drops the T-card just outside,
+    and then carries each item worth points to Oak House one at a time.
+    """
+    script = _path(neighbours, num_locations, 1, positions['T-card'], set(LOCKS))
+    script.append('pick up t-card')
+    to_robarts = _path(neighbours, num_locations, positions['T-card'], 13, {DEPOSIT_LOCATION})
+    script.extend(to_robarts)
+    script.append('pick up dorm key')
+
+    # Leave Robarts Library the way the script came in, since everything left to do is reachable from there
+    location = positions['T-card']
+    for command in to_robarts[:-1]:
+        location = dict(neighbours(location))[command]
+    script.append(next(command for command, next_id in neighbours(13) if next_id == location))
+    script.append('drop t-card')
+
+    for name, _, target, points in STOCK_ITEMS:
+        if target == DEPOSIT_LOCATION and points > 0:
+            script.extend(_path(neighbours, num_locations, location, positions[name], {13}))
+            script.append('pick up ' + name.lower())
+            script.extend(_path(neighbours, num_locations, positions[name], DEPOSIT_LOCATION, {13}))
+            script.append('deposit ' + name.lower())
+            location = DEPOSIT_LOCATION
+    return script
+
+
+def _location_record(loc_id: int, exits: list[tuple[str, int]], items: list[str], rng: random.Random) -> dict:
+    """Return the game data record of the location with id loc_id, with the given exits and items."""
+    name = LANDMARKS.get(loc_id, f'Room {loc_id}')
+    commands = dict(exits)
+    if loc_id == DEPOSIT_LOCATION:
+        for item_name, _, target, points in STOCK_ITEMS:
+            if target == DEPOSIT_LOCATION and points > 0:
+                commands['deposit ' + item_name.lower()] = loc_id
+
+    directions = ', '.join(command[3:] for command, _ in exits)
+    return {
+        'id': loc_id, 'name': name,
+        'brief_description': f'LOCATION {loc_id} - You are at {name}.\n',
+        'long_description': f'LOCATION {loc_id} - {name}\n\nYou are at {name}. {rng.choice(_SCENERY)}\n\n'
+                            f'You can go {directions}.\n',
+        'available_commands': commands, 'items': items, 'visited': False
+    }
+
+
+def generate_world(filename: str, num_locations: int, topology: str = 'grid', num_souvenirs: Optional[int] = None,
+                   seed: int = 111) -> list[str]:
+    """Write a generated world of num_locations locations with the given topology to the game data file with the
+    given name, and return a command script that wins it starting from location 1.
+
+    The world holds the stock items and num_souvenirs souvenirs worth no points (by default, one for every
+    hundred locations). The same arguments always generate the same world and script.
+
+    Preconditions:
+        - num_locations >= 16
+        - topology in TOPOLOGIES
+        - num_souvenirs is None or num_souvenirs >= 0
+    """
+    rng = random.Random(seed)
+    if num_souvenirs is None:
+        num_souvenirs = num_locations // 100
+    neighbours = _neighbours(topology, num_locations, rng)
+    positions = _place_items(neighbours, num_locations, num_souvenirs, rng)
+    script = _winning_script(neighbours, num_locations, positions)
+
+    items_at = {}
+    for name, loc_id in positions.items():
+        items_at.setdefault(loc_id, []).append(name)
+
+    with open(filename, 'w') as f:
+        f.write('{\n  "locations": [\n')
+        for loc_id in range(1, num_locations + 1):
+            record = _location_record(loc_id, neighbours(loc_id), items_at.get(loc_id, []), rng)
+            f.write('    ' + json.dumps(record) + (',\n' if loc_id < num_locations else '\n'))
+        f.write('  ],\n  "items": [\n')
+
+        items = [(name, description, target, points) for name, description, target, points in STOCK_ITEMS]
+        # A souvenir scores nothing anywhere, so its target is just where it starts
+        items.extend((f'Souvenir {k}', 'A souvenir from somewhere on campus.', positions[f'Souvenir {k}'], 0)
+                     for k in range(1, num_souvenirs + 1))
+        for i, (name, description, target, points) in enumerate(items):
+            record = {'name': name, 'description': description, 'start_position': positions[name],
+                      'target_position': target, 'target_points': points}
+            f.write('    ' + json.dumps(record) + (',\n' if i < len(items) - 1 else '\n'))
+        f.write('  ],\n  "rules": ' + json.dumps(RULES_DATA) + '\n}\n')
+    return script
+
+
+def save_script(filename: str, script: list[str]) -> None:
+    """Save the given command script to the file with the given name, one command per line."""
+    with open(filename, 'w') as f:
+        f.writelines(command + '\n' for command in script)
+
+
+def load_script(filename: str) -> list[str]:
+    """Return the command script saved in the file with the given name by save_script."""
+    with open(filename) as f:
+        return [line.rstrip('\n') for line in f]
+
+
+def check_world(game_data_file: str, script: list[str]) -> bool:
+    """Return whether simulating the given script from location 1 of the given game data file wins the game."""
+    return is_won(AdventureGameSimulation(game_data_file, 1, script, sink=NullSink()).get_game())
+
+
+if __name__ == "__main__":
+    # When you are ready to check your work with python_ta, uncomment the following lines.
+    # (Delete the "#" and space before each line.)
+    # IMPORTANT: keep this code indented inside the "if __name__ == '__main__'" block
+    # import python_ta
+    # python_ta.check_all(config={
+    #     'max-line-length': 120,
+    #     'disable': ['R1705', 'E9998', 'E9999', 'static_type_checker']
+    # })
+
+    world_topology, size, world_file = sys.argv[1], int(sys.argv[2]), sys.argv[3]
+    world_seed = int(sys.argv[4]) if len(sys.argv) > 4 else 111
+    script_file = world_file.rsplit('.', 1)[0] + '.script'
+    winning_script = generate_world(world_file, size, world_topology, seed=world_seed)
+    save_script(script_file, winning_script)
+    print("Wrote", size, world_topology, "locations to", world_file, "and a", len(winning_script),
+          "command winning script to", script_file)
+    assert check_world(world_file, winning_script)
+    print("Checked: the script wins")